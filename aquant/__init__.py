@@ -1,3 +1,19 @@
-from .main import Aquant
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .main import Aquant
 
 __all__ = ["Aquant"]
+
+
+def __getattr__(name: str):
+    # Imported on first access so `import aquant` stays cheap.
+    if name == "Aquant":
+        from .main import Aquant
+
+        return Aquant
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
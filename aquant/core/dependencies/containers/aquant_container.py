@@ -7,17 +7,65 @@ from aquant.core.dependencies.containers.open_high_low_close_volume_container im
 )
 from aquant.core.dependencies.containers.security_container import SecurityContainer
 from aquant.core.dependencies.containers.trade_container import TradeContainer
+from aquant.core.dependencies.providers import (
+    create_logger_provider,
+    create_metrics_provider,
+    init_decode_executor,
+    init_nats_client,
+)
 
 
 class AquantContainer(containers.DeclarativeContainer):
     """
     Main Dependency Injection Container for Aquant SDK.
+
+    A single NATS connection is opened here and shared by every domain
+    container; NATS multiplexes concurrent requests over it. The decode
+    executor that keeps large decodes off the event loop and the metrics
+    recorder are shared as well.
     """
 
     config = providers.Configuration()
 
-    marketdata = providers.Container(MarketdataContainer, config=config)
-    trade = providers.Container(TradeContainer, config=config)
-    broker = providers.Container(BrokerContainer, config=config)
-    security = providers.Container(SecurityContainer, config=config)
+    logger = providers.Singleton(create_logger_provider, name="NatsClient")
+
+    nats_client = providers.Resource(
+        init_nats_client,
+        logger=logger,
+        servers=config.nats_servers,
+        user=config.nats_user,
+        password=config.nats_password,
+        adaptive_deadlines=config.nats_adaptive_deadlines,
+        hedge_requests=config.nats_hedge_requests,
+        lazy_connect=config.nats_lazy_connect,
+    )
+
+    metrics = providers.Singleton(create_metrics_provider, sinks=config.metrics_sinks)
+
+    decode_executor = providers.Resource(
+        init_decode_executor,
+        kind=config.decode_executor,
+        threshold_bytes=config.decode_threshold_bytes,
+    )
+
+    marketdata = providers.Container(
+        MarketdataContainer, config=config, metrics=metrics
+    )
+    trade = providers.Container(
+        TradeContainer,
+        config=config,
+        nats_client=nats_client,
+        decode_executor=decode_executor,
+        metrics=metrics,
+    )
+    broker = providers.Container(
+        BrokerContainer, config=config, nats_client=nats_client, metrics=metrics
+    )
+    security = providers.Container(
+        SecurityContainer,
+        config=config,
+        nats_client=nats_client,
+        decode_executor=decode_executor,
+        metrics=metrics,
+    )
     open_high_low_close_volume = providers.Container(OpenHighLowClosedVolumeContainer)
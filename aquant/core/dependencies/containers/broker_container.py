@@ -1,7 +1,14 @@
 from dependency_injector import containers, providers
 
-from aquant.core.dependencies.providers import create_logger_provider, init_nats_client
-from aquant.domains.broker.service import BrokerService
+from aquant.core.dependencies.providers import create_logger_provider
+from aquant.core.metrics import Metrics
+from aquant.core.utils import SingleFlight
+from aquant.domains.broker.service import (
+    BrokerDirectoryService,
+    BrokerFlowService,
+    BrokerService,
+)
+from aquant.infra.nats import NatsClient
 
 
 class BrokerContainer(containers.DeclarativeContainer):
@@ -13,12 +20,19 @@ class BrokerContainer(containers.DeclarativeContainer):
 
     logger = providers.Singleton(create_logger_provider, name="BrokerService")
 
-    nats_client = providers.Resource(
-        init_nats_client,
-        logger=logger,
-        servers=config.nats_servers,
-        user=config.nats_user,
-        password=config.nats_password,
+    nats_client = providers.Dependency(instance_of=NatsClient)
+    metrics = providers.Dependency(instance_of=Metrics)
+
+    single_flight = providers.Singleton(SingleFlight)
+
+    broker_service = providers.Factory(
+        BrokerService, logger, nats_client, single_flight, metrics
     )
 
-    broker_service = providers.Factory(BrokerService, logger, nats_client)
+    broker_directory_service = providers.Singleton(
+        BrokerDirectoryService, logger, broker_service
+    )
+
+    broker_flow_service = providers.Factory(
+        BrokerFlowService, logger, broker_directory_service
+    )
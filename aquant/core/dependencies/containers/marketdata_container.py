@@ -1,6 +1,7 @@
 from dependency_injector import containers, providers
 
 from aquant.core.dependencies.providers import create_logger_provider, init_redis_client
+from aquant.core.metrics import Metrics
 from aquant.domains.marketdata.repository import MarketdataRepository
 from aquant.domains.marketdata.service import MarketdataService
 from aquant.infra.redis import BufferedMessageProcessor
@@ -15,6 +16,7 @@ class MarketdataContainer(containers.DeclarativeContainer):
 
     logger = providers.Singleton(create_logger_provider, name="Marketdata")
     processor = providers.Singleton(BufferedMessageProcessor)
+    metrics = providers.Dependency(instance_of=Metrics)
 
     redis_client = providers.Resource(
         init_redis_client,
@@ -28,6 +30,7 @@ class MarketdataContainer(containers.DeclarativeContainer):
         redis_client=redis_client,
         processor=processor,
         logger=logger,
+        metrics=metrics,
     )
 
     marketdata_service = providers.Factory(
@@ -1,7 +1,10 @@
 from dependency_injector import containers, providers
 
 from aquant.core.dependencies.providers import create_logger_provider
-from aquant.domains.trade.service import TradeOHLCVCalcService
+from aquant.domains.trade.service import (
+    TradeOHLCVCalcService,
+    TradeOHLCVResampleService,
+)
 
 
 class OpenHighLowClosedVolumeContainer(containers.DeclarativeContainer):
@@ -16,3 +19,7 @@ class OpenHighLowClosedVolumeContainer(containers.DeclarativeContainer):
     open_high_low_close_volume_service = providers.Factory(
         TradeOHLCVCalcService, logger
     )
+
+    open_high_low_close_volume_resample_service = providers.Factory(
+        TradeOHLCVResampleService, logger
+    )
@@ -1,7 +1,11 @@
 from dependency_injector import containers, providers
 
-from aquant.core.dependencies.providers import create_logger_provider, init_nats_client
-from aquant.domains.security.service import SecurityService
+from aquant.core.dependencies.providers import create_logger_provider
+from aquant.core.executors import DecodeExecutor
+from aquant.core.metrics import Metrics
+from aquant.core.utils import SingleFlight
+from aquant.domains.security.service import SecurityMasterService, SecurityService
+from aquant.infra.nats import NatsClient
 
 
 class SecurityContainer(containers.DeclarativeContainer):
@@ -13,12 +17,21 @@ class SecurityContainer(containers.DeclarativeContainer):
 
     logger = providers.Singleton(create_logger_provider, name="SecurityService")
 
-    nats_client = providers.Resource(
-        init_nats_client,
-        logger=logger,
-        servers=config.nats_servers,
-        user=config.nats_user,
-        password=config.nats_password,
+    nats_client = providers.Dependency(instance_of=NatsClient)
+    decode_executor = providers.Dependency(instance_of=DecodeExecutor)
+    metrics = providers.Dependency(instance_of=Metrics)
+
+    single_flight = providers.Singleton(SingleFlight)
+
+    security_service = providers.Factory(
+        SecurityService, logger, nats_client, single_flight, decode_executor, metrics
     )
 
-    security_service = providers.Factory(SecurityService, logger, nats_client)
+    security_master_service = providers.Singleton(
+        SecurityMasterService,
+        logger,
+        security_service,
+        ttl=config.security_cache_ttl,
+        batch_requests=config.security_batch_requests,
+        snapshot_path=config.security_snapshot_path,
+    )
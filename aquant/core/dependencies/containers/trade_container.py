@@ -1,6 +1,12 @@
 from dependency_injector import containers, providers
 
-from aquant.core.dependencies.providers import create_logger_provider, init_nats_client
+from aquant.core.dependencies.providers import (
+    create_logger_provider,
+    init_trade_parallel_decoder,
+)
+from aquant.core.executors import DecodeExecutor
+from aquant.core.metrics import Metrics
+from aquant.core.utils import SingleFlight
 from aquant.domains.trade.codecs import (
     OpenHighLowCloseVolumeBinaryCodec,
     TradeBinaryCodec,
@@ -8,7 +14,12 @@ from aquant.domains.trade.codecs import (
     TradeParserService,
     TradePayloadBuilderService,
 )
-from aquant.domains.trade.service import TradeService
+from aquant.domains.trade.service import (
+    TradeOHLCVCacheService,
+    TradeService,
+    TradeStreamService,
+)
+from aquant.infra.nats import NatsClient
 
 
 class TradeContainer(containers.DeclarativeContainer):
@@ -20,16 +31,19 @@ class TradeContainer(containers.DeclarativeContainer):
 
     logger = providers.Singleton(create_logger_provider, name="TradeService")
 
-    nats_client = providers.Resource(
-        init_nats_client,
-        logger=logger,
-        servers=config.nats_servers,
-        user=config.nats_user,
-        password=config.nats_password,
-    )
+    nats_client = providers.Dependency(instance_of=NatsClient)
+    decode_executor = providers.Dependency(instance_of=DecodeExecutor)
+    metrics = providers.Dependency(instance_of=Metrics)
+    single_flight = providers.Singleton(SingleFlight)
     trade_binary_codec = providers.Singleton(TradeBinaryCodec, logger)
     trade_request_codec = providers.Singleton(TradeBinaryRequestCodec, logger)
     ohlcv_binary_codec = providers.Singleton(OpenHighLowCloseVolumeBinaryCodec, logger)
+    trade_parallel_decoder = providers.Resource(
+        init_trade_parallel_decoder,
+        logger,
+        trade_binary_codec,
+        max_workers=config.parallel_decode_workers,
+    )
 
     trade_payload_builder_service = providers.Factory(
         TradePayloadBuilderService, logger
@@ -40,6 +54,7 @@ class TradeContainer(containers.DeclarativeContainer):
         trade_codec=trade_binary_codec,
         trade_request_codec=trade_request_codec,
         ohlcv_codec=ohlcv_binary_codec,
+        parallel_decoder=trade_parallel_decoder,
     )
 
     trade_service = providers.Factory(
@@ -48,4 +63,20 @@ class TradeContainer(containers.DeclarativeContainer):
         nats_client,
         trade_payload_builder_service,
         trade_parser_service,
+        single_flight,
+        decode_executor,
+        metrics,
+    )
+
+    trade_ohlcv_cache_service = providers.Singleton(
+        TradeOHLCVCacheService,
+        logger,
+        trade_service,
+    )
+
+    trade_stream_service = providers.Factory(
+        TradeStreamService,
+        logger,
+        nats_client,
+        trade_binary_codec,
     )
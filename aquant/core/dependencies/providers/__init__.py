@@ -1,5 +1,15 @@
 from .create_logger_provider import create_logger_provider
+from .create_metrics_provider import create_metrics_provider
+from .init_decode_executor import init_decode_executor
 from .init_nats_client import init_nats_client
 from .init_redis_client import init_redis_client
+from .init_trade_parallel_decoder import init_trade_parallel_decoder
 
-__all__ = ["create_logger_provider", "init_nats_client", "init_redis_client"]
+__all__ = [
+    "create_logger_provider",
+    "create_metrics_provider",
+    "init_decode_executor",
+    "init_nats_client",
+    "init_redis_client",
+    "init_trade_parallel_decoder",
+]
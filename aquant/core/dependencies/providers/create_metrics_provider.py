@@ -0,0 +1,16 @@
+from aquant.core.metrics import Metrics, MetricsSinkInterface, NullMetrics
+
+
+def create_metrics_provider(sinks: list[MetricsSinkInterface] | None = None) -> Metrics:
+    """
+    Creates the metrics recorder shared by every service.
+
+    Args:
+        sinks(list[MetricsSinkInterface] | None): Where stage records are sent.
+
+    Returns:
+        Metrics: A recording instance, or a NullMetrics when no sink is given.
+    """
+    if not sinks:
+        return NullMetrics()
+    return Metrics(sinks)
@@ -0,0 +1,10 @@
+from aquant.core.executors import DecodeExecutor, ExecutorKindEnum
+
+
+def init_decode_executor(kind=None, threshold_bytes=None):
+    decode_executor = DecodeExecutor(
+        kind=ExecutorKindEnum.THREAD if kind is None else kind,
+        threshold_bytes=1 << 20 if threshold_bytes is None else threshold_bytes,
+    )
+    yield decode_executor
+    decode_executor.shutdown()
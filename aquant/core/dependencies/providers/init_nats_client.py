@@ -1,10 +1,25 @@
 from aquant.infra.nats import NatsClient
 
 
-async def init_nats_client(logger, servers, user, password):
+async def init_nats_client(
+    logger,
+    servers,
+    user,
+    password,
+    adaptive_deadlines=False,
+    hedge_requests=False,
+    lazy_connect=False,
+):
     nats_client = NatsClient(
-        logger=logger, servers=servers, user=user, password=password
+        logger=logger,
+        servers=servers,
+        user=user,
+        password=password,
+        adaptive_deadlines=bool(adaptive_deadlines),
+        hedge_requests=bool(hedge_requests),
+        lazy_connect=bool(lazy_connect),
     )
-    await nats_client.connect()
+    if not nats_client.lazy_connect:
+        await nats_client.connect()
     yield nats_client
     await nats_client.close()
@@ -0,0 +1,13 @@
+from aquant.domains.trade.codecs import TradeParallelDecoder
+
+
+def init_trade_parallel_decoder(logger, trade_codec, max_workers=None):
+    if not max_workers or max_workers < 2:
+        # Parallel decoding is disabled; the parser falls back to the codec.
+        yield None
+        return
+    parallel_decoder = TradeParallelDecoder(
+        logger, trade_codec, max_workers=max_workers
+    )
+    yield parallel_decoder
+    parallel_decoder.shutdown()
@@ -0,0 +1,3 @@
+from .container_registry import ContainerRegistry, container_registry
+
+__all__ = ["ContainerRegistry", "container_registry"]
@@ -0,0 +1,104 @@
+import asyncio
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass, field
+
+from dependency_injector import containers
+
+from aquant.core.utils import maybe_await
+
+
+@dataclass(slots=True)
+class _Session:
+    container: containers.Container
+    loop: asyncio.AbstractEventLoop
+    ready: asyncio.Future
+    refcount: int = field(default=1)
+
+
+class ContainerRegistry:
+    """
+    Process-level registry of initialized containers.
+
+    Aquant instances created with the same connection settings on the same
+    event loop share one container, and therefore one NATS connection and one
+    Redis pool. Containers are reference counted: their resources are shut
+    down when the last instance using them is closed.
+    """
+
+    def __init__(self) -> None:
+        self._sessions: dict[tuple[int, Hashable], _Session] = {}
+
+    async def acquire(
+        self, key: Hashable, factory: Callable[[], containers.Container]
+    ) -> containers.Container:
+        """
+        Returns the initialized container for `key`, creating it with `factory`.
+
+        Raises:
+            Exception: Whatever the resource initialization raised; the failed
+                container is not registered.
+        """
+        loop = asyncio.get_running_loop()
+        self._purge_closed_loops()
+        session_key = (id(loop), key)
+
+        session = self._sessions.get(session_key)
+        if session is not None:
+            session.refcount += 1
+        else:
+            container = factory()
+            session = _Session(
+                container=container,
+                loop=loop,
+                ready=asyncio.ensure_future(self._init(container)),
+            )
+            self._sessions[session_key] = session
+
+        try:
+            await asyncio.shield(session.ready)
+        except BaseException:
+            session.refcount -= 1
+            if self._sessions.get(session_key) is session and (
+                session.ready.done() or session.refcount == 0
+            ):
+                del self._sessions[session_key]
+                if not session.ready.done():
+                    # Every caller gave up while connecting; close once it is up.
+                    session.ready.add_done_callback(
+                        lambda _: asyncio.ensure_future(
+                            self._shutdown(session.container)
+                        )
+                    )
+            raise
+        return session.container
+
+    async def release(self, key: Hashable) -> None:
+        """Drops one reference; the last one shuts the container resources down."""
+        session_key = (id(asyncio.get_running_loop()), key)
+        session = self._sessions.get(session_key)
+        if session is None:
+            return
+        session.refcount -= 1
+        if session.refcount > 0:
+            return
+        del self._sessions[session_key]
+        await self._shutdown(session.container)
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    @staticmethod
+    async def _init(container: containers.Container) -> None:
+        await maybe_await(container.init_resources())
+
+    @staticmethod
+    async def _shutdown(container: containers.Container) -> None:
+        await maybe_await(container.shutdown_resources())
+
+    def _purge_closed_loops(self) -> None:
+        for session_key, session in list(self._sessions.items()):
+            if session.loop.is_closed():
+                del self._sessions[session_key]
+
+
+container_registry = ContainerRegistry()
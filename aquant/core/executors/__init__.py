@@ -0,0 +1,4 @@
+from .decode_executor import DecodeExecutor
+from .executor_kind_enum import ExecutorKindEnum
+
+__all__ = ["DecodeExecutor", "ExecutorKindEnum"]
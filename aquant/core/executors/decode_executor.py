@@ -0,0 +1,72 @@
+import asyncio
+import functools
+import os
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any
+
+from aquant.core.executors.executor_kind_enum import ExecutorKindEnum
+
+
+class DecodeExecutor:
+    """
+    Runs large payload decodes off the event loop.
+
+    Payloads smaller than `threshold_bytes` are decoded inline, where a pool
+    hand-off would cost more than the decode. Larger ones go to a persistent
+    thread or process pool created on first use. NumPy and pandas release the
+    GIL for most of the numeric work, so threads are the cheap default; the
+    process pool also offloads the Python-level string handling, at the cost
+    of pickling the payload and the result (decoders must be picklable).
+    """
+
+    def __init__(
+        self,
+        kind: ExecutorKindEnum = ExecutorKindEnum.THREAD,
+        threshold_bytes: int = 1 << 20,
+        max_workers: int | None = None,
+    ) -> None:
+        self.kind = ExecutorKindEnum(kind)
+        self.threshold_bytes = threshold_bytes
+        self.max_workers = max_workers or min(4, os.cpu_count() or 1)
+        self.offloaded = 0
+        self.inline = 0
+        self._executor: Executor | None = None
+
+    async def run(self, decode: Callable[..., Any], payload: bytes, *args) -> Any:
+        """
+        Returns `decode(payload, *args)`, offloading it when the payload is large.
+
+        Args:
+            decode (Callable[..., Any]): Decoder, e.g. a codec or parser method.
+            payload (bytes): Raw reply.
+            *args: Extra positional arguments for `decode`.
+
+        Returns:
+            Any: The decoded value.
+        """
+        if len(payload) < self.threshold_bytes:
+            self.inline += 1
+            return decode(payload, *args)
+
+        self.offloaded += 1
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._get_executor(), functools.partial(decode, payload, *args)
+        )
+
+    def shutdown(self) -> None:
+        """Stops the pool; a later `run` creates a new one."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.kind is ExecutorKindEnum.PROCESS:
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="aquant-decode"
+                )
+        return self._executor
@@ -0,0 +1,6 @@
+from enum import Enum
+
+
+class ExecutorKindEnum(Enum):
+    THREAD = "thread"
+    PROCESS = "process"
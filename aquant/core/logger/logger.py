@@ -3,7 +3,7 @@ import sys
 
 from aquant.core.logger.logger_formatter import LoggerFormatter
 from aquant.core.logger.logger_interface import LoggerInterface
-from aquant.settings import settings
+from aquant.settings import get_settings
 
 
 class Logger(LoggerInterface):
@@ -19,7 +19,7 @@ class Logger(LoggerInterface):
             name (str): Logger name, typically the module name.
         """
 
-        raw = settings.LOG_LEVEL
+        raw = get_settings().LOG_LEVEL
         if isinstance(raw, str):
             level = getattr(logging, raw.upper(), logging.INFO)
         elif isinstance(raw, int):
@@ -0,0 +1,18 @@
+from .callback_metrics_sink import CallbackMetricsSink
+from .histogram import Histogram
+from .metrics import Metrics, NullMetrics
+from .metrics_sink_interface import MetricsSinkInterface
+from .open_telemetry_metrics_sink import OpenTelemetryMetricsSink
+from .prometheus_metrics_sink import PrometheusMetricsSink
+from .stage_record import StageRecord
+
+__all__ = [
+    "CallbackMetricsSink",
+    "Histogram",
+    "Metrics",
+    "MetricsSinkInterface",
+    "NullMetrics",
+    "OpenTelemetryMetricsSink",
+    "PrometheusMetricsSink",
+    "StageRecord",
+]
@@ -0,0 +1,19 @@
+from collections.abc import Callable
+
+from aquant.core.metrics.metrics_sink_interface import MetricsSinkInterface
+from aquant.core.metrics.stage_record import StageRecord
+
+
+class CallbackMetricsSink(MetricsSinkInterface):
+    """
+    Forwards every StageRecord to a callable.
+
+    The callback runs inline on the calling coroutine, so it should only
+    enqueue or aggregate.
+    """
+
+    def __init__(self, callback: Callable[[StageRecord], None]) -> None:
+        self.callback = callback
+
+    def observe(self, record: StageRecord) -> None:
+        self.callback(record)
@@ -0,0 +1,57 @@
+from bisect import bisect_left
+
+# 10 us .. ~42 s and 64 B .. 16 GiB, doubling per bucket.
+DURATION_BUCKETS = tuple(1e-5 * 2**i for i in range(23))
+BYTES_BUCKETS = tuple(float(2**i) for i in range(6, 35))
+
+
+class Histogram:
+    """
+    Fixed-bucket histogram.
+
+    An observation costs one bisect and three additions, so it is cheap enough
+    for every request. Buckets are upper bounds (Prometheus `le`); values above
+    the last bound fall into an overflow bucket.
+    """
+
+    __slots__ = ("bounds", "counts", "count", "sum")
+
+    def __init__(self, bounds: tuple[float, ...] = DURATION_BUCKETS) -> None:
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q: float) -> float | None:
+        """
+        Estimates the q-quantile (0..1) by linear interpolation inside its bucket.
+
+        Returns None before the first observation.
+        """
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for i, bucket in enumerate(self.counts):
+            if bucket and seen + bucket >= rank:
+                lower = self.bounds[i - 1] if i else 0.0
+                upper = self.bounds[i] if i < len(self.bounds) else self.bounds[-1]
+                return lower + (upper - lower) * (rank - seen) / bucket
+            seen += bucket
+        return self.bounds[-1]
+
+    def cumulative(self) -> list[tuple[float, int]]:
+        """Returns (upper bound, cumulative count) pairs, ending with +inf."""
+        pairs = []
+        total = 0
+        # The overflow bucket is counted in the closing +inf pair.
+        for bound, bucket in zip(self.bounds, self.counts[:-1], strict=True):
+            total += bucket
+            pairs.append((bound, total))
+        pairs.append((float("inf"), self.count))
+        return pairs
@@ -0,0 +1,152 @@
+import time
+from collections.abc import Iterable
+
+from aquant.core.metrics.histogram import BYTES_BUCKETS, DURATION_BUCKETS, Histogram
+from aquant.core.metrics.metrics_sink_interface import MetricsSinkInterface
+from aquant.core.metrics.stage_record import StageRecord
+
+
+class _Stage:
+    __slots__ = (
+        "_metrics",
+        "_operation",
+        "_stage",
+        "_started",
+        "_started_ns",
+        "nbytes",
+    )
+
+    def __init__(self, metrics: "Metrics", operation: str, stage: str) -> None:
+        self._metrics = metrics
+        self._operation = operation
+        self._stage = stage
+        self.nbytes: int | None = None
+
+    def __enter__(self) -> "_Stage":
+        self._started_ns = time.time_ns()
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._metrics.observe(
+            StageRecord(
+                operation=self._operation,
+                stage=self._stage,
+                started_ns=self._started_ns,
+                duration=time.perf_counter() - self._started,
+                nbytes=self.nbytes,
+                error=exc_type is not None,
+            )
+        )
+
+
+class Metrics:
+    """
+    Records per-stage timings and byte counts of SDK calls.
+
+    Services wrap each step of a call in `stage`; the duration lands in a
+    per-(operation, stage) histogram, the byte count (when the stage sets
+    one) in a second one, and every record is forwarded to the configured
+    sinks (callback, Prometheus text, OpenTelemetry spans).
+
+    Example:
+        ```python
+        with self.metrics.stage("get_trades", "request") as stage:
+            response = await self.nats_client.request(subject, message)
+            stage.nbytes = len(response)
+        ```
+    """
+
+    enabled = True
+
+    def __init__(self, sinks: Iterable[MetricsSinkInterface] = ()) -> None:
+        self.sinks = list(sinks)
+        self.histograms: dict[tuple[str, str], Histogram] = {}
+        self.sizes: dict[tuple[str, str], Histogram] = {}
+
+    def stage(self, operation: str, stage: str) -> _Stage:
+        """Returns a context manager timing one stage; set `.nbytes` to record a size."""
+        return _Stage(self, operation, stage)
+
+    def add_sink(self, sink: MetricsSinkInterface) -> None:
+        self.sinks.append(sink)
+
+    def remove_sink(self, sink: MetricsSinkInterface) -> None:
+        self.sinks.remove(sink)
+
+    def observe(self, record: StageRecord) -> None:
+        key = (record.operation, record.stage)
+        histogram = self.histograms.get(key)
+        if histogram is None:
+            histogram = self.histograms[key] = Histogram(DURATION_BUCKETS)
+        histogram.observe(record.duration)
+        if record.nbytes is not None:
+            sizes = self.sizes.get(key)
+            if sizes is None:
+                sizes = self.sizes[key] = Histogram(BYTES_BUCKETS)
+            sizes.observe(record.nbytes)
+        for sink in self.sinks:
+            sink.observe(record)
+
+    def snapshot(self) -> dict[str, dict[str, float]]:
+        """
+        Summarizes the recorded stages.
+
+        Returns:
+            dict[str, dict[str, float]]: {"operation.stage": {"count", "mean_ms",
+            "p50_ms", "p99_ms"}}, with estimated percentiles; stages that
+            record sizes also have "total_bytes", "mean_bytes", "p50_bytes"
+            and "p99_bytes".
+        """
+        summary = {}
+        for (operation, stage), histogram in sorted(self.histograms.items()):
+            stats = {
+                "count": histogram.count,
+                "mean_ms": histogram.sum / histogram.count * 1000,
+                "p50_ms": histogram.quantile(0.5) * 1000,
+                "p99_ms": histogram.quantile(0.99) * 1000,
+            }
+            sizes = self.sizes.get((operation, stage))
+            if sizes is not None:
+                stats["total_bytes"] = sizes.sum
+                stats["mean_bytes"] = sizes.sum / sizes.count
+                stats["p50_bytes"] = sizes.quantile(0.5)
+                stats["p99_bytes"] = sizes.quantile(0.99)
+            summary[f"{operation}.{stage}"] = stats
+        return summary
+
+
+class _NullStage:
+    __slots__ = ("nbytes",)
+
+    def __enter__(self) -> "_NullStage":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        return None
+
+
+_NULL_STAGE = _NullStage()
+
+
+class NullMetrics(Metrics):
+    """
+    Metrics that records nothing; `stage` returns a shared no-op context.
+
+    A sink attached temporarily (e.g. by the profiler) still receives the
+    stages while it is attached, but no histograms are kept.
+    """
+
+    enabled = False
+
+    def __init__(self) -> None:
+        super().__init__()
+
+    def stage(self, operation: str, stage: str) -> _Stage | _NullStage:
+        if self.sinks:
+            return _Stage(self, operation, stage)
+        return _NULL_STAGE
+
+    def observe(self, record: StageRecord) -> None:
+        for sink in self.sinks:
+            sink.observe(record)
@@ -0,0 +1,11 @@
+from abc import ABC, abstractmethod
+
+from aquant.core.metrics.stage_record import StageRecord
+
+
+class MetricsSinkInterface(ABC):
+    """Receives every stage recorded by `Metrics`."""
+
+    @abstractmethod
+    def observe(self, record: StageRecord) -> None:
+        raise NotImplementedError
@@ -0,0 +1,46 @@
+from aquant.core.metrics.metrics_sink_interface import MetricsSinkInterface
+from aquant.core.metrics.stage_record import StageRecord
+
+
+class OpenTelemetryMetricsSink(MetricsSinkInterface):
+    """
+    Emits one OpenTelemetry span per stage.
+
+    Spans carry the stage's real start and end time and the attributes
+    `aquant.operation`, `aquant.stage` and `aquant.bytes`. They are created
+    with the current context, so they nest under the application's active
+    span. Requires the optional `opentelemetry-api` package.
+
+    Args:
+        tracer: Tracer to use. Defaults to `trace.get_tracer("aquant")`.
+
+    Raises:
+        ImportError: If `opentelemetry-api` is not installed.
+    """
+
+    def __init__(self, tracer=None) -> None:
+        try:
+            from opentelemetry import trace
+        except ImportError as e:
+            raise ImportError(
+                "OpenTelemetryMetricsSink requires the 'opentelemetry-api' package."
+            ) from e
+
+        self._status_error = trace.Status(trace.StatusCode.ERROR)
+        self.tracer = tracer or trace.get_tracer("aquant")
+
+    def observe(self, record: StageRecord) -> None:
+        attributes = {
+            "aquant.operation": record.operation,
+            "aquant.stage": record.stage,
+        }
+        if record.nbytes is not None:
+            attributes["aquant.bytes"] = record.nbytes
+        span = self.tracer.start_span(
+            f"{record.operation}.{record.stage}",
+            start_time=record.started_ns,
+            attributes=attributes,
+        )
+        if record.error:
+            span.set_status(self._status_error)
+        span.end(end_time=record.started_ns + int(record.duration * 1e9))
@@ -0,0 +1,79 @@
+from aquant.core.metrics.histogram import BYTES_BUCKETS, DURATION_BUCKETS, Histogram
+from aquant.core.metrics.metrics_sink_interface import MetricsSinkInterface
+from aquant.core.metrics.stage_record import StageRecord
+
+
+class PrometheusMetricsSink(MetricsSinkInterface):
+    """
+    Aggregates stages into histograms rendered in the Prometheus text format.
+
+    Serve `render()` from the application's own /metrics endpoint; no
+    Prometheus client library is needed.
+
+    Example:
+        ```python
+        sink = PrometheusMetricsSink()
+        aquant = await Aquant.create(..., metrics_sinks=[sink])
+        ...
+        print(sink.render())
+        ```
+    """
+
+    def __init__(self, namespace: str = "aquant") -> None:
+        self.namespace = namespace
+        self.durations: dict[tuple[str, str], Histogram] = {}
+        self.sizes: dict[tuple[str, str], Histogram] = {}
+        self.errors: dict[tuple[str, str], int] = {}
+
+    def observe(self, record: StageRecord) -> None:
+        key = (record.operation, record.stage)
+        durations = self.durations.get(key)
+        if durations is None:
+            durations = self.durations[key] = Histogram(DURATION_BUCKETS)
+        durations.observe(record.duration)
+        if record.nbytes is not None:
+            sizes = self.sizes.get(key)
+            if sizes is None:
+                sizes = self.sizes[key] = Histogram(BYTES_BUCKETS)
+            sizes.observe(record.nbytes)
+        if record.error:
+            self.errors[key] = self.errors.get(key, 0) + 1
+
+    def render(self) -> str:
+        """Returns the current histograms in the Prometheus text exposition format."""
+        lines: list[str] = []
+        self._render_histograms(
+            lines,
+            f"{self.namespace}_stage_duration_seconds",
+            "Duration of each SDK call stage.",
+            self.durations,
+        )
+        self._render_histograms(
+            lines,
+            f"{self.namespace}_stage_bytes",
+            "Bytes produced or received by each SDK call stage.",
+            self.sizes,
+        )
+        name = f"{self.namespace}_stage_errors_total"
+        lines.append(f"# HELP {name} Stages that raised.")
+        lines.append(f"# TYPE {name} counter")
+        for (operation, stage), count in sorted(self.errors.items()):
+            lines.append(f'{name}{{operation="{operation}",stage="{stage}"}} {count}')
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _render_histograms(
+        lines: list[str],
+        name: str,
+        description: str,
+        histograms: dict[tuple[str, str], Histogram],
+    ) -> None:
+        lines.append(f"# HELP {name} {description}")
+        lines.append(f"# TYPE {name} histogram")
+        for (operation, stage), histogram in sorted(histograms.items()):
+            labels = f'operation="{operation}",stage="{stage}"'
+            for bound, count in histogram.cumulative():
+                le = "+Inf" if bound == float("inf") else f"{bound:g}"
+                lines.append(f'{name}_bucket{{{labels},le="{le}"}} {count}')
+            lines.append(f"{name}_sum{{{labels}}} {histogram.sum:g}")
+            lines.append(f"{name}_count{{{labels}}} {histogram.count}")
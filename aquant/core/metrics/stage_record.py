@@ -0,0 +1,24 @@
+from dataclasses import dataclass
+
+
+@dataclass(slots=True, frozen=True)
+class StageRecord:
+    """
+    One timed stage of an SDK call, e.g. ("get_trades", "request").
+
+    Attributes:
+        operation (str): The SDK call, e.g. "get_trades".
+        stage (str): The step inside it, e.g. "encode", "request" or "decode".
+        started_ns (int): Wall-clock start, nanoseconds since the epoch.
+        duration (float): Elapsed time in seconds.
+        nbytes (int | None): Bytes handled by the stage (sent, received or
+            decoded), if known.
+        error (bool): True if the stage raised.
+    """
+
+    operation: str
+    stage: str
+    started_ns: int
+    duration: float
+    nbytes: int | None = None
+    error: bool = False
@@ -0,0 +1,4 @@
+from .profile_report import ProfileReport
+from .sdk_profiler import SDKProfiler
+
+__all__ = ["ProfileReport", "SDKProfiler"]
@@ -0,0 +1,76 @@
+import pstats
+from dataclasses import dataclass, field
+from pathlib import Path
+
+
+@dataclass(slots=True)
+class ProfileReport:
+    """
+    What one profiled SDK call did.
+
+    Attributes:
+        name (str): Label of the profiled block.
+        wall_time (float): Elapsed seconds.
+        stats (pstats.Stats | None): cProfile statistics of the event-loop thread.
+        peak_memory_bytes (int | None): Peak memory traced by tracemalloc in the
+            block; None when memory was not traced.
+        allocations (list[dict]): Top allocation sites still alive at the end,
+            as {"site", "size_bytes", "count"}.
+        sdk_allocations (list[dict]): The same memory charged to the innermost
+            SDK source line on each allocation's stack.
+        stages (dict[str, dict[str, float]]): Time per SDK stage
+            ("operation.stage" -> {"count", "total_ms"}), from the metrics hooks.
+        files (list[Path]): Files written for this call.
+    """
+
+    name: str
+    wall_time: float = 0.0
+    stats: pstats.Stats | None = None
+    peak_memory_bytes: int | None = None
+    allocations: list[dict] = field(default_factory=list)
+    sdk_allocations: list[dict] = field(default_factory=list)
+    stages: dict[str, dict[str, float]] = field(default_factory=dict)
+    files: list[Path] = field(default_factory=list)
+
+    def summary(self, top: int = 15) -> str:
+        """Returns a plain-text report: stages, allocations and hottest functions."""
+        memory = (
+            "memory not traced"
+            if self.peak_memory_bytes is None
+            else f"peak traced memory {self.peak_memory_bytes / 2**20:.1f} MiB"
+        )
+        lines = [
+            f"profile {self.name}: {self.wall_time * 1000:.1f} ms, {memory}",
+            "",
+            "stages:",
+        ]
+        for stage, totals in sorted(
+            self.stages.items(), key=lambda item: -item[1]["total_ms"]
+        ):
+            lines.append(
+                f"  {totals['total_ms']:10.2f} ms  {int(totals['count']):5d}x  {stage}"
+            )
+        sections = [
+            ("allocations by SDK line:", self.sdk_allocations),
+            ("allocation sites:", self.allocations),
+        ]
+        if self.peak_memory_bytes is None:
+            sections = []
+        for title, allocations in sections:
+            lines += ["", title]
+            for allocation in allocations[:top]:
+                lines.append(
+                    f"  {allocation['size_bytes'] / 1024:10.1f} KiB  "
+                    f"{allocation['count']:7d}  {allocation['site']}"
+                )
+        if self.stats is not None:
+            lines += ["", "functions by cumulative time:"]
+            for (filename, line, function), entry in sorted(
+                self.stats.stats.items(), key=lambda item: -item[1][3]
+            )[:top]:
+                calls, cumulative = entry[1], entry[3]
+                lines.append(
+                    f"  {cumulative * 1000:10.2f} ms  {calls:7d}  "
+                    f"{function} ({Path(filename).name}:{line})"
+                )
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,251 @@
+import cProfile
+import functools
+import inspect
+import pstats
+import re
+import time
+import tracemalloc
+from collections import defaultdict
+from datetime import datetime
+from pathlib import Path
+
+from aquant.core.metrics import Metrics, MetricsSinkInterface, StageRecord
+from aquant.core.profiling.profile_report import ProfileReport
+
+_PACKAGE_DIR = str(Path(__file__).resolve().parents[2])
+_IGNORED = [
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap*"),
+]
+
+
+class _StageCollector(MetricsSinkInterface):
+    def __init__(self) -> None:
+        self.totals: dict[str, dict[str, float]] = defaultdict(
+            lambda: {"count": 0, "total_ms": 0.0}
+        )
+
+    def observe(self, record: StageRecord) -> None:
+        totals = self.totals[f"{record.operation}.{record.stage}"]
+        totals["count"] += 1
+        totals["total_ms"] += record.duration * 1000
+
+
+class SDKProfiler:
+    """
+    Profiles the SDK calls made inside a block or a decorated coroutine.
+
+    While active it runs cProfile on the calling thread, traces allocations
+    with tracemalloc (peak and top allocation sites) and collects the time of
+    every SDK stage through the metrics hooks. On exit the report is kept in
+    `report` and, with `output_dir`, written as `<name>-<timestamp>.prof`
+    (open with snakeviz or pstats) and `.txt`.
+
+    cProfile and tracemalloc are process-wide: other tasks running on the
+    event loop during the block are included, and decodes offloaded to the
+    decode pool show up as stage time only. Only one profiler can be active
+    at a time: entering a second block raises, while a decorated call made
+    while another profile is running (e.g. overlapping calls under
+    `asyncio.gather`) runs unprofiled, its work already being captured by
+    the active profile.
+
+    tracemalloc makes allocation-heavy code (e.g. building string columns)
+    several times slower, which inflates the stage times; profile with
+    `trace_memory=False` when timing matters more than allocations.
+
+    Example:
+        ```python
+        with aquant.profile("asset-pull", output_dir="profiles") as profiler:
+            await aquant.get_trades(asset="PETR", start_time=start_time)
+        print(profiler.report.summary())
+
+        profiler = aquant.profile(output_dir="profiles")
+
+        @profiler
+        async def pull():
+            ...
+
+        await pull()
+        print(profiler.last.report.summary())
+        ```
+    """
+
+    _active = False
+
+    def __init__(
+        self,
+        metrics: Metrics | None = None,
+        name: str | None = None,
+        output_dir: str | Path | None = None,
+        top: int = 25,
+        trace_memory: bool = True,
+        trace_frames: int = 10,
+    ) -> None:
+        self.metrics = metrics
+        self.name = name
+        self.output_dir = Path(output_dir) if output_dir is not None else None
+        self.top = top
+        self.trace_memory = trace_memory
+        self.trace_frames = trace_frames
+        self.report: ProfileReport | None = None
+        self.last: SDKProfiler | None = None
+        self._profiler: cProfile.Profile | None = None
+        self._collector: _StageCollector | None = None
+        self._started_tracing = False
+        self._start_snapshot: tracemalloc.Snapshot | None = None
+        self._started = 0.0
+
+    def __enter__(self) -> "SDKProfiler":
+        if SDKProfiler._active:
+            raise RuntimeError("Another SDKProfiler is already active.")
+        SDKProfiler._active = True
+
+        self.report = ProfileReport(name=self.name or "aquant")
+        self._collector = _StageCollector()
+        if self.metrics is not None:
+            self.metrics.add_sink(self._collector)
+
+        if self.trace_memory:
+            self._start_tracing()
+
+        self._profiler = cProfile.Profile()
+        self._started = time.perf_counter()
+        self._profiler.enable()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._profiler.disable()
+        report = self.report
+        report.wall_time = time.perf_counter() - self._started
+        try:
+            if self.trace_memory:
+                self._stop_tracing(report)
+        finally:
+            if self.metrics is not None:
+                self.metrics.remove_sink(self._collector)
+            SDKProfiler._active = False
+
+        report.stats = pstats.Stats(self._profiler)
+        report.stages = dict(self._collector.totals)
+        if self.output_dir is not None:
+            self._dump(report)
+
+    async def __aenter__(self) -> "SDKProfiler":
+        return self.__enter__()
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        self.__exit__(exc_type, exc, tb)
+
+    def __call__(self, func):
+        """
+        Profiles every call of `func` (a coroutine function or a plain function).
+
+        Each call gets its own profiler; the latest one is kept in `last`.
+        Calls that start while another profile is active are not profiled.
+        """
+        name = self.name or func.__name__
+
+        def profiler() -> "SDKProfiler":
+            self.last = SDKProfiler(
+                self.metrics,
+                name,
+                self.output_dir,
+                self.top,
+                self.trace_memory,
+                self.trace_frames,
+            )
+            return self.last
+
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                if SDKProfiler._active:
+                    return await func(*args, **kwargs)
+                with profiler():
+                    return await func(*args, **kwargs)
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if SDKProfiler._active:
+                return func(*args, **kwargs)
+            with profiler():
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    def _start_tracing(self) -> None:
+        self._started_tracing = not tracemalloc.is_tracing()
+        if self._started_tracing:
+            tracemalloc.start(self.trace_frames)
+            self._start_snapshot = None
+        else:
+            # Someone else is tracing: only count what this block allocates.
+            self._start_snapshot = tracemalloc.take_snapshot().filter_traces(_IGNORED)
+        tracemalloc.reset_peak()
+        self._baseline = tracemalloc.get_traced_memory()[0]
+
+    def _stop_tracing(self, report: ProfileReport) -> None:
+        try:
+            report.peak_memory_bytes = max(
+                0, tracemalloc.get_traced_memory()[1] - self._baseline
+            )
+            snapshot = tracemalloc.take_snapshot().filter_traces(_IGNORED)
+            report.allocations = self._top_sites(snapshot, "lineno")
+            report.sdk_allocations = self._sdk_sites(snapshot)
+        finally:
+            if self._started_tracing:
+                tracemalloc.stop()
+
+    def _statistics(self, snapshot: tracemalloc.Snapshot, key_type: str):
+        if self._start_snapshot is None:
+            return snapshot.statistics(key_type)
+        return [
+            diff
+            for diff in snapshot.compare_to(self._start_snapshot, key_type)
+            if diff.size_diff > 0
+        ]
+
+    def _top_sites(self, snapshot: tracemalloc.Snapshot, key_type: str) -> list[dict]:
+        sites = []
+        for statistic in self._statistics(snapshot, key_type)[: self.top]:
+            frame = statistic.traceback[-1]
+            sites.append(
+                {
+                    "site": f"{frame.filename}:{frame.lineno}",
+                    "size_bytes": getattr(statistic, "size_diff", statistic.size),
+                    "count": getattr(statistic, "count_diff", statistic.count),
+                }
+            )
+        return sites
+
+    def _sdk_sites(self, snapshot: tracemalloc.Snapshot) -> list[dict]:
+        """Charges each allocation to the innermost SDK line on its stack."""
+        totals: dict[str, list[int]] = defaultdict(lambda: [0, 0])
+        for statistic in self._statistics(snapshot, "traceback"):
+            frames = [
+                f for f in statistic.traceback if f.filename.startswith(_PACKAGE_DIR)
+            ]
+            frame = frames[-1] if frames else None
+            if frame is None:
+                continue
+            site = totals[f"{frame.filename}:{frame.lineno}"]
+            site[0] += getattr(statistic, "size_diff", statistic.size)
+            site[1] += getattr(statistic, "count_diff", statistic.count)
+        ranked = sorted(totals.items(), key=lambda item: -item[1][0])[: self.top]
+        return [
+            {"site": site, "size_bytes": size, "count": count}
+            for site, (size, count) in ranked
+        ]
+
+    def _dump(self, report: ProfileReport) -> None:
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        label = re.sub(r"[^\w.-]+", "_", report.name)
+        stem = f"{label}-{datetime.now():%Y%m%dT%H%M%S%f}"
+        profile_path = self.output_dir / f"{stem}.prof"
+        report.stats.dump_stats(profile_path)
+        summary_path = self.output_dir / f"{stem}.txt"
+        summary_path.write_text(report.summary(self.top))
+        report.files = [profile_path, summary_path]
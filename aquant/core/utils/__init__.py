@@ -1,3 +1,6 @@
+from .loop_lag_monitor import LoopLagMonitor
+from .maybe_await import maybe_await
+from .single_flight import SingleFlight
 from .weak_lru import weak_lru
 
-__all__ = ["weak_lru"]
+__all__ = ["LoopLagMonitor", "SingleFlight", "maybe_await", "weak_lru"]
@@ -0,0 +1,69 @@
+import asyncio
+import time
+from collections import deque
+
+import numpy as np
+
+
+class LoopLagMonitor:
+    """
+    Measures event-loop lag.
+
+    A background task sleeps for `interval` seconds and records how much later
+    than requested it woke up. Anything blocking the loop (e.g. decoding a large
+    reply inline) shows up as lag.
+
+    Example:
+        ```python
+        async with LoopLagMonitor() as lag:
+            await aquant.get_trades(asset="PETR", start_time=start_time)
+        print(lag.snapshot())
+        ```
+    """
+
+    def __init__(self, interval: float = 0.01, window: int = 10_000) -> None:
+        self.interval = interval
+        self._lags: deque[float] = deque(maxlen=window)
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def reset(self) -> None:
+        self._lags.clear()
+
+    def snapshot(self) -> dict[str, float]:
+        """Returns the sample count and the p50, p99 and max lag in milliseconds."""
+        if not self._lags:
+            return {"samples": 0, "p50_ms": 0.0, "p99_ms": 0.0, "max_ms": 0.0}
+        lags = np.fromiter(self._lags, dtype=np.float64) * 1000
+        p50, p99 = np.quantile(lags, [0.5, 0.99])
+        return {
+            "samples": len(lags),
+            "p50_ms": float(p50),
+            "p99_ms": float(p99),
+            "max_ms": float(lags.max()),
+        }
+
+    async def __aenter__(self) -> "LoopLagMonitor":
+        self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.stop()
+
+    async def _run(self) -> None:
+        while True:
+            expected = time.perf_counter() + self.interval
+            await asyncio.sleep(self.interval)
+            self._lags.append(max(0.0, time.perf_counter() - expected))
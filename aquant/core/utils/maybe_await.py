@@ -0,0 +1,15 @@
+import inspect
+from typing import Any
+
+
+async def maybe_await(value: Any) -> Any:
+    """
+    Awaits `value` if it is awaitable, otherwise returns it.
+
+    dependency_injector returns a Future from providers (and from
+    `init_resources`/`shutdown_resources`) only when an async resource is
+    involved, e.g. not when every async resource has been overridden.
+    """
+    if inspect.isawaitable(value):
+        return await value
+    return value
@@ -0,0 +1,76 @@
+import asyncio
+import copy
+import functools
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+
+class _Flight:
+    __slots__ = ("task", "shared")
+
+    def __init__(self, task: asyncio.Task) -> None:
+        self.task = task
+        self.shared = False
+
+
+class SingleFlight:
+    """
+    Coalesces identical in-flight async calls.
+
+    While a call for `key` is running, further calls with the same key await
+    the same task instead of starting a new one. When a call was shared, every
+    caller receives its own copy of the result (DataFrames, arrays and lists
+    of models are copied), so a caller editing its result in place does not
+    affect the others; a call nobody joined returns its result as is.
+    Exceptions are shared. Cancelling one caller does not cancel the shared
+    call as long as others are still waiting for it.
+    """
+
+    __slots__ = ("_inflight", "coalesced")
+
+    def __init__(self) -> None:
+        self._inflight: dict[Hashable, _Flight] = {}
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, call: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Runs `call()` unless a call with the same key is already in flight.
+
+        Args:
+            key (Hashable): Identity of the request (e.g. subject and encoded payload).
+            call (Callable[[], Awaitable[Any]]): Starts the request.
+
+        Returns:
+            Any: The result of the call, copied for each caller if it was shared.
+        """
+        flight = self._inflight.get(key)
+        if flight is None:
+            flight = _Flight(asyncio.ensure_future(call()))
+            self._inflight[key] = flight
+            flight.task.add_done_callback(functools.partial(self._done, key))
+        else:
+            flight.shared = True
+            self.coalesced += 1
+        result = await asyncio.shield(flight.task)
+        return _private_copy(result) if flight.shared else result
+
+    def __len__(self) -> int:
+        return len(self._inflight)
+
+    def _done(self, key: Hashable, task: asyncio.Task) -> None:
+        self._inflight.pop(key, None)
+        if not task.cancelled():
+            # Mark the exception as retrieved when every caller went away.
+            task.exception()
+
+
+def _private_copy(result: Any) -> Any:
+    """A copy of a shared result that the caller may edit in place."""
+    if isinstance(result, pd.DataFrame | pd.Series | np.ndarray):
+        return result.copy()
+    if isinstance(result, list):
+        return [copy.copy(item) for item in result]
+    return result
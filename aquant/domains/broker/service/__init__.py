@@ -1,3 +1,5 @@
+from .broker_directory_service import BrokerDirectoryService
+from .broker_flow_service import BrokerFlowService
 from .broker_service import BrokerService
 
-__all__ = ["BrokerService"]
+__all__ = ["BrokerDirectoryService", "BrokerFlowService", "BrokerService"]
@@ -0,0 +1,64 @@
+import asyncio
+from collections.abc import Iterable
+
+from aquant.core.logger import Logger
+from aquant.domains.broker.service.broker_service import BrokerService
+
+
+class BrokerDirectoryService:
+    """
+    Cached broker id -> name directory.
+
+    Unknown ids are resolved concurrently (at most `max_concurrency` requests
+    in flight) and every id is requested at most once, even when several
+    callers ask for it at the same time. Failed lookups are not cached.
+    """
+
+    def __init__(
+        self, logger: Logger, broker_service: BrokerService, max_concurrency: int = 32
+    ) -> None:
+        self.logger = logger
+        self.broker_service = broker_service
+        self.max_concurrency = max_concurrency
+        self._names: dict[int, str] = {}
+        self._pending: dict[int, asyncio.Future] = {}
+        self._semaphore: asyncio.Semaphore | None = None
+
+    async def resolve(self, fk_ids: Iterable[int]) -> dict[int, str | None]:
+        """
+        Returns the name of every id; ids that could not be resolved map to None.
+
+        Args:
+            fk_ids (Iterable[int]): Broker ids (duplicates are ignored).
+
+        Returns:
+            dict[int, str | None]: Broker name per id.
+        """
+        ids = {int(fk_id) for fk_id in fk_ids}
+        missing = [fk_id for fk_id in ids if fk_id not in self._names]
+        if missing:
+            await asyncio.gather(*(self._lookup(fk_id) for fk_id in missing))
+        return {fk_id: self._names.get(fk_id) for fk_id in ids}
+
+    def invalidate(self) -> None:
+        """Drops every cached name."""
+        self._names.clear()
+
+    async def _lookup(self, fk_id: int) -> None:
+        pending = self._pending.get(fk_id)
+        if pending is not None:
+            await asyncio.shield(pending)
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending[fk_id] = future
+        try:
+            if self._semaphore is None:
+                self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            async with self._semaphore:
+                self._names[fk_id] = await self.broker_service.get_broker_name(fk_id)
+        except Exception as e:
+            self.logger.warning(f"Could not resolve broker {fk_id}, due: {e}")
+        finally:
+            del self._pending[fk_id]
+            future.set_result(None)
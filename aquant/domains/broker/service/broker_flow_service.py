@@ -0,0 +1,127 @@
+import numpy as np
+import pandas as pd
+
+from aquant.core.logger import Logger
+from aquant.domains.broker.service.broker_directory_service import (
+    BrokerDirectoryService,
+)
+
+_REQUIRED_COLUMNS = {"buyer_id", "seller_id", "price", "quantity"}
+
+
+class BrokerFlowService:
+    """
+    Aggregates bought/sold quantity and notional per broker over a trade frame.
+
+    Broker ids are mapped to dense codes with `np.unique` and every column is
+    accumulated with a single `np.bincount`, optionally split by ticker. Names
+    are joined through the cached BrokerDirectoryService.
+    """
+
+    def __init__(
+        self, logger: Logger, broker_directory: BrokerDirectoryService
+    ) -> None:
+        self.logger = logger
+        self.broker_directory = broker_directory
+
+    async def get_broker_flow(
+        self, df: pd.DataFrame, by_ticker: bool = False, resolve_names: bool = True
+    ) -> pd.DataFrame:
+        """
+        Returns the broker flow table of `df`, joined with broker names.
+
+        Args:
+            df (pd.DataFrame): Trades with 'buyer_id', 'seller_id', 'price' and
+                'quantity' columns (and 'ticker' when `by_ticker` is set).
+            by_ticker (bool): If True, returns one row per (ticker, broker).
+            resolve_names (bool): If True, adds a 'broker_name' column.
+
+        Returns:
+            pd.DataFrame: See `aggregate`, plus 'broker_name' when requested.
+        """
+        flow = self.aggregate(df, by_ticker=by_ticker)
+        if resolve_names:
+            names = await self.broker_directory.resolve(flow["broker_id"].unique())
+            flow["broker_name"] = flow["broker_id"].map(names)
+        return flow
+
+    def aggregate(self, df: pd.DataFrame, by_ticker: bool = False) -> pd.DataFrame:
+        """
+        Aggregates the flow of every broker id in `df`.
+
+        Args:
+            df (pd.DataFrame): Trades, as returned by `get_trades`. Rows
+                without a price (or a ticker, when `by_ticker` is set) are
+                ignored.
+            by_ticker (bool): If True, returns one row per (ticker, broker).
+
+        Returns:
+            pd.DataFrame: Columns [ticker,] broker_id, bought_quantity,
+            sold_quantity, net_quantity, bought_notional, sold_notional,
+            net_notional, buy_trades and sell_trades.
+
+        Raises:
+            ValueError: If a required column is missing.
+        """
+        required = _REQUIRED_COLUMNS | ({"ticker"} if by_ticker else set())
+        missing = required - set(df.columns)
+        if missing:
+            raise ValueError(f"Trade frame is missing columns: {sorted(missing)}")
+
+        price = df["price"].to_numpy(dtype=np.float64)
+        valid = ~np.isnan(price)
+        if by_ticker:
+            valid &= df["ticker"].notna().to_numpy()
+        price = price[valid]
+        quantity = df["quantity"].to_numpy(dtype=np.float64)[valid]
+        notional = price * quantity
+        n = len(price)
+
+        ids, codes = np.unique(
+            np.concatenate(
+                [
+                    df["buyer_id"].to_numpy(dtype=np.int64)[valid],
+                    df["seller_id"].to_numpy(dtype=np.int64)[valid],
+                ]
+            ),
+            return_inverse=True,
+        )
+        buyer, seller = codes[:n], codes[n:]
+
+        tickers = None
+        width = len(ids)
+        if by_ticker:
+            ticker_codes, tickers = pd.factorize(
+                df["ticker"].to_numpy()[valid], sort=True
+            )
+            buyer = ticker_codes * width + buyer
+            seller = ticker_codes * width + seller
+            size = len(tickers) * width
+        else:
+            size = width
+
+        bought_quantity = np.bincount(buyer, quantity, minlength=size)
+        sold_quantity = np.bincount(seller, quantity, minlength=size)
+        bought_notional = np.bincount(buyer, notional, minlength=size)
+        sold_notional = np.bincount(seller, notional, minlength=size)
+        buy_trades = np.bincount(buyer, minlength=size)
+        sell_trades = np.bincount(seller, minlength=size)
+
+        present = np.flatnonzero(buy_trades + sell_trades)
+        columns = {
+            "broker_id": ids[present % width] if width else ids,
+            "bought_quantity": bought_quantity[present],
+            "sold_quantity": sold_quantity[present],
+            "net_quantity": bought_quantity[present] - sold_quantity[present],
+            "bought_notional": bought_notional[present],
+            "sold_notional": sold_notional[present],
+            "net_notional": bought_notional[present] - sold_notional[present],
+            "buy_trades": buy_trades[present],
+            "sell_trades": sell_trades[present],
+        }
+        if by_ticker:
+            columns = {
+                "ticker": np.asarray(tickers, dtype=object)[present // width],
+                **columns,
+            }
+        return pd.DataFrame(columns)
@@ -3,27 +3,58 @@ import struct
 import pandas as pd
 
 from aquant.core.logger import Logger
+from aquant.core.metrics import Metrics, NullMetrics
+from aquant.core.utils import SingleFlight
 from aquant.domains.broker.utils import parse_brokers_binary_to_string
 from aquant.infra.nats import NatsClient
 
 
 class BrokerService:
-    def __init__(self, logger: Logger, nats_client: NatsClient) -> None:
+    def __init__(
+        self,
+        logger: Logger,
+        nats_client: NatsClient,
+        single_flight: SingleFlight | None = None,
+        metrics: Metrics | None = None,
+    ) -> None:
         self.logger = logger
         self.nats_client = nats_client
+        self.single_flight = single_flight or SingleFlight()
+        self.metrics = metrics or NullMetrics()
 
     async def get_broker_by_fk_id(self, fk_id: int) -> pd.DataFrame:
         try:
-            subject = "marketdata.broker.request"
-            payload = struct.pack("!I", fk_id)
-            response = await self.nats_client.request(subject, payload, timeout=2)
-            return self._parse_brokers(response)
+            response = await self._request_broker(fk_id, "get_broker")
+            with self.metrics.stage("get_broker", "parse"):
+                return self._parse_brokers(response)
         except Exception as e:
             self.logger.error(
                 f"Error trying to fetch brokers for fk_id provided. fk_id {fk_id}, due: {e}"
             )
             return pd.DataFrame()
 
+    async def get_broker_name(self, fk_id: int) -> str:
+        """
+        Returns the name of the broker with the given id.
+
+        Unlike `get_broker_by_fk_id`, failures are raised instead of logged so
+        callers can tell a missing broker from a transient error.
+        """
+        response = await self._request_broker(fk_id, "get_broker_name")
+        with self.metrics.stage("get_broker_name", "parse"):
+            return parse_brokers_binary_to_string(response)
+
+    async def _request_broker(self, fk_id: int, operation: str) -> bytes:
+        subject = "marketdata.broker.request"
+        payload = struct.pack("!I", fk_id)
+        with self.metrics.stage(operation, "request") as stage:
+            response = await self.single_flight.do(
+                (subject, payload),
+                lambda: self.nats_client.request(subject, payload, timeout=2),
+            )
+            stage.nbytes = len(response)
+        return response
+
     def _parse_brokers(self, data: bytes) -> pd.DataFrame:
         try:
             df = parse_brokers_binary_to_string(data)
@@ -5,6 +5,7 @@ import orjson as json_lib
 import pandas as pd
 
 from aquant.core.logger import Logger
+from aquant.core.metrics import Metrics, NullMetrics
 from aquant.core.utils import weak_lru
 from aquant.domains.marketdata.utils.dictionaries import BookColumnsList
 from aquant.domains.marketdata.utils.redis import generate_redis_keys
@@ -18,12 +19,14 @@ class MarketdataRepository:
         redis_client: RedisClient,
         processor: BufferedMessageProcessor,
         max_workers: int = 4,
+        metrics: Metrics | None = None,
     ) -> None:
         self.logger = logger
         self.redis_client = redis_client.get_client()
         self.processor = processor
         self._columns: list[str] = BookColumnsList
         self.max_workers = max_workers
+        self.metrics = metrics or NullMetrics()
 
     @staticmethod
     def decode_json(b: bytes) -> Any:
@@ -102,27 +105,33 @@ class MarketdataRepository:
             else [f"aquant.security,{t}.book.{s}" for t in tickers for s in side]
         )
 
-        pipe = self.redis_client.pipeline()
-        for key in keys:
-            pipe.get(key)
-        raw_results = pipe.execute()
+        with self.metrics.stage("get_current_book", "redis") as stage:
+            pipe = self.redis_client.pipeline()
+            for key in keys:
+                pipe.get(key)
+            raw_results = pipe.execute()
+            stage.nbytes = sum(len(raw) for raw in raw_results if raw)
 
         decoded_lists: list[list[dict[str, Any]]] = []
-        for key, raw in zip(keys, raw_results, strict=False):
-            if raw:
-                try:
-                    arr = json_lib.loads(raw)
-                    if isinstance(arr, dict):
-                        arr = [arr]
-                except Exception as e:
-                    self.logger.warning(f"Invalid JSON for {key}: {e}")
+        with self.metrics.stage("get_current_book", "json_decode"):
+            for key, raw in zip(keys, raw_results, strict=False):
+                if raw:
+                    try:
+                        arr = json_lib.loads(raw)
+                        if isinstance(arr, dict):
+                            arr = [arr]
+                    except Exception as e:
+                        self.logger.warning(f"Invalid JSON for {key}: {e}")
+                        arr = []
+                else:
                     arr = []
-            else:
-                arr = []
-            decoded_lists.append(arr)
+                decoded_lists.append(arr)
 
         all_entries: dict[str, list[Any]] = {c: [] for c in self._columns}
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+        with (
+            self.metrics.stage("get_current_book", "process_entries"),
+            ThreadPoolExecutor(max_workers=self.max_workers) as executor,
+        ):
             future_to_key = {
                 executor.submit(
                     self._process_key_entries, key, entries_list, max_entries
@@ -141,16 +150,17 @@ class MarketdataRepository:
         if not all_entries["key"]:
             return pd.DataFrame(columns=self._columns)
 
-        df = pd.DataFrame(
-            {
-                "key": pd.Series(all_entries["key"], dtype="category"),
-                "entry_time": all_entries["entry_time"],
-                "price": all_entries["price"],
-                "quantity": all_entries["quantity"],
-                "broker_id": all_entries["broker_id"],
-                "fk_order_id": all_entries["fk_order_id"],
-            }
-        )
+        with self.metrics.stage("get_current_book", "dataframe"):
+            df = pd.DataFrame(
+                {
+                    "key": pd.Series(all_entries["key"], dtype="category"),
+                    "entry_time": all_entries["entry_time"],
+                    "price": all_entries["price"],
+                    "quantity": all_entries["quantity"],
+                    "broker_id": all_entries["broker_id"],
+                    "fk_order_id": all_entries["fk_order_id"],
+                }
+            )
 
         self.processor.flush()
 
@@ -1,3 +1,6 @@
+from .expiry_index import ExpiryIndex
 from .security import Security
+from .security_snapshot import SecuritySnapshot
+from .security_table import SecurityTable
 
-__all__ = ["Security"]
+__all__ = ["Security", "SecurityTable", "ExpiryIndex", "SecuritySnapshot"]
@@ -0,0 +1,192 @@
+from collections.abc import Iterable
+from datetime import UTC, datetime, timedelta
+
+import numpy as np
+import pandas as pd
+
+from aquant.domains.security.entity.security import Security
+
+_EMPTY = (np.empty(0, dtype="datetime64[ns]"), np.empty(0, dtype=object))
+
+DateLike = datetime | np.datetime64 | pd.Timestamp | str
+
+
+class ExpiryIndex:
+    """
+    Per-asset expiry index for resolving futures and options contracts.
+
+    For every asset the dated contracts are kept as two aligned arrays:
+    `expires_at` (datetime64[ns], ascending) and the tickers, ties broken by
+    ticker. The front contract as of a date is the first one with
+    expires_at >= date, found by binary search; undated securities (spot,
+    equities) are not indexed. `front_many` resolves a whole array of dates
+    with a single `np.searchsorted`, for backtests.
+
+    Naive dates are compared as given and aware ones in UTC: an index built
+    from `Security` models uses their local naive datetimes, one built from a
+    frame (whose dates are UTC) is queried with aware or naive UTC dates.
+    """
+
+    __slots__ = ("_assets",)
+
+    def __init__(
+        self, assets: dict[str, tuple[np.ndarray, np.ndarray]] | None = None
+    ) -> None:
+        self._assets = assets or {}
+
+    @classmethod
+    def from_arrays(
+        cls, assets: Iterable[str], tickers: Iterable[str], expires_at: Iterable
+    ) -> "ExpiryIndex":
+        """Builds the index from aligned asset, ticker and expiry columns."""
+        assets = np.asarray(list(assets), dtype=object)
+        tickers = np.asarray(list(tickers), dtype=object)
+        expires = _to_ns_array(list(expires_at))
+        dated = ~np.isnat(expires) & pd.notna(assets) & (assets != "")
+        assets, tickers, expires = assets[dated], tickers[dated], expires[dated]
+        if not len(assets):
+            return cls()
+
+        codes, inverse = np.unique(assets.astype(str), return_inverse=True)
+        order = np.lexsort((tickers.astype(str), expires, inverse))
+        bounds = np.searchsorted(inverse[order], np.arange(len(codes) + 1))
+        index = {}
+        for i, asset in enumerate(codes):
+            rows = order[bounds[i] : bounds[i + 1]]
+            index[str(asset)] = (expires[rows], tickers[rows])
+        return cls(index)
+
+    @classmethod
+    def from_securities(cls, securities: Iterable[Security]) -> "ExpiryIndex":
+        securities = list(securities)
+        return cls.from_arrays(
+            (security.asset for security in securities),
+            (security.ticker for security in securities),
+            (security.expires_at for security in securities),
+        )
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> "ExpiryIndex":
+        """Builds the index from a frame with 'asset', 'ticker' and 'expires_at'."""
+        return cls.from_arrays(df["asset"], df["ticker"], df["expires_at"])
+
+    @property
+    def assets(self) -> list[str]:
+        return list(self._assets)
+
+    def __len__(self) -> int:
+        return sum(len(tickers) for _, tickers in self._assets.values())
+
+    def __contains__(self, asset: str) -> bool:
+        return asset in self._assets
+
+    def __repr__(self) -> str:
+        return f"ExpiryIndex(assets={len(self._assets)}, contracts={len(self)})"
+
+    def contracts(self, asset: str) -> pd.DataFrame:
+        """The dated contracts of `asset` ordered by expiry: 'ticker', 'expires_at'."""
+        expires, tickers = self._assets.get(asset, _EMPTY)
+        return pd.DataFrame({"ticker": tickers, "expires_at": expires})
+
+    def front(
+        self,
+        asset: str,
+        as_of: DateLike | None = None,
+        nth: int = 0,
+        roll_before: timedelta | None = None,
+    ) -> str | None:
+        """
+        Returns the front contract of `asset` as of a date.
+
+        Args:
+            asset (str): Asset code, e.g. "DOL".
+            as_of (Optional[DateLike]): Reference date. Defaults to now.
+            nth (int): 0 for the front contract, 1 for the next one, and so on.
+            roll_before (Optional[timedelta]): Rolls to the next contract this long
+                before expiry, e.g. timedelta(days=2).
+
+        Returns:
+            str | None: The ticker, or None if no such contract is indexed.
+        """
+        expires, tickers = self._assets.get(asset, _EMPTY)
+        i = int(np.searchsorted(expires, self._shift(as_of, roll_before), "left")) + nth
+        return tickers[i] if 0 <= i < len(tickers) else None
+
+    def next(
+        self,
+        asset: str,
+        n: int,
+        as_of: DateLike | None = None,
+        roll_before: timedelta | None = None,
+    ) -> list[str]:
+        """Returns up to `n` contracts of `asset` from the front contract on."""
+        expires, tickers = self._assets.get(asset, _EMPTY)
+        i = int(np.searchsorted(expires, self._shift(as_of, roll_before), "left"))
+        return tickers[i : i + n].tolist()
+
+    def expiring_between(
+        self, asset: str, start: DateLike | None = None, end: DateLike | None = None
+    ) -> list[str]:
+        """Returns the contracts of `asset` with start <= expires_at <= end."""
+        expires, tickers = self._assets.get(asset, _EMPTY)
+        lo = 0 if start is None else np.searchsorted(expires, _to_ns(start), "left")
+        hi = (
+            len(expires)
+            if end is None
+            else np.searchsorted(expires, _to_ns(end), "right")
+        )
+        return tickers[lo:hi].tolist()
+
+    def front_many(
+        self,
+        asset: str,
+        dates: Iterable[DateLike] | np.ndarray | pd.Series,
+        nth: int = 0,
+        roll_before: timedelta | None = None,
+    ) -> np.ndarray:
+        """
+        Resolves the front contract of `asset` for every date at once.
+
+        Args:
+            asset (str): Asset code.
+            dates (Iterable[DateLike] | np.ndarray | pd.Series): Reference dates.
+            nth (int): 0 for the front contract, 1 for the next one, and so on.
+            roll_before (Optional[timedelta]): See `front`.
+
+        Returns:
+            np.ndarray: Object array of tickers aligned with `dates`; None where no
+            contract is indexed (or the date is NaT).
+        """
+        expires, tickers = self._assets.get(asset, _EMPTY)
+        dates = _to_ns_array(dates)
+        if roll_before is not None:
+            dates = dates + np.timedelta64(roll_before)
+        positions = np.searchsorted(expires, dates, "left") + nth
+        valid = (positions >= 0) & (positions < len(tickers)) & ~np.isnat(dates)
+        result = np.full(len(dates), None, dtype=object)
+        result[valid] = tickers[positions[valid]]
+        return result
+
+    @staticmethod
+    def _shift(as_of: DateLike | None, roll_before: timedelta | None) -> np.datetime64:
+        moment = _to_ns(datetime.now() if as_of is None else as_of)
+        if roll_before is not None:
+            moment = moment + np.timedelta64(roll_before)
+        return moment
+
+
+def _to_ns(value: DateLike) -> np.datetime64:
+    """Naive dates are kept as given; aware ones are converted to naive UTC."""
+    if isinstance(value, datetime) and value.tzinfo is None:
+        return np.datetime64(value, "ns")
+    ts = pd.Timestamp(value)
+    if ts.tzinfo is not None:
+        ts = ts.tz_convert(UTC).tz_localize(None)
+    return ts.as_unit("ns").to_datetime64()
+
+
+def _to_ns_array(values) -> np.ndarray:
+    dates = pd.to_datetime(pd.Series(values))
+    if dates.dt.tz is not None:
+        dates = dates.dt.tz_convert(UTC).dt.tz_localize(None)
+    return dates.to_numpy(dtype="datetime64[ns]")
@@ -0,0 +1,340 @@
+import mmap
+import os
+import struct
+import tempfile
+import time
+from collections.abc import Iterable
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+
+from aquant.domains.security.entity.security import Security
+from aquant.domains.security.entity.security_table import SecurityTable
+
+_MAGIC = b"AQSECMAP"
+_VERSION = 1
+_UNIVERSE = 0x1
+# magic, version, flags, record size, created_at, records, isins, assets,
+# asset rows; padded to 64 bytes.
+_HEADER = struct.Struct("<8sHHIdIIII16x")
+_ALIGN = 8
+_TICKER = np.dtype("S13")
+_KEY = np.dtype("S50")
+_ROW = np.dtype("<u4")
+# Undated securities sort after every dated contract of their asset.
+_NO_EXPIRY = 1 << 32
+
+
+def _align(offset: int) -> int:
+    return -(-offset // _ALIGN) * _ALIGN
+
+
+def _layout(count: int, isins: int, assets: int, asset_rows: int) -> list[tuple]:
+    """(name, dtype, length, offset) of every section, in file order."""
+    sections = [
+        ("records", SecurityTable.DTYPE, count),
+        ("ticker_keys", _TICKER, count),
+        ("ticker_rows", _ROW, count),
+        ("isin_keys", _KEY, isins),
+        ("isin_rows", _ROW, isins),
+        ("asset_keys", _KEY, assets),
+        ("asset_complete", np.dtype("u1"), assets),
+        ("asset_bounds", _ROW, assets + 1),
+        ("asset_rows", _ROW, asset_rows),
+    ]
+    layout, offset = [], _HEADER.size
+    for name, dtype, length in sections:
+        layout.append((name, dtype, length, offset))
+        offset = _align(offset + dtype.itemsize * length)
+    return layout
+
+
+class SecuritySnapshot:
+    """
+    Read-only security master snapshot, memory-mapped from a file.
+
+    The file holds a 64-byte header, the security records in the wire layout
+    of `SecurityTable` (so the reply bytes are written as they are) and three
+    indexes: tickers and ISINs sorted next to their record numbers, and the
+    records of each asset sorted by (expires_at, ticker). Every section is a
+    fixed-width array at an 8-byte aligned offset, so opening a snapshot maps
+    the file and wraps each section with `np.frombuffer`: nothing is parsed
+    or copied, lookups are binary searches over the mapped pages, and the
+    page cache is shared by every process that maps the same file. Only the
+    records returned by a lookup are decoded into `Security` models, once
+    per process.
+
+    `write` replaces the file atomically; processes that mapped the previous
+    version keep reading it until they reopen.
+    """
+
+    __slots__ = (
+        "path",
+        "created_at",
+        "universe",
+        "_mmap",
+        "_stat",
+        "_sections",
+        "_decoded",
+    )
+
+    def __init__(
+        self,
+        path: Path,
+        created_at: float,
+        universe: bool,
+        sections: dict[str, np.ndarray],
+        buffer: mmap.mmap | None = None,
+        stat: tuple[int, int] | None = None,
+    ) -> None:
+        self.path = path
+        self.created_at = created_at
+        self.universe = universe
+        self._sections = sections
+        self._mmap = buffer
+        self._stat = stat
+        self._decoded: dict[int, Security] = {}
+
+    @classmethod
+    def open(cls, path: str | os.PathLike) -> "SecuritySnapshot":
+        """
+        Maps a snapshot file read-only.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+            ValueError: If the file is not a security snapshot of this version.
+        """
+        path = Path(path)
+        with open(path, "rb") as file:
+            stat = os.fstat(file.fileno())
+            if stat.st_size < _HEADER.size:
+                raise ValueError(f"{path} is not a security snapshot.")
+            buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, flags, record_size, created_at, *counts = _HEADER.unpack_from(
+            buffer
+        )
+        if magic != _MAGIC or version != _VERSION:
+            buffer.close()
+            raise ValueError(f"{path} is not a version {_VERSION} security snapshot.")
+        if record_size != SecurityTable.DTYPE.itemsize:
+            buffer.close()
+            raise ValueError(f"{path} holds {record_size}-byte security records.")
+        layout = _layout(*counts)
+        _, dtype, length, offset = layout[-1]
+        if len(buffer) < offset + dtype.itemsize * length:
+            buffer.close()
+            raise ValueError(f"{path} is truncated.")
+
+        sections = {
+            name: np.frombuffer(buffer, dtype=dtype, count=length, offset=offset)
+            for name, dtype, length, offset in layout
+        }
+        return cls(
+            path,
+            created_at,
+            bool(flags & _UNIVERSE),
+            sections,
+            buffer,
+            (stat.st_ino, stat.st_mtime_ns),
+        )
+
+    @classmethod
+    def write(
+        cls,
+        path: str | os.PathLike,
+        table: SecurityTable,
+        assets: Iterable[str] = (),
+        universe: bool = False,
+        created_at: float | None = None,
+    ) -> int:
+        """
+        Writes `table` and its indexes to `path`, replacing the file atomically.
+
+        Records sharing a ticker are kept once (the last one wins).
+
+        Args:
+            path (str | os.PathLike): Snapshot file.
+            table (SecurityTable): Securities to store.
+            assets (Iterable[str]): Assets whose securities are all in `table`.
+            universe (bool): Whether `table` is the whole universe.
+            created_at (Optional[float]): Epoch time the data was fetched at.
+                Defaults to now.
+
+        Returns:
+            int: Number of securities written.
+        """
+        records = table.records
+        # np.unique keeps the first occurrence; reverse so the last one wins.
+        _, last = np.unique(records["ticker"][::-1], return_index=True)
+        records = records[np.sort(len(records) - 1 - last)]
+        count = len(records)
+
+        tickers = records["ticker"].astype(_TICKER)
+        ticker_rows = np.argsort(tickers, kind="stable").astype(_ROW)
+
+        isins = records["isin"].astype(_KEY)
+        with_isin = np.flatnonzero(isins != b"")
+        isin_rows = with_isin[np.argsort(isins[with_isin], kind="stable")]
+        isin_rows = isin_rows.astype(_ROW)
+
+        asset_column = records["asset"].astype(_KEY)
+        with_asset = np.flatnonzero(asset_column != b"")
+        expires = records["expires_at"].astype(np.int64)
+        expires[expires == 0] = _NO_EXPIRY
+        order = np.lexsort(
+            (tickers[with_asset], expires[with_asset], asset_column[with_asset])
+        )
+        asset_rows = with_asset[order].astype(_ROW)
+        asset_keys = np.unique(asset_column[with_asset])
+        asset_bounds = np.searchsorted(asset_column[asset_rows], asset_keys, "left")
+        asset_bounds = np.append(asset_bounds, len(asset_rows)).astype(_ROW)
+        complete = set(assets)
+        asset_complete = np.array(
+            [universe or key.decode() in complete for key in asset_keys.tolist()],
+            dtype="u1",
+        )
+
+        sections = {
+            "records": records,
+            "ticker_keys": tickers[ticker_rows],
+            "ticker_rows": ticker_rows,
+            "isin_keys": isins[isin_rows],
+            "isin_rows": isin_rows,
+            "asset_keys": asset_keys,
+            "asset_complete": asset_complete,
+            "asset_bounds": asset_bounds,
+            "asset_rows": asset_rows,
+        }
+        counts = (count, len(isin_rows), len(asset_keys), len(asset_rows))
+        header = _HEADER.pack(
+            _MAGIC,
+            _VERSION,
+            _UNIVERSE if universe else 0,
+            SecurityTable.DTYPE.itemsize,
+            time.time() if created_at is None else created_at,
+            *counts,
+        )
+
+        path = Path(path)
+        fd, temp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(header)
+                for name, _, _, offset in _layout(*counts):
+                    file.write(b"\0" * (offset - file.tell()))
+                    file.write(sections[name].tobytes())
+                file.flush()
+                os.fsync(file.fileno())
+            # mkstemp creates the file private to its owner; workers may run
+            # as other users.
+            os.chmod(temp, 0o644)
+            os.replace(temp, path)
+        except BaseException:
+            Path(temp).unlink(missing_ok=True)
+            raise
+        return count
+
+    @property
+    def table(self) -> SecurityTable:
+        """Every record, as a read-only table over the mapped file."""
+        return SecurityTable(self._sections["records"])
+
+    @property
+    def age(self) -> float:
+        """Seconds since the data was fetched."""
+        return time.time() - self.created_at
+
+    @property
+    def assets(self) -> list[str]:
+        """Assets whose securities are all in the snapshot."""
+        keys = self._sections["asset_keys"][self._sections["asset_complete"] == 1]
+        return [key.decode() for key in keys.tolist()]
+
+    def has_asset(self, asset: str) -> bool:
+        """True if every security of `asset` is in the snapshot."""
+        i = self._find("asset_keys", asset)
+        return i is not None and bool(self._sections["asset_complete"][i])
+
+    def changed_on_disk(self) -> bool:
+        """True if the file was replaced since it was mapped."""
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return False
+        return (stat.st_ino, stat.st_mtime_ns) != self._stat
+
+    def __len__(self) -> int:
+        return len(self._sections["records"])
+
+    def __contains__(self, ticker: str) -> bool:
+        return self._find("ticker_keys", ticker) is not None
+
+    def __repr__(self) -> str:
+        return f"SecuritySnapshot(path={str(self.path)!r}, len={len(self)})"
+
+    def by_ticker(self, ticker: str) -> Security | None:
+        """Returns the security of `ticker`, or None."""
+        i = self._find("ticker_keys", ticker)
+        return None if i is None else self._security(self._sections["ticker_rows"][i])
+
+    def by_isin(self, isin: str) -> Security | None:
+        """Returns the security with this ISIN, or None."""
+        i = self._find("isin_keys", isin)
+        return None if i is None else self._security(self._sections["isin_rows"][i])
+
+    def by_asset(
+        self,
+        asset: str,
+        expires_from: datetime | None = None,
+        expires_to: datetime | None = None,
+    ) -> list[Security]:
+        """Same as `SecurityMasterService.by_asset`, over the snapshot."""
+        i = self._find("asset_keys", asset)
+        if i is None:
+            return []
+        bounds = self._sections["asset_bounds"]
+        rows = self._sections["asset_rows"][bounds[i] : bounds[i + 1]]
+        expires = self._sections["records"]["expires_at"][rows].astype(np.int64)
+        expires[expires == 0] = _NO_EXPIRY
+        lo = 0
+        if expires_from is not None:
+            lo = np.searchsorted(expires, int(expires_from.timestamp()), "left")
+        if expires_to is not None:
+            hi = np.searchsorted(expires, int(expires_to.timestamp()), "right")
+        elif expires_from is not None:
+            hi = np.searchsorted(expires, _NO_EXPIRY, "left")
+        else:
+            hi = len(rows)
+        return [self._security(row) for row in rows[lo:hi].tolist()]
+
+    def close(self) -> None:
+        """Unmaps the file; the snapshot must not be used afterwards."""
+        self._sections = {}
+        self._decoded = {}
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                # Arrays returned by `table` still view the pages; the mapping
+                # is released when they are collected.
+                pass
+            self._mmap = None
+
+    def _security(self, row: int) -> Security:
+        # Records are decoded once per process, on first use.
+        row = int(row)
+        security = self._decoded.get(row)
+        if security is None:
+            security = self.table[row]
+            self._decoded[row] = security
+        return security
+
+    def _find(self, section: str, key: str) -> int | None:
+        keys = self._sections[section]
+        encoded = key.encode()
+        if len(encoded) > keys.dtype.itemsize:
+            return None
+        i = int(np.searchsorted(keys, encoded))
+        return i if i < len(keys) and keys[i] == encoded else None
@@ -0,0 +1,214 @@
+from collections.abc import Iterable
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from aquant.domains.security.entity.security import Security
+
+_TEXT_COLUMNS = (
+    "asset",
+    "ticker",
+    "isin",
+    "cfi_code",
+    "sub_type",
+    "name",
+    "security_group",
+    "currency",
+    "issued_at_country",
+)
+# Zero means "not set" on the wire for these columns.
+_OPTIONAL_INT_COLUMNS = (
+    "product",
+    "type",
+    "round_lot",
+    "tick_size_denominator",
+    "min_order_quantity",
+    "max_order_quantity",
+)
+_TIME_COLUMNS = ("issued_at", "expires_at", "expired_at")
+
+
+class SecurityTable:
+    """
+    Array-backed table of security records.
+
+    The reply of a security request is wrapped as a big-endian structured
+    NumPy array laid out exactly like the wire records, without copying.
+    Columns are decoded in one vectorized pass per column: fixed-width text
+    is decoded as a whole, zero numeric fields become missing values and
+    epoch seconds become datetime64. Pydantic `Security` models are only
+    built on request (`to_securities`, or indexing a single record).
+
+    Record layout (410 bytes, big-endian, struct format
+    "!50s13s50s50sI I 50s50s50sI3s I I I I f I 50s I I"):
+      S50 asset, S13 ticker, S50 isin, S50 cfi_code
+      u4  product, type
+      S50 sub_type, name, security_group
+      u4  price_type
+      S3  currency
+      u4  round_lot, tick_size_denominator, min_order_quantity, max_order_quantity
+      f4  min_price_increment
+      u4  issued_at (epoch seconds)
+      S50 issued_at_country
+      u4  expires_at, expired_at (epoch seconds)
+    """
+
+    __slots__ = ("_records",)
+
+    DTYPE = np.dtype(
+        [
+            ("asset", "S50"),
+            ("ticker", "S13"),
+            ("isin", "S50"),
+            ("cfi_code", "S50"),
+            ("product", ">u4"),
+            ("type", ">u4"),
+            ("sub_type", "S50"),
+            ("name", "S50"),
+            ("security_group", "S50"),
+            ("price_type", ">u4"),
+            ("currency", "S3"),
+            ("round_lot", ">u4"),
+            ("tick_size_denominator", ">u4"),
+            ("min_order_quantity", ">u4"),
+            ("max_order_quantity", ">u4"),
+            ("min_price_increment", ">f4"),
+            ("issued_at", ">u4"),
+            ("issued_at_country", "S50"),
+            ("expires_at", ">u4"),
+            ("expired_at", ">u4"),
+        ]
+    )
+
+    def __init__(self, records: np.ndarray | None = None) -> None:
+        if records is None:
+            records = np.empty(0, dtype=self.DTYPE)
+        elif records.dtype != self.DTYPE:
+            records = records.astype(self.DTYPE)
+        self._records = records
+
+    @classmethod
+    def from_buffer(cls, data: bytes | memoryview) -> "SecurityTable":
+        """
+        Wraps a binary security reply without copying it (the result is read-only).
+
+        Raises:
+            ValueError: If the reply is not a whole number of records.
+        """
+        if len(data) % cls.DTYPE.itemsize:
+            raise ValueError(
+                f"{len(data)} bytes is not a multiple of the "
+                f"{cls.DTYPE.itemsize}-byte security record."
+            )
+        return cls(np.frombuffer(data, dtype=cls.DTYPE))
+
+    @classmethod
+    def from_securities(cls, securities: Iterable[Security]) -> "SecurityTable":
+        """Encodes `Security` models into wire records; long text is truncated."""
+        securities = list(securities)
+        records = np.zeros(len(securities), dtype=cls.DTYPE)
+        for name in cls.DTYPE.names:
+            values = [getattr(security, name) for security in securities]
+            if name in _TEXT_COLUMNS:
+                values = [(value or "").encode() for value in values]
+            elif name in _TIME_COLUMNS:
+                values = [int(value.timestamp()) if value else 0 for value in values]
+            else:
+                values = [value or 0 for value in values]
+            records[name] = values
+        return cls(records)
+
+    @classmethod
+    def concat(cls, tables: Iterable["SecurityTable"]) -> "SecurityTable":
+        """Concatenates several tables into a new one."""
+        arrays = [table.records for table in tables]
+        if not arrays:
+            return cls()
+        return cls(np.concatenate(arrays))
+
+    @property
+    def records(self) -> np.ndarray:
+        """The underlying structured array."""
+        return self._records
+
+    @property
+    def tickers(self) -> np.ndarray:
+        """Decoded ticker symbols."""
+        return self.text("ticker")
+
+    def text(self, name: str) -> np.ndarray:
+        """Decodes a fixed-width text column (UTF-8, trailing nulls removed)."""
+        # tolist() strips the null padding in C; an object array of short
+        # strings is lighter than a fixed-width unicode array and pandas
+        # takes it without another conversion.
+        values = self._records[name].tolist()
+        return np.array([value.decode() for value in values], dtype=object)
+
+    def times(self, name: str) -> np.ndarray:
+        """An epoch-seconds column as datetime64[ns] (naive UTC), 0 -> NaT."""
+        seconds = self._records[name].astype(np.int64)
+        times = seconds.astype("datetime64[s]").astype("datetime64[ns]")
+        times[seconds == 0] = np.datetime64("NaT")
+        return times
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __getitem__(self, key) -> "SecurityTable | Security":
+        if isinstance(key, int | np.integer):
+            record = self._records[key : key + 1 or None]
+            return SecurityTable(record).to_securities()[0]
+        return SecurityTable(self._records[key])
+
+    def __repr__(self) -> str:
+        return f"SecurityTable(len={len(self)})"
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """
+        Builds a DataFrame with one column per record field, in wire order.
+
+        Optional integer fields use the nullable UInt32 dtype, a zero minimum
+        price increment is NaN and the time columns are tz-aware
+        datetime64[ns, UTC] with NaT for unset dates, so they name the same
+        instants as the local naive dates of `to_securities`.
+        """
+        columns = {}
+        for name in self.DTYPE.names:
+            if name in _TEXT_COLUMNS:
+                columns[name] = self.text(name)
+            elif name in _OPTIONAL_INT_COLUMNS:
+                values = self._records[name].astype(np.uint32)
+                columns[name] = pd.arrays.IntegerArray(values, values == 0)
+            elif name in _TIME_COLUMNS:
+                columns[name] = pd.to_datetime(self.times(name), utc=True)
+            elif name == "min_price_increment":
+                values = self._records[name].astype(np.float64)
+                columns[name] = np.where(values == 0.0, np.nan, values)
+            else:
+                columns[name] = self._records[name].astype(np.uint32)
+        return pd.DataFrame(columns)
+
+    def to_securities(self) -> list[Security]:
+        """
+        Builds and validates one `Security` per record.
+
+        Dates are local naive datetimes, as `datetime.fromtimestamp` returns;
+        `to_dataframe` gives the same instants in UTC.
+        """
+        columns = {name: self._records[name].tolist() for name in self.DTYPE.names}
+        for name in _TEXT_COLUMNS:
+            columns[name] = [value.decode() for value in columns[name]]
+        for name in (*_OPTIONAL_INT_COLUMNS, "min_price_increment"):
+            columns[name] = [value or None for value in columns[name]]
+        for name in _TIME_COLUMNS:
+            columns[name] = [
+                datetime.fromtimestamp(value) if value else None
+                for value in columns[name]
+            ]
+
+        names = self.DTYPE.names
+        return [
+            Security(**dict(zip(names, row, strict=True)))
+            for row in zip(*(columns[name] for name in names), strict=True)
+        ]
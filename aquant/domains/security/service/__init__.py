@@ -1,3 +1,4 @@
+from .security_master_service import SecurityMasterService
 from .security_service import SecurityService
 
-__all__ = ["SecurityService"]
+__all__ = ["SecurityService", "SecurityMasterService"]
@@ -0,0 +1,645 @@
+import asyncio
+import contextlib
+import os
+import time
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import AsyncIterator, Iterable
+from datetime import datetime
+from itertools import chain
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from aquant.core.logger import Logger
+from aquant.domains.security.entity import (
+    ExpiryIndex,
+    Security,
+    SecuritySnapshot,
+    SecurityTable,
+)
+from aquant.domains.security.service.security_service import SecurityService
+
+try:
+    import fcntl
+except ImportError:  # Windows: snapshot refreshes are not coordinated.
+    fcntl = None
+
+# Securities without an expiry sort after every dated contract of their asset.
+_NO_EXPIRY = datetime.max
+_LAST_TICKER = "\U0010ffff"
+# Seconds before a failed snapshot refresh is attempted again.
+_SNAPSHOT_RETRY = 60.0
+
+
+class SecurityMasterService:
+    """
+    Local security master with indexed lookups.
+
+    Securities are fetched through SecurityService and kept in memory with a
+    hash index on ticker and on ISIN and, per asset, a list sorted by
+    (expires_at, ticker), so lookups by ticker, ISIN or asset and expiry range
+    are answered without a request. Assets (or the whole universe) can be
+    preloaded; a lookup that misses, or whose data is older than `ttl`
+    seconds, is fetched again. Failed fetches are not cached and leave the
+    stale data in place. Every index update runs without awaiting, so
+    concurrent lookups never see a half-updated master.
+
+    Many tickers are resolved together by `get_securities_many`: only the
+    ones missing or stale are requested, in multi-ticker envelopes of
+    `batch_size` when the server supports them (`batch_requests`), otherwise
+    one request per ticker with at most `max_concurrency` in flight.
+
+    The master can be saved to a memory-mapped `SecuritySnapshot` file
+    (`save_snapshot`) that other processes open at `snapshot_path` instead of
+    downloading the universe again. The snapshot sits under the in-memory
+    indexes: lookups fall back to it and whatever is fetched later takes
+    precedence. Once the snapshot is older than `ttl`, its data keeps being
+    served while one process re-fetches its assets (or the universe) in the
+    background and replaces the file; the others pick the new file up.
+    """
+
+    def __init__(
+        self,
+        logger: Logger,
+        security_service: SecurityService,
+        ttl: float = 3600.0,
+        batch_requests: bool = False,
+        batch_size: int = 500,
+        max_concurrency: int = 32,
+        snapshot_path: str | os.PathLike | None = None,
+    ) -> None:
+        self.logger = logger
+        self.security_service = security_service
+        self.ttl = ttl
+        self.batch_requests = batch_requests
+        self.batch_size = batch_size
+        self.max_concurrency = max_concurrency
+        self._semaphore: asyncio.Semaphore | None = None
+        self._by_ticker: dict[str, Security] = {}
+        self._by_isin: dict[str, str] = {}
+        self._by_asset: dict[str, list[tuple[datetime, str]]] = {}
+        self._fetched_at: dict[str, float] = {}
+        self._asset_loaded_at: dict[str, float] = {}
+        self._universe_loaded_at: float | None = None
+        self._version = 0
+        self._expiry_index: tuple[int, ExpiryIndex] | None = None
+        self.snapshot_path = Path(snapshot_path) if snapshot_path else None
+        self._snapshot: SecuritySnapshot | None = None
+        self._snapshot_loaded_at: float | None = None
+        self._snapshot_checked = snapshot_path is None
+        self._snapshot_refresh: asyncio.Task | None = None
+        self._snapshot_retry_at = 0.0
+
+    def __len__(self) -> int:
+        snapshot = self._current_snapshot()
+        if snapshot is None:
+            return len(self._by_ticker)
+        return len(snapshot) + sum(
+            1 for ticker in self._by_ticker if ticker not in snapshot
+        )
+
+    async def preload(self, assets: Iterable[str] | None = None) -> int:
+        """
+        Loads every security of `assets`, or the whole universe.
+
+        Assets held by a snapshot that is not stale are not requested.
+
+        Args:
+            assets (Optional[Iterable[str]]): Asset codes. When None, the entire
+                universe is requested, which needs a server that supports the
+                'get_all_securities' action.
+
+        Returns:
+            int: Number of securities held after the load.
+        """
+        if assets is None:
+            snapshot = self._current_snapshot()
+            if snapshot is None or not snapshot.universe or self._snapshot_stale():
+                await self._load_universe()
+            return len(self)
+        return await self._load(
+            asset
+            for asset in set(assets)
+            if self._snapshot_holding(asset) is None or self._snapshot_stale()
+        )
+
+    async def refresh(self, assets: Iterable[str] | None = None) -> int:
+        """
+        Re-fetches `assets`, or everything loaded so far, regardless of the TTL.
+
+        Args:
+            assets (Optional[Iterable[str]]): Asset codes to refresh.
+
+        Returns:
+            int: Number of securities held after the refresh.
+        """
+        if assets is None and self._universe_loaded_at is not None:
+            await self._load_universe()
+            return len(self)
+        if assets is None:
+            assets = set(self._asset_loaded_at)
+            tickers = [
+                ticker
+                for ticker, security in self._by_ticker.items()
+                if security.asset not in assets
+            ]
+            await asyncio.gather(*(self._load_ticker(ticker) for ticker in tickers))
+        return await self._load(assets)
+
+    async def _load(self, assets: Iterable[str]) -> int:
+        await asyncio.gather(*(self._load_asset(asset) for asset in set(assets)))
+        return len(self)
+
+    async def get_securities(
+        self,
+        ticker: str = None,
+        asset: str = None,
+        expires_at: datetime = None,
+        as_frame: bool = False,
+    ) -> list[Security] | pd.DataFrame | None:
+        """
+        Same lookups as `SecurityService.get_securities`, served from the master.
+
+        A ticker is fetched on its own when missing or stale, an asset is loaded
+        entirely. A lookup by `asset` and `expires_at` is always requested: the
+        server decides which contracts match the expiry, which the master
+        cannot reproduce.
+
+        Returns:
+            list[Security] | pd.DataFrame | None: The securities, as a frame with
+            the columns of `SecurityTable.to_dataframe` when `as_frame` is set;
+            None when nothing is cached and the fetch failed.
+
+        Raises:
+            ValueError: If neither 'ticker' nor 'asset' is provided.
+        """
+        securities = await self._lookup(ticker, asset, expires_at)
+        if as_frame and securities is not None:
+            return SecurityTable.from_securities(securities).to_dataframe()
+        return securities
+
+    async def _lookup(
+        self, ticker: str | None, asset: str | None, expires_at: datetime | None
+    ) -> list[Security] | None:
+        if ticker:
+            security, expired = self._held(ticker)
+            if expired:
+                if not await self._load_ticker(ticker) and security is None:
+                    return None
+                security = self._by_ticker.get(ticker)
+            return [security] if security is not None else []
+
+        if asset and expires_at:
+            return await self.security_service.get_securities(
+                asset=asset, expires_at=expires_at
+            )
+
+        if asset:
+            snapshot = self._snapshot_holding(asset)
+            if snapshot is not None:
+                return snapshot.by_asset(asset)
+            if self._is_stale(self._asset_loaded_at.get(asset)):
+                if not await self._load_asset(asset) and asset not in self._by_asset:
+                    return None
+            return self.by_asset(asset)
+
+        raise ValueError("Informe pelo menos 'ticker' ou 'asset'.")
+
+    async def get_securities_many(self, tickers: Iterable[str]) -> pd.DataFrame:
+        """
+        Resolves many tickers at once, requesting only those not cached or stale.
+
+        Args:
+            tickers (Iterable[str]): Ticker codes (duplicates are ignored).
+
+        Returns:
+            pd.DataFrame: One row per known ticker, in request order, with the
+            columns of `SecurityTable.to_dataframe`. Unknown tickers and tickers
+            that could not be fetched are left out.
+        """
+        held = {ticker: self._held(ticker) for ticker in tickers}
+        missing = [ticker for ticker, (_, expired) in held.items() if expired]
+        if missing:
+            await self._load_tickers(missing)
+        securities = [
+            self._by_ticker.get(ticker) if expired else security
+            for ticker, (security, expired) in held.items()
+        ]
+        return SecurityTable.from_securities(
+            security for security in securities if security is not None
+        ).to_dataframe()
+
+    def by_ticker(self, ticker: str) -> Security | None:
+        """Returns the cached security of `ticker`, without any request."""
+        return self._held(ticker)[0]
+
+    def by_isin(self, isin: str) -> Security | None:
+        """Returns the cached security with this ISIN, without any request."""
+        ticker = self._by_isin.get(isin)
+        if ticker is not None:
+            return self._held(ticker)[0]
+        snapshot = self._current_snapshot()
+        return snapshot.by_isin(isin) if snapshot is not None else None
+
+    def by_asset(
+        self,
+        asset: str,
+        expires_from: datetime | None = None,
+        expires_to: datetime | None = None,
+    ) -> list[Security]:
+        """
+        Returns the cached securities of `asset` sorted by expiry, without any request.
+
+        Args:
+            asset (str): Asset code.
+            expires_from (Optional[datetime]): Only contracts expiring at or after it.
+            expires_to (Optional[datetime]): Only contracts expiring at or before it.
+
+        Returns:
+            list[Security]: Securities without an expiry come last, and only when
+            no bound is given.
+        """
+        snapshot = self._snapshot_holding(asset)
+        if snapshot is not None:
+            return snapshot.by_asset(asset, expires_from, expires_to)
+        index = self._by_asset.get(asset, [])
+        lo = 0 if expires_from is None else bisect_left(index, (expires_from, ""))
+        if expires_to is not None:
+            hi = bisect_right(index, (expires_to, _LAST_TICKER))
+        elif expires_from is not None:
+            hi = bisect_left(index, (_NO_EXPIRY, ""))
+        else:
+            hi = len(index)
+        return [self._by_ticker[ticker] for _, ticker in index[lo:hi]]
+
+    def expiry_index(self) -> ExpiryIndex:
+        """
+        Returns an ExpiryIndex over the dated securities held, without any request.
+
+        The index is rebuilt only after the master changed.
+        """
+        snapshot = self._current_snapshot()
+        if self._expiry_index is None or self._expiry_index[0] != self._version:
+            securities = self._by_ticker.values()
+            if snapshot is None:
+                index = ExpiryIndex.from_securities(securities)
+            else:
+                # Snapshot records shadowed by a fetched security are left out;
+                # dates are local naive like those of the models.
+                table = snapshot.table
+                tickers = table.tickers
+                kept = ~np.isin(tickers, list(self._by_ticker))
+                expires = [
+                    datetime.fromtimestamp(seconds) if seconds else None
+                    for seconds in table.records["expires_at"][kept].tolist()
+                ]
+                index = ExpiryIndex.from_arrays(
+                    chain((s.asset for s in securities), table.text("asset")[kept]),
+                    chain((s.ticker for s in securities), tickers[kept]),
+                    chain((s.expires_at for s in securities), expires),
+                )
+            self._expiry_index = (self._version, index)
+        return self._expiry_index[1]
+
+    def is_stale(self, asset: str | None = None) -> bool:
+        """True if `asset` (or the universe) is not loaded or is older than the TTL."""
+        snapshot = self._current_snapshot()
+        if asset is None:
+            if snapshot is not None and snapshot.universe:
+                return self._snapshot_stale() and self._is_stale(
+                    self._universe_loaded_at
+                )
+            return self._is_stale(self._universe_loaded_at)
+        if self._snapshot_holding(asset) is not None:
+            return self._snapshot_stale()
+        return self._is_stale(self._asset_loaded_at.get(asset))
+
+    def open_snapshot(self, path: str | os.PathLike | None = None) -> bool:
+        """
+        Maps a snapshot file under the in-memory indexes, replacing any other.
+
+        Args:
+            path (Optional[str | os.PathLike]): Snapshot file. Defaults to
+                `snapshot_path`, which it replaces otherwise.
+
+        Returns:
+            bool: False if the file does not exist or is not a valid snapshot.
+        """
+        if path is not None:
+            self.snapshot_path = Path(path)
+        self._snapshot_checked = True
+        try:
+            snapshot = SecuritySnapshot.open(self.snapshot_path)
+        except FileNotFoundError:
+            self.logger.info(f"Security snapshot {self.snapshot_path} not found.")
+            return False
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Security snapshot not opened: {e}")
+            return False
+        self._swap_snapshot(snapshot)
+        self.logger.info(
+            f"Opened security snapshot {snapshot.path} with {len(snapshot)} "
+            f"securities ({snapshot.age:.0f}s old)."
+        )
+        return True
+
+    def save_snapshot(self, path: str | os.PathLike | None = None) -> int:
+        """
+        Saves every security held to a snapshot file, replacing it atomically.
+
+        The snapshot holds the in-memory securities plus those of the current
+        snapshot they do not replace, and is dated by the oldest fetch among them.
+
+        Args:
+            path (Optional[str | os.PathLike]): Snapshot file. Defaults to
+                `snapshot_path`, which it replaces otherwise.
+
+        Returns:
+            int: Number of securities written.
+
+        Raises:
+            ValueError: If no path is given and `snapshot_path` is not set.
+        """
+        if path is not None:
+            self.snapshot_path = Path(path)
+        if self.snapshot_path is None:
+            raise ValueError("Informe o caminho do snapshot.")
+        snapshot = self._current_snapshot()
+
+        tables = []
+        assets = set(self._asset_loaded_at)
+        universe = self._universe_loaded_at is not None
+        loaded = list(self._fetched_at.values())
+        if snapshot is not None:
+            table = snapshot.table
+            tables.append(table[~np.isin(table.tickers, list(self._by_ticker))])
+            assets.update(snapshot.assets)
+            universe = universe or snapshot.universe
+            loaded.append(self._snapshot_loaded_at)
+        tables.append(SecurityTable.from_securities(self._by_ticker.values()))
+        age = time.monotonic() - min(loaded) if loaded else 0.0
+
+        count = SecuritySnapshot.write(
+            self.snapshot_path,
+            SecurityTable.concat(tables),
+            assets,
+            universe,
+            created_at=time.time() - age,
+        )
+        self.open_snapshot()
+        return count
+
+    async def refresh_snapshot(self) -> bool:
+        """
+        Re-fetches the assets (or the universe) of the snapshot and replaces it.
+
+        Securities saved outside a fully loaded asset are dropped and fetched
+        again on demand. Concurrent refreshes of one file, from any process,
+        run one at a time; a refresh that finds the file already replaced by
+        a fresh one only reopens it.
+
+        Returns:
+            bool: False if there is no snapshot or the fetch failed.
+        """
+        snapshot = self._current_snapshot()
+        if snapshot is None:
+            return False
+        async with _file_lock(snapshot.path):
+            if snapshot.changed_on_disk() and self.open_snapshot():
+                if not self._snapshot_stale():
+                    return True
+                snapshot = self._snapshot
+            path, assets, universe = snapshot.path, snapshot.assets, snapshot.universe
+
+            if universe:
+                securities = await self.security_service.get_all_securities()
+            else:
+                replies = await asyncio.gather(
+                    *(
+                        self.security_service.get_securities(asset=asset)
+                        for asset in assets
+                    )
+                )
+                securities = (
+                    None
+                    if any(reply is None for reply in replies)
+                    else [security for reply in replies for security in reply]
+                )
+            if securities is None:
+                self.logger.warning("Security snapshot refresh failed; kept stale.")
+                return False
+
+            fetched_at = time.time()
+            await asyncio.to_thread(
+                lambda: SecuritySnapshot.write(
+                    path,
+                    SecurityTable.from_securities(securities),
+                    assets,
+                    universe,
+                    created_at=fetched_at,
+                )
+            )
+            return self.open_snapshot(path)
+
+    def invalidate(self) -> None:
+        """Drops every cached security and closes the snapshot."""
+        self._clear()
+        self._snapshot_checked = True
+        self._swap_snapshot(None)
+
+    def _clear(self) -> None:
+        self._version += 1
+        self._by_ticker.clear()
+        self._by_isin.clear()
+        self._by_asset.clear()
+        self._fetched_at.clear()
+        self._asset_loaded_at.clear()
+        self._universe_loaded_at = None
+
+    async def _load_universe(self) -> bool:
+        securities = await self.security_service.get_all_securities()
+        if securities is None:
+            return False
+        loaded_at = time.monotonic()
+        self._clear()
+        for security in securities:
+            self._insert(security, loaded_at)
+        for asset in self._by_asset:
+            self._asset_loaded_at[asset] = loaded_at
+        self._universe_loaded_at = loaded_at
+        self.logger.info(f"Security master loaded {len(self)} securities.")
+        return True
+
+    async def _load_asset(self, asset: str) -> bool:
+        securities = await self.security_service.get_securities(asset=asset)
+        if securities is None:
+            return False
+        loaded_at = time.monotonic()
+        for _, ticker in list(self._by_asset.get(asset, [])):
+            self._remove(ticker)
+        for security in securities:
+            self._insert(security, loaded_at)
+        self._asset_loaded_at[asset] = loaded_at
+        self.logger.debug(f"Loaded {len(securities)} {asset} securities.")
+        return True
+
+    async def _load_ticker(self, ticker: str) -> bool:
+        securities = await self.security_service.get_securities(ticker=ticker)
+        if securities is None:
+            return False
+        loaded_at = time.monotonic()
+        self._remove(ticker)
+        for security in securities:
+            self._insert(security, loaded_at)
+        return True
+
+    async def _load_tickers(self, tickers: list[str]) -> None:
+        pending = tickers
+        if self.batch_requests:
+            batches = [
+                tickers[i : i + self.batch_size]
+                for i in range(0, len(tickers), self.batch_size)
+            ]
+            loaded = await asyncio.gather(*(self._load_batch(b) for b in batches))
+            # Batches the server rejected are retried one ticker at a time.
+            pending = [
+                ticker
+                for batch, ok in zip(batches, loaded, strict=True)
+                if not ok
+                for ticker in batch
+            ]
+        if pending:
+            if self._semaphore is None:
+                self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            await asyncio.gather(*(self._load_limited(ticker) for ticker in pending))
+
+    async def _load_batch(self, tickers: list[str]) -> bool:
+        securities = await self.security_service.get_securities_by_tickers(tickers)
+        if securities is None:
+            return False
+        loaded_at = time.monotonic()
+        for ticker in tickers:
+            self._remove(ticker)
+        for security in securities:
+            self._insert(security, loaded_at)
+        return True
+
+    async def _load_limited(self, ticker: str) -> bool:
+        async with self._semaphore:
+            return await self._load_ticker(ticker)
+
+    def _insert(self, security: Security, loaded_at: float) -> None:
+        self._remove(security.ticker)
+        self._version += 1
+        self._by_ticker[security.ticker] = security
+        self._fetched_at[security.ticker] = loaded_at
+        if security.isin:
+            self._by_isin[security.isin] = security.ticker
+        if security.asset:
+            insort(
+                self._by_asset.setdefault(security.asset, []),
+                (security.expires_at or _NO_EXPIRY, security.ticker),
+            )
+
+    def _remove(self, ticker: str) -> None:
+        security = self._by_ticker.pop(ticker, None)
+        if security is None:
+            return
+        self._version += 1
+        self._fetched_at.pop(ticker, None)
+        if security.isin and self._by_isin.get(security.isin) == ticker:
+            del self._by_isin[security.isin]
+        index = self._by_asset.get(security.asset)
+        if index is not None:
+            key = (security.expires_at or _NO_EXPIRY, ticker)
+            position = bisect_left(index, key)
+            if position < len(index) and index[position] == key:
+                del index[position]
+            if not index:
+                del self._by_asset[security.asset]
+
+    def _is_stale(self, loaded_at: float | None) -> bool:
+        return loaded_at is None or time.monotonic() - loaded_at > self.ttl
+
+    def _held(self, ticker: str) -> tuple[Security | None, bool]:
+        """
+        The freshest security of `ticker` held, and whether it must be fetched.
+
+        Snapshot data is never fetched on the spot: a stale snapshot is
+        refreshed in the background and served meanwhile.
+        """
+        security = self._by_ticker.get(ticker)
+        snapshot = self._current_snapshot()
+        if snapshot is not None and (
+            security is None or self._fetched_at[ticker] < self._snapshot_loaded_at
+        ):
+            from_snapshot = snapshot.by_ticker(ticker)
+            if from_snapshot is not None:
+                return from_snapshot, False
+        return security, security is None or self._is_stale(
+            self._fetched_at.get(ticker)
+        )
+
+    def _snapshot_holding(self, asset: str) -> SecuritySnapshot | None:
+        """The snapshot, if it holds all of `asset` and is newer than any fetch."""
+        snapshot = self._current_snapshot()
+        if snapshot is None or not snapshot.has_asset(asset):
+            return None
+        loaded_at = self._asset_loaded_at.get(asset)
+        if loaded_at is not None and loaded_at >= self._snapshot_loaded_at:
+            return None
+        return snapshot
+
+    def _current_snapshot(self) -> SecuritySnapshot | None:
+        """The snapshot, opened on first use; schedules a refresh once stale."""
+        if not self._snapshot_checked:
+            self.open_snapshot()
+        if self._snapshot is not None and self._snapshot_stale():
+            self._schedule_snapshot_refresh()
+        return self._snapshot
+
+    def _snapshot_stale(self) -> bool:
+        return self._is_stale(self._snapshot_loaded_at)
+
+    def _schedule_snapshot_refresh(self) -> None:
+        now = time.monotonic()
+        if (
+            self._snapshot_refresh is not None and not self._snapshot_refresh.done()
+        ) or now < self._snapshot_retry_at:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._snapshot_retry_at = now + _SNAPSHOT_RETRY
+        self._snapshot_refresh = loop.create_task(self._refresh_in_background())
+
+    async def _refresh_in_background(self) -> None:
+        try:
+            await self.refresh_snapshot()
+        except Exception as e:
+            self.logger.error(f"Security snapshot refresh failed: {e}")
+
+    def _swap_snapshot(self, snapshot: SecuritySnapshot | None) -> None:
+        previous, self._snapshot = self._snapshot, snapshot
+        self._snapshot_loaded_at = (
+            None if snapshot is None else time.monotonic() - snapshot.age
+        )
+        self._version += 1
+        if previous is not None and previous is not snapshot:
+            previous.close()
+
+
+@contextlib.asynccontextmanager
+async def _file_lock(path: Path) -> AsyncIterator[None]:
+    """Exclusive advisory lock on `<path>.lock`, across processes."""
+    with open(f"{path}.lock", "ab") as file:
+        if fcntl is not None:
+            while True:
+                try:
+                    fcntl.flock(file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    break
+                except BlockingIOError:
+                    await asyncio.sleep(0.05)
+        yield
@@ -1,34 +1,98 @@
 import datetime
 
+import pandas as pd
+
+from aquant.core.executors import DecodeExecutor
 from aquant.core.logger import Logger
+from aquant.core.metrics import Metrics, NullMetrics
+from aquant.core.utils import SingleFlight
 from aquant.domains.security.entity import Security
 from aquant.domains.security.utils import (
     decode_securities,
+    decode_securities_frame,
     encode_security,
     security_payload_builder,
 )
+from aquant.domains.security.utils.enums import SecurityActions
 from aquant.infra.nats import NatsClient
 
 
 class SecurityService:
-    def __init__(self, logger: Logger, nats_client: NatsClient) -> None:
+    def __init__(
+        self,
+        logger: Logger,
+        nats_client: NatsClient,
+        single_flight: SingleFlight | None = None,
+        decode_executor: DecodeExecutor | None = None,
+        metrics: Metrics | None = None,
+    ) -> None:
         self.logger = logger
         self.nats_client = nats_client
+        self.single_flight = single_flight or SingleFlight()
+        self.decode_executor = decode_executor or DecodeExecutor()
+        self.metrics = metrics or NullMetrics()
 
     async def get_securities(
-        self, ticker: str = None, asset: str = None, expires_at: datetime = None
-    ) -> list[Security]:
+        self,
+        ticker: str = None,
+        asset: str = None,
+        expires_at: datetime = None,
+        as_frame: bool = False,
+    ) -> list[Security] | pd.DataFrame:
         try:
-            subject = "marketdata.security.request"
             payload = security_payload_builder(ticker, asset, expires_at)
-            message = encode_security(payload=payload)
-            response = await self.nats_client.request(subject, message, timeout=5)
-            response_decoded = decode_securities(response=response)
-
-            self.logger.debug(f"Retrieved {len(response_decoded)} records.")
-
-            return response_decoded
+            return await self._fetch(payload, as_frame)
         except Exception as e:
             self.logger.error(
                 f"Error trying to fetch securities for payload provided, payload {security_payload_builder(ticker, asset, expires_at)}, due: {e}"
             )
+
+    async def get_securities_by_tickers(
+        self, tickers: list[str], as_frame: bool = False
+    ) -> list[Security] | pd.DataFrame:
+        """Fetches several tickers in one 'get_securities_by_tickers' request."""
+        try:
+            payload = security_payload_builder(tickers=tickers)
+            return await self._fetch(payload, as_frame)
+        except Exception as e:
+            self.logger.error(
+                f"Error trying to fetch securities of {len(tickers)} tickers, due: {e}"
+            )
+
+    async def get_all_securities(
+        self, as_frame: bool = False
+    ) -> list[Security] | pd.DataFrame:
+        """Fetches every security (server action 'get_all_securities')."""
+        payload = {"action": SecurityActions.ALL.value, "params": {}}
+        try:
+            return await self._fetch(payload, as_frame)
+        except Exception as e:
+            self.logger.error(f"Error trying to fetch all securities, due: {e}")
+
+    async def _fetch(
+        self, payload: dict, as_frame: bool
+    ) -> list[Security] | pd.DataFrame:
+        subject = "marketdata.security.request"
+        with self.metrics.stage("get_securities", "encode") as stage:
+            message = encode_security(payload=payload)
+            stage.nbytes = len(message)
+        response_decoded = await self.single_flight.do(
+            (subject, message, as_frame),
+            lambda: self._request(subject, message, as_frame),
+        )
+
+        self.logger.debug(f"Retrieved {len(response_decoded)} records.")
+
+        return response_decoded
+
+    async def _request(
+        self, subject: str, message: bytes, as_frame: bool
+    ) -> list[Security] | pd.DataFrame:
+        with self.metrics.stage("get_securities", "request") as stage:
+            response = await self.nats_client.request(subject, message, timeout=5)
+            stage.nbytes = len(response)
+        # The columnar decode never builds (and validates) pydantic models.
+        decode = decode_securities_frame if as_frame else decode_securities
+        with self.metrics.stage("get_securities", "decode") as stage:
+            stage.nbytes = len(response)
+            return await self.decode_executor.run(decode, response)
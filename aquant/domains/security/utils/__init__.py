@@ -1,4 +1,13 @@
-from .security_formatter import decode_securities, encode_security
+from .security_formatter import (
+    decode_securities,
+    decode_securities_frame,
+    encode_security,
+)
 from .security_payload_builder import security_payload_builder
 
-__all__ = ["security_payload_builder", "encode_security", "decode_securities"]
+__all__ = [
+    "security_payload_builder",
+    "encode_security",
+    "decode_securities",
+    "decode_securities_frame",
+]
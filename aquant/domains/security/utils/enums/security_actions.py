@@ -11,3 +11,5 @@ class SecurityActions(Enum):
     TICKER = "get_security_by_ticker"
     ASSET = "get_security_by_asset"
     ASSET_AND_EXPIRES_AT = "get_security_by_asset_and_expires_at"
+    ALL = "get_all_securities"
+    TICKERS = "get_securities_by_tickers"
@@ -2,11 +2,15 @@ ACTIONS = {
     "ticker": "get_security_by_ticker",
     "asset": "get_security_by_asset",
     "asset_expires": "get_security_by_asset_and_expires_at",
+    "tickers": "get_securities_by_tickers",
 }
 
 
 def security_payload_builder(
-    ticker: str | None = None, asset: str | None = None, expires_at: str | None = None
+    ticker: str | None = None,
+    asset: str | None = None,
+    expires_at: str | None = None,
+    tickers: list[str] | None = None,
 ) -> dict:
     """
     Constructs the payload for the securities request based on the parameters provided.
@@ -15,13 +19,17 @@ def security_payload_builder(
         ticker (Optional[str]): Ticker code.
         asset (Optional[str]): Asset code.
         expires_at (Optional[str]): Expiration date in 'YYYY-MM-DD HH:MM:SS.mmm' format.
+        tickers (Optional[list[str]]): Several ticker codes, sent in one envelope.
 
     Returns:
         dict[str, Union[Any]: Payload configured for the get_securities method call.
 
     Raises:
-        ValueError: If neither 'ticker' nor 'asset' are provided.
+        ValueError: If neither 'ticker', 'tickers' nor 'asset' are provided.
     """
+    if tickers:
+        return {"action": ACTIONS["tickers"], "params": {"tickers": list(tickers)}}
+
     if ticker:
         return {"action": ACTIONS["ticker"], "params": {"ticker": ticker}}
 
@@ -0,0 +1,3 @@
+from .trade_tape import TradeTape
+
+__all__ = ["TradeTape"]
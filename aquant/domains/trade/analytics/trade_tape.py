@@ -0,0 +1,254 @@
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+
+from aquant.domains.trade.utils.buckets import bucket_end, time_bucket
+from aquant.domains.trade.utils.enums import TimescaleIntervalEnum
+from aquant.domains.trade.utils.reducers import group_trades, segment_starts
+
+_REQUIRED_COLUMNS = {"ticker", "event_time", "price", "quantity", "side"}
+
+
+class TradeTape:
+    """
+    Vectorized analytics over a trade tape.
+
+    Trades are ordered once by ticker and time and a set of prefix sums is
+    precomputed in O(n): volume, notional, aggressor buy/sell volume, tick-rule
+    signed volume and the time integral of price. Any window statistic is then
+    a difference of two prefix entries, so single windows are answered in O(1)
+    after a binary search and rolling/bucketed series in one vectorized pass.
+
+    Aggressor side comes from the 'side' column ("B" buy, "S" sell). The tick
+    rule classifies each trade by its price change against the previous trade
+    of the same ticker, carrying the last non-zero tick over zero ticks.
+
+    TWAP holds each price until the next trade of the ticker. A window starts
+    with the price in force at its start (if a prior trade exists) and is
+    clipped to the last trade of the ticker.
+
+    Example:
+        ```python
+        tape = TradeTape(trades_df)
+        stats = tape.window("PETR4", datetime(2025, 5, 5, 10), datetime(2025, 5, 5, 11))
+        bars = tape.bucketed(TimescaleIntervalEnum.MINUTE_5)
+        rolling = tape.rolling(timedelta(minutes=1))
+        ```
+    """
+
+    def __init__(self, trades: pd.DataFrame) -> None:
+        """
+        Args:
+            trades (pd.DataFrame): Trades with 'ticker', 'event_time', 'price',
+                'quantity' and 'side' columns, as returned by `get_trades`.
+
+        Raises:
+            ValueError: If a required column is missing.
+        """
+        missing = _REQUIRED_COLUMNS - set(trades.columns)
+        if missing:
+            raise ValueError(f"Trade frame is missing columns: {sorted(missing)}")
+
+        rows, self._codes, tickers, self._ts = group_trades(trades)
+        self._price = trades["price"].to_numpy(dtype=np.float64)[rows]
+        quantity = trades["quantity"].to_numpy(dtype=np.float64)[rows]
+        side = trades["side"].to_numpy()[rows]
+
+        self.tickers = pd.Index(tickers, name="ticker")
+        starts = segment_starts(self._codes)
+        self._bounds = np.append(starts, len(self._ts)).astype(np.int64)
+        self._first = np.repeat(starts, np.diff(self._bounds))
+
+        is_first = np.zeros(len(self._ts), dtype=bool)
+        is_first[starts] = True
+        tick = self._tick_rule(self._price, is_first)
+
+        buy = np.where(side == "B", quantity, 0.0)
+        sell = np.where(side == "S", quantity, 0.0)
+        hold = np.zeros(len(self._ts), dtype=np.float64)
+        hold[:-1] = np.where(is_first[1:], 0.0, np.diff(self._ts).astype(np.float64))
+
+        self._cum_quantity = self._prefix(quantity)
+        self._cum_notional = self._prefix(self._price * quantity)
+        self._cum_buy = self._prefix(buy)
+        self._cum_sell = self._prefix(sell)
+        self._cum_tick_signed = self._prefix(tick * quantity)
+        self._cum_upticks = self._prefix((tick > 0).astype(np.int64))
+        self._cum_downticks = self._prefix((tick < 0).astype(np.int64))
+        self._cum_price_time = self._prefix(self._price * hold)
+
+    def __len__(self) -> int:
+        return len(self._ts)
+
+    def window(
+        self, ticker: str, start: datetime, end: datetime
+    ) -> dict[str, float | int]:
+        """
+        Returns the statistics of `ticker` over start <= event_time <= end.
+
+        Args:
+            ticker (str): Ticker symbol.
+            start (datetime): Window start (naive datetimes are UTC).
+            end (datetime): Window end, inclusive.
+
+        Returns:
+            dict[str, float | int]: The same statistics as the `bucketed` columns.
+
+        Raises:
+            KeyError: If the ticker is not on the tape.
+        """
+        seg_lo, seg_hi = self._segment(ticker)
+        ts = self._ts[seg_lo:seg_hi]
+        t0, t1 = self._to_ns(start), self._to_ns(end)
+        lo = seg_lo + np.searchsorted(ts, t0, side="left")
+        hi = seg_lo + np.searchsorted(ts, t1, side="right")
+        t1 = min(t1, int(ts[-1]))
+        stats = self._stats(
+            np.array([lo]),
+            np.array([hi]),
+            np.array([t0], dtype=np.int64),
+            np.array([max(t0, t1)], dtype=np.int64),
+        )
+        return {name: column[0].item() for name, column in stats.items()}
+
+    def bucketed(self, interval: TimescaleIntervalEnum) -> pd.DataFrame:
+        """
+        Returns one row of statistics per ticker and time bucket.
+
+        Buckets use the same origins as the server-side OHLCV (see `time_bucket`);
+        buckets without trades are omitted.
+
+        Args:
+            interval (TimescaleIntervalEnum): Bucket width.
+
+        Returns:
+            pd.DataFrame: Columns ticker, timestamp, volume, notional, vwap, twap,
+            trades, buy_volume, sell_volume, signed_volume, imbalance, upticks,
+            downticks and tick_signed_volume.
+        """
+        buckets = time_bucket(self._ts, interval)
+        lo = segment_starts(self._codes, buckets)
+        hi = np.append(lo[1:], len(self._ts)).astype(np.int64)
+        t0 = buckets[lo]
+        segment_last = self._ts[self._bounds[1:] - 1]
+        t1 = np.minimum(bucket_end(t0, interval), segment_last[self._codes[lo]])
+
+        return self._frame(lo, t0, self._stats(lo, hi, t0, t1))
+
+    def rolling(self, window: timedelta) -> pd.DataFrame:
+        """
+        Returns, for every trade, the statistics of the trailing window (t - window, t].
+
+        Args:
+            window (timedelta): Width of the trailing window.
+
+        Returns:
+            pd.DataFrame: One row per trade, ordered by ticker and time, with the
+            columns ticker, event_time and the `bucketed` statistics.
+        """
+        width = int(pd.Timedelta(window).as_unit("ns").value)
+        t1 = self._ts
+        t0 = t1 - width
+        lo = np.empty(len(t1), dtype=np.int64)
+        for seg_lo, seg_hi in zip(self._bounds[:-1], self._bounds[1:], strict=True):
+            lo[seg_lo:seg_hi] = seg_lo + np.searchsorted(
+                t1[seg_lo:seg_hi], t0[seg_lo:seg_hi], side="right"
+            )
+        hi = np.arange(1, len(t1) + 1, dtype=np.int64)
+
+        frame = self._frame(lo, t1, self._stats(lo, hi, t0, t1))
+        return frame.rename(columns={"timestamp": "event_time"})
+
+    def _stats(
+        self, lo: np.ndarray, hi: np.ndarray, t0: np.ndarray, t1: np.ndarray
+    ) -> dict[str, np.ndarray]:
+        """Window statistics for trades [lo, hi) over the time span [t0, t1]."""
+        volume = self._cum_quantity[hi] - self._cum_quantity[lo]
+        notional = self._cum_notional[hi] - self._cum_notional[lo]
+        buy = self._cum_buy[hi] - self._cum_buy[lo]
+        sell = self._cum_sell[hi] - self._cum_sell[lo]
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            vwap = notional / volume
+            imbalance = (buy - sell) / (buy + sell)
+
+        return {
+            "volume": volume,
+            "notional": notional,
+            "vwap": vwap,
+            "twap": self._twap(lo, hi, t0, t1),
+            "trades": hi - lo,
+            "buy_volume": buy,
+            "sell_volume": sell,
+            "signed_volume": buy - sell,
+            "imbalance": imbalance,
+            "upticks": self._cum_upticks[hi] - self._cum_upticks[lo],
+            "downticks": self._cum_downticks[hi] - self._cum_downticks[lo],
+            "tick_signed_volume": self._cum_tick_signed[hi] - self._cum_tick_signed[lo],
+        }
+
+    def _twap(
+        self, lo: np.ndarray, hi: np.ndarray, t0: np.ndarray, t1: np.ndarray
+    ) -> np.ndarray:
+        """Integrates the step price over [t0, t1] from the price/time prefix sums."""
+        if not len(self._ts):
+            return np.full(len(lo), np.nan)
+
+        has_trades = hi > lo
+        has_prior = lo > self._first[np.minimum(lo, len(self._ts) - 1)]
+        last = np.maximum(hi - 1, 0)
+        prior = np.maximum(lo - 1, 0)
+        first_ts = self._ts[np.minimum(lo, len(self._ts) - 1)]
+
+        inner = np.where(
+            has_trades, self._cum_price_time[last] - self._cum_price_time[lo], 0.0
+        )
+        tail = np.where(has_trades, self._price[last] * (t1 - self._ts[last]), 0.0)
+        head_end = np.where(has_trades, first_ts, t1)
+        head = np.where(has_prior, self._price[prior] * (head_end - t0), 0.0)
+        duration = np.where(has_prior, t1 - t0, np.where(has_trades, t1 - first_ts, 0))
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            twap = (inner + tail + head) / duration
+        instant = np.where(has_trades, self._price[last], np.nan)
+        return np.where(duration > 0, twap, instant)
+
+    def _frame(
+        self, rows: np.ndarray, timestamps: np.ndarray, stats: dict[str, np.ndarray]
+    ) -> pd.DataFrame:
+        return pd.DataFrame(
+            {
+                "ticker": np.asarray(self.tickers, dtype=object)[self._codes[rows]],
+                "timestamp": timestamps.view("datetime64[ns]"),
+                **stats,
+            }
+        )
+
+    def _segment(self, ticker: str) -> tuple[int, int]:
+        code = self.tickers.get_indexer([ticker])[0]
+        if code < 0:
+            raise KeyError(f"Ticker {ticker!r} is not on the tape.")
+        return int(self._bounds[code]), int(self._bounds[code + 1])
+
+    @staticmethod
+    def _tick_rule(price: np.ndarray, is_first: np.ndarray) -> np.ndarray:
+        """+1 uptick, -1 downtick; zero ticks inherit the last non-zero tick."""
+        tick = np.zeros(len(price), dtype=np.float64)
+        tick[1:] = np.sign(np.diff(price))
+        tick[is_first] = 0.0
+        carry = np.where((tick != 0) | is_first, np.arange(len(price)), 0)
+        return tick[np.maximum.accumulate(carry)] if len(price) else tick
+
+    @staticmethod
+    def _prefix(values: np.ndarray) -> np.ndarray:
+        out = np.zeros(len(values) + 1, dtype=values.dtype)
+        np.cumsum(values, out=out[1:])
+        return out
+
+    @staticmethod
+    def _to_ns(dt: datetime) -> int:
+        ts = pd.Timestamp(dt)
+        if ts.tzinfo is not None:
+            ts = ts.tz_convert("UTC").tz_localize(None)
+        return int(ts.as_unit("ns").value)
@@ -1,6 +1,7 @@
 from .ohlcv_binary_codec import OpenHighLowCloseVolumeBinaryCodec
 from .trade_binary_codec import TradeBinaryCodec
 from .trade_binary_request_codec import TradeBinaryRequestCodec
+from .trade_parallel_decoder import TradeParallelDecoder
 from .trade_parser_service import TradeParserService
 from .trade_payload_builder_service import TradePayloadBuilderService
 
@@ -8,6 +9,7 @@ __all__ = [
     "OpenHighLowCloseVolumeBinaryCodec",
     "TradeBinaryCodec",
     "TradeBinaryRequestCodec",
+    "TradeParallelDecoder",
     "TradeParserService",
     "TradePayloadBuilderService",
 ]
@@ -13,12 +13,31 @@ class TradeBinaryCodec:
     __slots__ = ("_struct", "_encode_buffer", "_logger")
     FORMAT = "=10s10s15sqddccII"
     SIZE = struct.calcsize(FORMAT)
+    DTYPE = np.dtype(
+        [
+            ("ticker", "S20"),
+            ("asset", "S20"),
+            ("fk_order_id", "S20"),
+            ("event_time", ">u8"),
+            ("price_ascii", "S50"),
+            ("quantity", ">f8"),
+            ("side", "S1"),
+            ("tick_direction", "S1"),
+            ("seller_id", ">u4"),
+            ("buyer_id", ">u4"),
+        ]
+    )
 
     def __init__(self, logger: Logger) -> None:
         self._struct = struct.Struct(self.FORMAT)
         self._encode_buffer = bytearray(self.SIZE)
         self._logger = logger
 
+    def __reduce__(self):
+        # struct.Struct is not picklable; rebuild it so the codec can be sent to
+        # a process-pool decoder.
+        return (type(self), (self._logger,))
+
     def decode(self, data: bytes) -> Trade:
         if len(data) != self.SIZE:
             raise ValueError(f"Invalid size: expected {self.SIZE}, got {len(data)}")
@@ -120,20 +139,7 @@ class TradeBinaryCodec:
         n = len(binary_data)
         self._logger.debug(f"Received {n} bytes of binary trade-data.")
 
-        dtype = np.dtype(
-            [
-                ("ticker", "S20"),
-                ("asset", "S20"),
-                ("fk_order_id", "S20"),
-                ("event_time", ">u8"),
-                ("price_ascii", "S50"),
-                ("quantity", ">f8"),
-                ("side", "S1"),
-                ("tick_direction", "S1"),
-                ("seller_id", ">u4"),
-                ("buyer_id", ">u4"),
-            ]
-        )
+        dtype = self.DTYPE
         rec_size = dtype.itemsize
         if n % rec_size != 0:
             self._logger.warning(
@@ -28,6 +28,9 @@ class TradeBinaryRequestCodec:
         self._buf = bytearray(self.SIZE)
         self._logger = logger
 
+    def __reduce__(self):
+        return (type(self), (self._logger,))
+
     def _pack_str(self, s: str | None, length: int) -> bytes:
         b = (s or "").encode("ascii", "ignore")[:length]
         return b.ljust(length, b"\x00")
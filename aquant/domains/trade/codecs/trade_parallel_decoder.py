@@ -0,0 +1,194 @@
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor, wait
+from itertools import pairwise
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+
+from aquant.core.logger import Logger
+from aquant.domains.trade.codecs.trade_binary_codec import TradeBinaryCodec
+
+# Columns decoded by the workers, in output-segment order. The numeric columns
+# only need a byte swap, which the parent does straight from the input segment.
+_TEXT_COLUMNS = (
+    ("ticker", np.dtype("U20")),
+    ("asset", np.dtype("U20")),
+    ("fk_order_id", np.dtype("U20")),
+    ("side", np.dtype("U1")),
+    ("tick_direction", np.dtype("U1")),
+)
+_OUTPUT_COLUMNS = (*_TEXT_COLUMNS, ("price", np.dtype(np.float64)))
+
+
+def _output_views(buffer, count: int) -> dict[str, np.ndarray]:
+    """Lays the output columns out back to back in one shared segment."""
+    views = {}
+    offset = 0
+    for name, dtype in _OUTPUT_COLUMNS:
+        views[name] = np.ndarray((count,), dtype=dtype, buffer=buffer, offset=offset)
+        offset += dtype.itemsize * count
+    return views
+
+
+def _output_size(count: int) -> int:
+    return sum(dtype.itemsize for _, dtype in _OUTPUT_COLUMNS) * count
+
+
+def _decode_slice(
+    input_name: str, output_name: str, count: int, start: int, stop: int
+) -> None:
+    """Decodes records [start, stop) of the input segment into the output segment."""
+    source = shared_memory.SharedMemory(name=input_name)
+    target = shared_memory.SharedMemory(name=output_name)
+    try:
+        records = np.frombuffer(source.buf, dtype=TradeBinaryCodec.DTYPE, count=count)
+        records = records[start:stop]
+        columns = _output_views(target.buf, count)
+        for name, _ in _TEXT_COLUMNS:
+            columns[name][start:stop] = np.char.rstrip(
+                np.char.decode(records[name], "ascii"), "\x00"
+            )
+        prices = np.char.rstrip(np.char.decode(records["price_ascii"], "ascii"), "\x00")
+        columns["price"][start:stop] = pd.to_numeric(prices, errors="coerce")
+        # The views must be gone before the segments can be closed.
+        del records, columns
+    finally:
+        source.close()
+        target.close()
+
+
+class TradeParallelDecoder:
+    """
+    Decodes very large trade replies on several cores.
+
+    The reply is copied once into a shared-memory segment and split on record
+    boundaries (`TradeBinaryCodec.DTYPE.itemsize`). A process pool decodes the
+    string and price columns of each slice in place into a second shared
+    segment, so nothing is pickled back and no per-slice frames are
+    concatenated; the parent byte-swaps the numeric columns and builds the
+    DataFrame directly from the shared columns. The result is identical to
+    `TradeBinaryCodec.parse_trades_binary_to_dataframe`.
+
+    Replies smaller than `threshold_bytes` are handed to the serial codec,
+    which is faster below a few tens of megabytes.
+    """
+
+    def __init__(
+        self,
+        logger: Logger,
+        trade_codec: TradeBinaryCodec,
+        max_workers: int | None = None,
+        threshold_bytes: int = 32 << 20,
+        min_slice_bytes: int = 4 << 20,
+    ) -> None:
+        self._logger = logger
+        self.trade_codec = trade_codec
+        self.max_workers = max_workers or min(8, os.cpu_count() or 1)
+        self.threshold_bytes = threshold_bytes
+        self.min_slice_bytes = min_slice_bytes
+        self._executor: ProcessPoolExecutor | None = None
+
+    def __reduce__(self):
+        # A decoder sent to another process (e.g. with the process decode
+        # executor) decodes there serially instead of nesting a pool.
+        return (
+            type(self),
+            (
+                self._logger,
+                self.trade_codec,
+                1,
+                self.threshold_bytes,
+                self.min_slice_bytes,
+            ),
+        )
+
+    def accepts(self, size: int) -> bool:
+        return self.max_workers > 1 and size >= self.threshold_bytes
+
+    def parse_trades_binary_to_dataframe(self, binary_data: bytes) -> pd.DataFrame:
+        """
+        Decodes N sequential trade records into a DataFrame.
+
+        Args:
+            binary_data (bytes): Raw reply in the `TradeBinaryCodec.DTYPE` layout.
+
+        Returns:
+            pd.DataFrame: Same columns and dtypes as
+            `TradeBinaryCodec.parse_trades_binary_to_dataframe`.
+        """
+        if not self.accepts(len(binary_data)):
+            return self.trade_codec.parse_trades_binary_to_dataframe(binary_data)
+
+        dtype = TradeBinaryCodec.DTYPE
+        rec_size = dtype.itemsize
+        n = len(binary_data)
+        if n % rec_size != 0:
+            self._logger.warning(
+                f"{n} bytes is not a multiple of {rec_size}, truncating the remainder."
+            )
+        count = n // rec_size
+        slices = min(self.max_workers, max(1, math.ceil(n / self.min_slice_bytes)))
+        bounds = np.linspace(0, count, slices + 1).astype(np.int64)
+
+        source = shared_memory.SharedMemory(create=True, size=max(count * rec_size, 1))
+        target = shared_memory.SharedMemory(
+            create=True, size=max(_output_size(count), 1)
+        )
+        try:
+            source.buf[: count * rec_size] = memoryview(binary_data)[: count * rec_size]
+            executor = self._get_executor()
+            futures = [
+                executor.submit(
+                    _decode_slice, source.name, target.name, count, start, stop
+                )
+                for start, stop in pairwise(bounds.tolist())
+                if stop > start
+            ]
+            # Wait for every slice before the segments can be released.
+            wait(futures)
+            for future in futures:
+                future.result()
+
+            records = np.frombuffer(source.buf, dtype=dtype, count=count)
+            columns = _output_views(target.buf, count)
+            df = pd.DataFrame(
+                {
+                    "ticker": columns["ticker"],
+                    "asset": columns["asset"],
+                    "fk_order_id": columns["fk_order_id"],
+                    "buyer_id": records["buyer_id"].astype(np.uint32),
+                    "seller_id": records["seller_id"].astype(np.uint32),
+                    "price": columns["price"],
+                    "quantity": records["quantity"].astype(np.float64),
+                    "side": columns["side"],
+                    "tick_direction": columns["tick_direction"],
+                    "event_time": pd.to_datetime(
+                        records["event_time"].astype(np.uint64), unit="ns"
+                    ),
+                },
+                copy=True,
+            )
+            del records, columns
+        finally:
+            source.close()
+            source.unlink()
+            target.close()
+            target.unlink()
+
+        self._logger.debug(
+            f"Parsed {len(df)} trades into DataFrame on {len(futures)} workers."
+        )
+        return df
+
+    def shutdown(self) -> None:
+        """Stops the worker pool; a later decode creates a new one."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self._executor
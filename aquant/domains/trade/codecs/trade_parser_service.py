@@ -7,15 +7,22 @@ from aquant.domains.trade.codecs import (
     OpenHighLowCloseVolumeBinaryCodec,
     TradeBinaryCodec,
     TradeBinaryRequestCodec,
+    TradeParallelDecoder,
 )
 from aquant.domains.trade.dtos import TradeDTO
-from aquant.domains.trade.entity import OpenHighLowCloseVolume, Trade
+from aquant.domains.trade.entity import OHLCVSeries, OpenHighLowCloseVolume, Trade
 
 Parsed = Union[Trade, OpenHighLowCloseVolume]  # noqa: UP007
 
 
 class TradeParserService:
-    __slots__ = ("trade_codec", "trade_request_codec", "ohlcv_codec", "_logger")
+    __slots__ = (
+        "trade_codec",
+        "trade_request_codec",
+        "ohlcv_codec",
+        "parallel_decoder",
+        "_logger",
+    )
 
     def __init__(
         self,
@@ -23,21 +30,30 @@ class TradeParserService:
         trade_codec: TradeBinaryCodec,
         trade_request_codec: TradeBinaryRequestCodec,
         ohlcv_codec: OpenHighLowCloseVolumeBinaryCodec,
+        parallel_decoder: TradeParallelDecoder | None = None,
     ) -> None:
         self._logger = logger
         self.trade_codec = trade_codec
         self.trade_request_codec = trade_request_codec
         self.ohlcv_codec = ohlcv_codec
+        self.parallel_decoder = parallel_decoder
 
     def encode(self, message: TradeDTO) -> bytes:
         return self.trade_request_codec.encode(message)
 
     def decode_trades_into_dataframe(self, message: bytes) -> pd.DataFrame:
+        if self.parallel_decoder is not None and self.parallel_decoder.accepts(
+            len(message)
+        ):
+            return self.parallel_decoder.parse_trades_binary_to_dataframe(message)
         return self.trade_codec.parse_trades_binary_to_dataframe(message)
 
     def decode_ohlcv_into_dataframe(self, message: bytes) -> pd.DataFrame:
         return self.ohlcv_codec.parse_ohlcv_binary_into_dataframe(message)
 
+    def decode_ohlcv_into_series(self, message: bytes) -> OHLCVSeries:
+        return self.ohlcv_codec.decode_series(message)
+
     def decode(self, blob: bytes) -> list[Parsed]:
         size = len(blob)
         if size % self.trade_codec.SIZE == 0:
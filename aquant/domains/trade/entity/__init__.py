@@ -1,4 +1,5 @@
+from .ohlcv_series import OHLCVSeries
 from .open_high_low_close_volume import OpenHighLowCloseVolume
 from .trade import Trade
 
-__all__ = ["Trade", "OpenHighLowCloseVolume"]
+__all__ = ["Trade", "OpenHighLowCloseVolume", "OHLCVSeries"]
@@ -0,0 +1,204 @@
+from collections.abc import Iterable
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from aquant.domains.trade.entity.open_high_low_close_volume import (
+    OpenHighLowCloseVolume,
+)
+
+
+class OHLCVSeries:
+    """
+    Array-backed series of OpenHighLowCloseVolume bars.
+
+    Bars are kept in a single structured NumPy array with an explicit
+    little-endian layout identical to the wire format, so a decoded reply is
+    wrapped without copying. Column accessors return views, time slicing uses
+    binary search, and dataclasses or DataFrames are only built on request.
+
+    Record layout (58 bytes, little-endian):
+      S10   ticker (ASCII, null-padded)
+      i8    timestamp, nanoseconds since epoch (UTC)
+      f8    open, high, low, close, volume
+    """
+
+    __slots__ = ("_records", "_sorted")
+
+    DTYPE = np.dtype(
+        [
+            ("ticker", "S10"),
+            ("timestamp", "<i8"),
+            ("open", "<f8"),
+            ("high", "<f8"),
+            ("low", "<f8"),
+            ("close", "<f8"),
+            ("volume", "<f8"),
+        ]
+    )
+
+    def __init__(self, records: np.ndarray | None = None) -> None:
+        if records is None:
+            records = np.empty(0, dtype=self.DTYPE)
+        elif records.dtype != self.DTYPE:
+            records = records.astype(self.DTYPE)
+        self._records = records
+        self._sorted: bool | None = None
+
+    @classmethod
+    def from_buffer(cls, data: bytes | memoryview) -> "OHLCVSeries":
+        """Wraps a binary OHLCV reply without copying it (the result is read-only)."""
+        return cls(np.frombuffer(data, dtype=cls.DTYPE))
+
+    @classmethod
+    def concat(cls, series: Iterable["OHLCVSeries"]) -> "OHLCVSeries":
+        """Concatenates several series into a new one."""
+        arrays = [s.records for s in series]
+        if not arrays:
+            return cls()
+        return cls(np.concatenate(arrays))
+
+    @property
+    def records(self) -> np.ndarray:
+        """The underlying structured array."""
+        return self._records
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        """Bar timestamps as a datetime64[ns] view (naive UTC)."""
+        return self._records["timestamp"].view("datetime64[ns]")
+
+    @property
+    def open(self) -> np.ndarray:
+        return self._records["open"]
+
+    @property
+    def high(self) -> np.ndarray:
+        return self._records["high"]
+
+    @property
+    def low(self) -> np.ndarray:
+        return self._records["low"]
+
+    @property
+    def close(self) -> np.ndarray:
+        return self._records["close"]
+
+    @property
+    def volume(self) -> np.ndarray:
+        return self._records["volume"]
+
+    @property
+    def tickers(self) -> np.ndarray:
+        """Decoded ticker symbols; unlike the numeric columns this allocates."""
+        return np.char.rstrip(np.char.decode(self._records["ticker"], "ascii"), "\x00")
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __getitem__(self, key) -> "OHLCVSeries | OpenHighLowCloseVolume":
+        if isinstance(key, int | np.integer):
+            return self._to_dataclass(self._records[key])
+        sliced = OHLCVSeries(self._records[key])
+        if isinstance(key, slice) and (key.step is None or key.step > 0):
+            sliced._sorted = self._sorted
+        return sliced
+
+    def __iter__(self):
+        return iter(self.to_dataclasses())
+
+    def __repr__(self) -> str:
+        if not len(self):
+            return "OHLCVSeries(len=0)"
+        return (
+            f"OHLCVSeries(len={len(self)}, "
+            f"from={self.timestamps[0]!s}, to={self.timestamps[-1]!s})"
+        )
+
+    def for_ticker(self, ticker: str) -> "OHLCVSeries":
+        """Returns the bars of a single ticker."""
+        return OHLCVSeries(self._records[self._records["ticker"] == ticker.encode()])
+
+    def sort_by_time(self) -> "OHLCVSeries":
+        """Returns a copy ordered by timestamp (stable for equal timestamps)."""
+        order = np.argsort(self._records["timestamp"], kind="stable")
+        result = OHLCVSeries(self._records[order])
+        result._sorted = True
+        return result
+
+    def between(
+        self,
+        start: datetime | np.datetime64 | None = None,
+        end: datetime | np.datetime64 | None = None,
+    ) -> "OHLCVSeries":
+        """
+        Returns the bars with start <= timestamp <= end, using binary search.
+
+        The series must be ordered by timestamp (see `sort_by_time`).
+
+        Raises:
+            ValueError: If the series is not ordered by timestamp.
+        """
+        if self._sorted is None:
+            ts = self._records["timestamp"]
+            self._sorted = bool(np.all(ts[1:] >= ts[:-1]))
+        if not self._sorted:
+            raise ValueError(
+                "OHLCVSeries must be ordered by timestamp; call sort_by_time() first."
+            )
+
+        ts = self._records["timestamp"]
+        lo = 0 if start is None else np.searchsorted(ts, self._to_ns(start), "left")
+        hi = len(ts) if end is None else np.searchsorted(ts, self._to_ns(end), "right")
+        return self[lo:hi]
+
+    def to_dataclasses(self) -> list[OpenHighLowCloseVolume]:
+        """Builds one OpenHighLowCloseVolume per bar, keeping nanosecond timestamps."""
+        tickers = self.tickers.tolist()
+        timestamps = self._records["timestamp"].tolist()
+        return [
+            OpenHighLowCloseVolume(ticker, pd.Timestamp(ts, unit="ns"), o, h, lo, c, v)
+            for ticker, ts, o, h, lo, c, v in zip(
+                tickers,
+                timestamps,
+                self.open.tolist(),
+                self.high.tolist(),
+                self.low.tolist(),
+                self.close.tolist(),
+                self.volume.tolist(),
+                strict=True,
+            )
+        ]
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Builds a DataFrame with the same columns as the OHLCV DataFrame decoder."""
+        return pd.DataFrame(
+            {
+                "ticker": self.tickers,
+                "timestamp": self.timestamps,
+                "open": self.open,
+                "high": self.high,
+                "low": self.low,
+                "close": self.close,
+                "volume": self.volume,
+            }
+        )
+
+    def _to_dataclass(self, record: np.void) -> OpenHighLowCloseVolume:
+        return OpenHighLowCloseVolume(
+            record["ticker"].rstrip(b"\x00").decode("ascii"),
+            pd.Timestamp(int(record["timestamp"]), unit="ns"),
+            float(record["open"]),
+            float(record["high"]),
+            float(record["low"]),
+            float(record["close"]),
+            float(record["volume"]),
+        )
+
+    @staticmethod
+    def _to_ns(value: datetime | np.datetime64) -> int:
+        ts = pd.Timestamp(value)
+        if ts.tzinfo is not None:
+            ts = ts.tz_convert("UTC").tz_localize(None)
+        return int(ts.as_unit("ns").value)
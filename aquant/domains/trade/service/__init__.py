@@ -1,7 +1,13 @@
+from .trade_ohlcv_cache_service import TradeOHLCVCacheService
 from .trade_ohlcv_calc_service import TradeOHLCVCalcService
+from .trade_ohlcv_resample_service import TradeOHLCVResampleService
 from .trade_service import TradeService
+from .trade_stream_service import TradeStreamService
 
 __all__ = [
+    "TradeOHLCVCacheService",
     "TradeOHLCVCalcService",
+    "TradeOHLCVResampleService",
     "TradeService",
+    "TradeStreamService",
 ]
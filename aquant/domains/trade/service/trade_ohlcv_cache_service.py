@@ -0,0 +1,165 @@
+import asyncio
+import time
+from dataclasses import dataclass
+from datetime import UTC, datetime
+
+import numpy as np
+import pandas as pd
+
+from aquant.core.logger import Logger
+from aquant.domains.trade.entity import OHLCVSeries
+from aquant.domains.trade.service.trade_service import TradeService
+from aquant.domains.trade.utils.buckets import bucket_end, time_bucket
+from aquant.domains.trade.utils.enums import TimescaleIntervalEnum
+
+
+@dataclass(slots=True)
+class _CachedBars:
+    closed: OHLCVSeries
+    start_ns: int
+    closed_until_ns: int
+    lock: asyncio.Lock
+
+
+class TradeOHLCVCacheService:
+    """
+    Bucket-aligned cache of OHLCV bars keyed by (ticker, interval).
+
+    Closed buckets are decoded and stored once, as an OHLCVSeries. Each call only asks the server
+    for bars from the last closed boundary onward, replaces the still-open bar
+    and returns the cached closed bars merged with the fresh ones. Windows that
+    end before the last closed boundary are answered without a request.
+    """
+
+    def __init__(
+        self, logger: Logger, trade_service: TradeService, max_bars: int = 100_000
+    ) -> None:
+        self.logger = logger
+        self.trade_service = trade_service
+        self.max_bars = max_bars
+        self._entries: dict[tuple[str, TimescaleIntervalEnum], _CachedBars] = {}
+
+    async def get_ohlcv(
+        self,
+        ticker: str,
+        interval: TimescaleIntervalEnum,
+        start_time: datetime,
+        end_time: datetime | None = None,
+        as_series: bool = False,
+    ) -> pd.DataFrame | OHLCVSeries:
+        """
+        Returns the bars of `ticker` between `start_time` and `end_time`.
+
+        Args:
+            ticker (str): Ticker symbol.
+            interval (TimescaleIntervalEnum): Bar interval.
+            start_time (datetime): Start of the window (naive datetimes are UTC).
+            end_time (Optional[datetime]): End of the window. Defaults to now.
+            as_series (bool): If True, returns the bars as an OHLCVSeries.
+
+        Returns:
+            pd.DataFrame | OHLCVSeries: Bars with the same columns as
+            `get_trades(..., ohlcv=True)`.
+
+        Raises:
+            ValueError: If a parameter is missing or start_time > end_time.
+        """
+        if not ticker or not isinstance(interval, TimescaleIntervalEnum):
+            raise ValueError("Both 'ticker' and 'interval' are required to cache bars.")
+        if start_time is None:
+            raise ValueError("'start_time' is required to cache bars.")
+
+        now_ns = time.time_ns()
+        start_ns = self._to_ns(start_time)
+        end_ns = self._to_ns(end_time) if end_time is not None else now_ns
+        if start_ns > end_ns:
+            raise ValueError("start_time cannot be greater than end_time.")
+
+        window_start_ns = int(time_bucket(np.array([start_ns]), interval)[0])
+        key = (ticker, interval)
+        entry = self._entries.get(key)
+        if entry is None or window_start_ns < entry.start_ns:
+            entry = _CachedBars(
+                closed=OHLCVSeries(),
+                start_ns=window_start_ns,
+                closed_until_ns=window_start_ns,
+                lock=asyncio.Lock(),
+            )
+            self._entries[key] = entry
+
+        async with entry.lock:
+            if end_ns < entry.closed_until_ns:
+                self.logger.debug(f"Serving {ticker} {interval.name} bars from cache")
+                bars = self._window(entry.closed, window_start_ns, end_ns)
+                return bars if as_series else bars.to_dataframe()
+
+            fresh = await self.trade_service.get_trades(
+                ticker=ticker,
+                interval=interval,
+                start_time=self._to_datetime(entry.closed_until_ns),
+                end_time=self._to_datetime(end_ns),
+                ohlcv=True,
+                as_series=True,
+            )
+            open_bars = self._store_closed(entry, fresh, interval, min(now_ns, end_ns))
+
+            merged = OHLCVSeries.concat([entry.closed, open_bars])
+            bars = self._window(merged, window_start_ns, end_ns)
+            return bars if as_series else bars.to_dataframe()
+
+    def invalidate(
+        self, ticker: str | None = None, interval: TimescaleIntervalEnum | None = None
+    ) -> None:
+        """Drops cached bars, optionally only for one ticker and/or interval."""
+        for key in list(self._entries):
+            if (ticker is None or key[0] == ticker) and (
+                interval is None or key[1] == interval
+            ):
+                del self._entries[key]
+
+    def _store_closed(
+        self,
+        entry: _CachedBars,
+        fresh: OHLCVSeries,
+        interval: TimescaleIntervalEnum,
+        boundary_ns: int,
+    ) -> OHLCVSeries:
+        """Moves the closed bars of `fresh` into the cache and returns the rest."""
+        closed_until_ns = int(time_bucket(np.array([boundary_ns]), interval)[0])
+        if not len(fresh):
+            entry.closed_until_ns = max(entry.closed_until_ns, closed_until_ns)
+            return fresh
+
+        fresh = fresh.sort_by_time()
+        ts = fresh.records["timestamp"]
+        closed = (bucket_end(ts, interval) <= closed_until_ns) & (
+            ts >= entry.closed_until_ns
+        )
+
+        if closed.any():
+            entry.closed = OHLCVSeries.concat([entry.closed, fresh[closed]])
+            if len(entry.closed) > self.max_bars:
+                entry.closed = OHLCVSeries(
+                    entry.closed.records[-self.max_bars :].copy()
+                )
+                entry.start_ns = int(entry.closed.records["timestamp"][0])
+        entry.closed_until_ns = max(entry.closed_until_ns, closed_until_ns)
+        return fresh[ts >= entry.closed_until_ns]
+
+    @staticmethod
+    def _window(bars: OHLCVSeries, start_ns: int, end_ns: int) -> OHLCVSeries:
+        ts = bars.records["timestamp"]
+        lo = np.searchsorted(ts, start_ns, side="left")
+        hi = np.searchsorted(ts, end_ns, side="right")
+        return bars[lo:hi]
+
+    @staticmethod
+    def _to_ns(dt: datetime) -> int:
+        ts = pd.Timestamp(dt)
+        if ts.tzinfo is not None:
+            ts = ts.tz_convert(UTC).tz_localize(None)
+        return int(ts.as_unit("ns").value)
+
+    @staticmethod
+    def _to_datetime(ns: int) -> datetime:
+        return pd.Timestamp(ns, unit="ns").floor("us").to_pydatetime()
@@ -1,7 +1,13 @@
+import numpy as np
 import pandas as pd
 
 from aquant.core.logger import Logger
 from aquant.domains.trade.entity import OpenHighLowCloseVolume
+from aquant.domains.trade.utils.reducers import (
+    group_trades,
+    reduce_ohlcv,
+    segment_starts,
+)
 
 
 class TradeOHLCVCalcService:
@@ -13,41 +19,104 @@ class TradeOHLCVCalcService:
             return df.iloc[0]["price"]
         except Exception as e:
             self.logger.error(f"Error trying to calculate ohlcv - open. Error : {e}")
+            raise ValueError(f"Error trying to calculate ohlcv - open: {e}") from e
 
     def calculate_high(self, df: pd.DataFrame) -> float:
         try:
             return df["price"].max()
         except Exception as e:
-            self.logger.error(f"Error trying to calculate ohlcv - open. Error : {e}")
+            self.logger.error(f"Error trying to calculate ohlcv - high. Error : {e}")
+            raise ValueError(f"Error trying to calculate ohlcv - high: {e}") from e
 
     def calculate_low(self, df: pd.DataFrame) -> float:
         try:
             return df["price"].min()
         except Exception as e:
-            self.logger.error(f"Error trying to calculate ohlcv - open. Error : {e}")
+            self.logger.error(f"Error trying to calculate ohlcv - low. Error : {e}")
+            raise ValueError(f"Error trying to calculate ohlcv - low: {e}") from e
 
     def calculate_close(self, df: pd.DataFrame) -> float:
         try:
             return df.iloc[-1]["price"]
         except Exception as e:
-            self.logger.error(f"Error trying to calculate ohlcv - open. Error : {e}")
+            self.logger.error(f"Error trying to calculate ohlcv - close. Error : {e}")
+            raise ValueError(f"Error trying to calculate ohlcv - close: {e}") from e
 
     def calculate_volume(self, df: pd.DataFrame) -> float:
         try:
             return df["quantity"].sum()
         except Exception as e:
-            self.logger.error(f"Error trying to calculate ohlcv - open. Error : {e}")
+            self.logger.error(f"Error trying to calculate ohlcv - volume. Error : {e}")
+            raise ValueError(f"Error trying to calculate ohlcv - volume: {e}") from e
 
     def calculate_ohlcv(self, df: pd.DataFrame) -> OpenHighLowCloseVolume:
         try:
             ohlcv = OpenHighLowCloseVolume(
-                open=self.calculate_open(df),
-                high=self.calculate_high(df),
-                low=self.calculate_low(df),
-                close=self.calculate_close(df),
+                ticker=df["ticker"].iloc[0],
+                timestamp=df["event_time"].iloc[0],
+                open_price=self.calculate_open(df),
+                high_price=self.calculate_high(df),
+                low_price=self.calculate_low(df),
+                close_price=self.calculate_close(df),
                 volume=self.calculate_volume(df),
             )
             return ohlcv
         except Exception as e:
             self.logger.error(f"Error trying to calculate OHLCV: {e}")
-            return []
+            raise ValueError(f"Error trying to calculate OHLCV: {e}") from e
+
+    def calculate_ohlcv_by_ticker(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Computes OHLCV, VWAP, trade count and buy/sell volume for every ticker.
+
+        The frame is sorted once by ticker and time and every statistic is taken
+        with `np.*.reduceat` over the ticker segments, so an asset-wide frame
+        costs a single sort-and-reduce pass.
+
+        Args:
+            df (pd.DataFrame): Trades with 'ticker', 'event_time', 'price',
+                'quantity' and 'side' columns, as returned by `get_trades`.
+
+        Returns:
+            pd.DataFrame: One row per ticker with the columns ticker, open, high,
+            low, close, volume, vwap, trades, buy_volume and sell_volume.
+
+        Raises:
+            ValueError: If a required column is missing.
+        """
+        missing = {"ticker", "event_time", "price", "quantity", "side"} - set(
+            df.columns
+        )
+        if missing:
+            raise ValueError(f"Trade frame is missing columns: {sorted(missing)}")
+
+        rows, codes, tickers, _ = group_trades(df)
+        price = df["price"].to_numpy(dtype=np.float64)[rows]
+        quantity = df["quantity"].to_numpy(dtype=np.float64)[rows]
+        side = df["side"].to_numpy()[rows]
+
+        starts = segment_starts(codes)
+        reduced = reduce_ohlcv(starts, price, quantity)
+        if len(starts):
+            buy_volume = np.add.reduceat(np.where(side == "B", quantity, 0.0), starts)
+            sell_volume = np.add.reduceat(np.where(side == "S", quantity, 0.0), starts)
+        else:
+            buy_volume = sell_volume = np.empty(0, dtype=np.float64)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            vwap = reduced["notional"] / reduced["volume"]
+
+        return pd.DataFrame(
+            {
+                "ticker": np.asarray(tickers, dtype=object)[codes[starts]],
+                "open": reduced["open"],
+                "high": reduced["high"],
+                "low": reduced["low"],
+                "close": reduced["close"],
+                "volume": reduced["volume"],
+                "vwap": vwap,
+                "trades": reduced["trades"],
+                "buy_volume": buy_volume,
+                "sell_volume": sell_volume,
+            }
+        )
@@ -0,0 +1,165 @@
+import numpy as np
+import pandas as pd
+
+from aquant.core.logger import Logger
+from aquant.domains.trade.utils.buckets import (
+    interval_months,
+    interval_nanoseconds,
+    time_bucket,
+)
+from aquant.domains.trade.utils.dictionaries import BarColumnsList
+from aquant.domains.trade.utils.enums import TimescaleIntervalEnum
+from aquant.domains.trade.utils.reducers import (
+    group_trades,
+    reduce_ohlcv,
+    segment_starts,
+)
+
+_DAY_NS = 86_400 * 1_000_000_000
+
+
+class TradeOHLCVResampleService:
+    """
+    Client-side OHLCV resampling of raw trade frames.
+
+    A trade frame (any number of tickers) is sorted once by ticker and time,
+    and each requested interval is reduced with `np.*.reduceat` over sorted
+    bucket boundaries. Whenever a coarser interval is aligned with a finer
+    one already computed (every fine bucket falls entirely inside one coarse
+    bucket), it is derived from the finer bars instead of the trades, so each
+    extra interval costs O(bars) rather than O(trades).
+
+    Buckets follow TimescaleDB's `time_bucket` origins, matching the bars
+    returned by `get_trades(..., ohlcv=True)`.
+    """
+
+    def __init__(self, logger: Logger) -> None:
+        self.logger = logger
+
+    def resample(
+        self, trades: pd.DataFrame, intervals: list[TimescaleIntervalEnum]
+    ) -> dict[TimescaleIntervalEnum, pd.DataFrame]:
+        """
+        Builds OHLCV bars for several intervals in one pass over the trades.
+
+        Args:
+            trades (pd.DataFrame): Trades with 'ticker', 'event_time', 'price'
+                and 'quantity' columns, as returned by `get_trades`. Rows without
+                a price or a ticker are ignored.
+            intervals (list[TimescaleIntervalEnum]): Intervals to produce.
+
+        Returns:
+            dict[TimescaleIntervalEnum, pd.DataFrame]: One frame per interval in
+            BarColumnsList layout, sorted by ticker and timestamp.
+
+        Raises:
+            ValueError: If an interval is invalid or a required column is missing.
+        """
+        for interval in intervals:
+            if not isinstance(interval, TimescaleIntervalEnum):
+                raise ValueError(
+                    f"Expected 'intervals' to contain TimescaleIntervalEnum values, but got {type(interval)}"
+                )
+        missing = {"ticker", "event_time", "price", "quantity"} - set(trades.columns)
+        if missing:
+            raise ValueError(f"Trade frame is missing columns: {sorted(missing)}")
+
+        rows, codes, tickers, ts = group_trades(trades)
+        price = trades["price"].to_numpy(dtype=np.float64)[rows]
+        quantity = trades["quantity"].to_numpy(dtype=np.float64)[rows]
+
+        computed: dict[TimescaleIntervalEnum, tuple[np.ndarray, np.ndarray, dict]] = {}
+        for interval in sorted(set(intervals), key=self._granularity):
+            source = self._finest_aligned_source(interval, computed)
+            if source is None:
+                buckets = time_bucket(ts, interval)
+                starts = segment_starts(codes, buckets)
+                reduced = reduce_ohlcv(starts, price, quantity)
+                computed[interval] = (codes[starts], buckets[starts], reduced)
+            else:
+                computed[interval] = self._derive(computed[source], interval)
+            self.logger.debug(
+                f"Resampled {interval.name} from {source.name if source else 'trades'}"
+            )
+
+        return {
+            interval: self._to_frame(tickers, *computed[interval])
+            for interval in intervals
+        }
+
+    def _derive(
+        self,
+        fine: tuple[np.ndarray, np.ndarray, dict],
+        interval: TimescaleIntervalEnum,
+    ) -> tuple[np.ndarray, np.ndarray, dict]:
+        fine_codes, fine_buckets, bars = fine
+        buckets = time_bucket(fine_buckets, interval)
+        starts = segment_starts(fine_codes, buckets)
+        if len(starts) == 0:
+            return fine_codes, buckets, bars
+
+        bounds = np.append(starts, len(fine_codes))
+        reduced = {
+            "open": bars["open"][starts],
+            "high": np.maximum.reduceat(bars["high"], starts),
+            "low": np.minimum.reduceat(bars["low"], starts),
+            "close": bars["close"][bounds[1:] - 1],
+            "volume": np.add.reduceat(bars["volume"], starts),
+            "notional": np.add.reduceat(bars["notional"], starts),
+            "trades": np.add.reduceat(bars["trades"], starts),
+        }
+        return fine_codes[starts], buckets[starts], reduced
+
+    def _finest_aligned_source(
+        self, interval: TimescaleIntervalEnum, computed: dict
+    ) -> TimescaleIntervalEnum | None:
+        # `computed` is filled from fine to coarse, so the last aligned interval
+        # is the coarsest one available and yields the fewest rows to reduce.
+        source = None
+        for candidate in computed:
+            if self._is_aligned(candidate, interval):
+                source = candidate
+        return source
+
+    @staticmethod
+    def _is_aligned(fine: TimescaleIntervalEnum, coarse: TimescaleIntervalEnum) -> bool:
+        fine_ns, coarse_ns = interval_nanoseconds(fine), interval_nanoseconds(coarse)
+        fine_months, coarse_months = interval_months(fine), interval_months(coarse)
+
+        if fine_ns is not None and coarse_ns is not None:
+            return coarse_ns % fine_ns == 0
+        if fine_ns is not None and coarse_months is not None:
+            # Fixed buckets start at midnight, so they never straddle a month
+            # boundary as long as they evenly divide a day.
+            return _DAY_NS % fine_ns == 0
+        if fine_months is not None and coarse_months is not None:
+            return coarse_months % fine_months == 0
+        return False
+
+    @staticmethod
+    def _granularity(interval: TimescaleIntervalEnum) -> int:
+        width = interval_nanoseconds(interval)
+        if width is not None:
+            return width
+        return interval_months(interval) * 31 * _DAY_NS
+
+    @staticmethod
+    def _to_frame(
+        tickers: np.ndarray, codes: np.ndarray, buckets: np.ndarray, reduced: dict
+    ) -> pd.DataFrame:
+        with np.errstate(invalid="ignore", divide="ignore"):
+            vwap = reduced["notional"] / reduced["volume"]
+        return pd.DataFrame(
+            {
+                "ticker": np.asarray(tickers, dtype=object)[codes],
+                "timestamp": buckets.view("datetime64[ns]"),
+                "open": reduced["open"],
+                "high": reduced["high"],
+                "low": reduced["low"],
+                "close": reduced["close"],
+                "volume": reduced["volume"],
+                "vwap": vwap,
+                "trades": reduced["trades"],
+            },
+            columns=BarColumnsList,
+        )
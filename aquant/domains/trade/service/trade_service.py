@@ -2,9 +2,12 @@ from datetime import datetime
 
 import pandas as pd
 
+from aquant.core.executors import DecodeExecutor
 from aquant.core.logger import Logger
+from aquant.core.metrics import Metrics, NullMetrics
+from aquant.core.utils import SingleFlight
 from aquant.domains.trade.codecs import TradeParserService, TradePayloadBuilderService
-from aquant.domains.trade.entity import OpenHighLowCloseVolume
+from aquant.domains.trade.entity import OHLCVSeries, OpenHighLowCloseVolume
 from aquant.domains.trade.utils.enums import TimescaleIntervalEnum
 from aquant.infra.nats import NatsClient, NatsSubjects
 
@@ -16,11 +19,17 @@ class TradeService:
         nats_client: NatsClient,
         trade_payload_builder_service: TradePayloadBuilderService,
         trade_parser_service: TradeParserService,
+        single_flight: SingleFlight | None = None,
+        decode_executor: DecodeExecutor | None = None,
+        metrics: Metrics | None = None,
     ) -> None:
         self.logger = logger
         self.nats_client = nats_client
         self.trade_payload_builder_service = trade_payload_builder_service
         self.trade_parser_service = trade_parser_service
+        self.single_flight = single_flight or SingleFlight()
+        self.decode_executor = decode_executor or DecodeExecutor()
+        self.metrics = metrics or NullMetrics()
 
     async def get_trades(
         self,
@@ -30,24 +39,29 @@ class TradeService:
         start_time: datetime | None = None,
         end_time: datetime | None = None,
         ohlcv: bool | None = False,
-    ) -> pd.DataFrame | OpenHighLowCloseVolume:
+        as_series: bool = False,
+    ) -> pd.DataFrame | OHLCVSeries | OpenHighLowCloseVolume:
         try:
             subject = NatsSubjects.MARKETDATA_TRADE_REQUEST.value
-            payload = self.trade_payload_builder_service.trade_payload_builder(
-                ticker=ticker,
-                interval=interval,
-                asset=asset,
-                start_time=start_time,
-                end_time=end_time,
-                ohlcv=ohlcv,
-            )
-            message = self.trade_parser_service.encode(message=payload)
-            response = await self.nats_client.request(subject, message, timeout=20)
+            operation = "get_ohlcv" if ohlcv else "get_trades"
+            with self.metrics.stage(operation, "build_payload"):
+                payload = self.trade_payload_builder_service.trade_payload_builder(
+                    ticker=ticker,
+                    interval=interval,
+                    asset=asset,
+                    start_time=start_time,
+                    end_time=end_time,
+                    ohlcv=ohlcv,
+                )
+            with self.metrics.stage(operation, "encode") as stage:
+                message = self.trade_parser_service.encode(message=payload)
+                stage.nbytes = len(message)
 
-            if not ohlcv:
-                return self.trade_parser_service.decode_trades_into_dataframe(response)
-
-            return self.trade_parser_service.decode_ohlcv_into_dataframe(response)
+            # Identical concurrent requests share one round trip and one decode.
+            return await self.single_flight.do(
+                (subject, message, ohlcv, as_series),
+                lambda: self._request(subject, message, ohlcv, as_series),
+            )
 
         except Exception as e:
             params = {
@@ -61,3 +75,23 @@ class TradeService:
                 f"Error trying to fetch trades or open high low close volume with the parameters provided: {params}, due: {e}"
             )
             raise e
+
+    async def _request(
+        self, subject: str, message: bytes, ohlcv: bool, as_series: bool
+    ) -> pd.DataFrame | OHLCVSeries:
+        operation = "get_ohlcv" if ohlcv else "get_trades"
+        with self.metrics.stage(operation, "request") as stage:
+            response = await self.nats_client.request(subject, message, timeout=20)
+            stage.nbytes = len(response)
+
+        if not ohlcv:
+            decode = self.trade_parser_service.decode_trades_into_dataframe
+        elif as_series:
+            decode = self.trade_parser_service.decode_ohlcv_into_series
+        else:
+            decode = self.trade_parser_service.decode_ohlcv_into_dataframe
+
+        # Large replies are decoded off the event loop.
+        with self.metrics.stage(operation, "decode") as stage:
+            stage.nbytes = len(response)
+            return await self.decode_executor.run(decode, response)
@@ -0,0 +1,62 @@
+from aquant.core.logger import Logger
+from aquant.domains.trade.codecs import TradeBinaryCodec
+from aquant.domains.trade.stream import TradeSubscription
+from aquant.domains.trade.utils.enums import OverflowPolicyEnum
+from aquant.infra.nats import NatsClient, NatsSubjects
+
+
+class TradeStreamService:
+    """
+    Service responsible for live trade subscriptions over NATS.
+    """
+
+    def __init__(
+        self,
+        logger: Logger,
+        nats_client: NatsClient,
+        trade_codec: TradeBinaryCodec,
+    ) -> None:
+        self.logger = logger
+        self.nats_client = nats_client
+        self.trade_codec = trade_codec
+
+    def subscribe_trades(
+        self,
+        tickers: list[str],
+        max_batch_size: int = 1000,
+        max_latency_ms: float = 50.0,
+        max_queue_size: int = 64,
+        overflow_policy: OverflowPolicyEnum = OverflowPolicyEnum.DROP_OLDEST,
+    ) -> TradeSubscription:
+        """
+        Builds a subscription delivering micro-batches of trades for the tickers.
+
+        Args:
+            tickers (list[str]): Tickers to subscribe to.
+            max_batch_size (int): Flush a batch once this many trades are buffered.
+            max_latency_ms (float): Flush a non-empty batch at least this often.
+            max_queue_size (int): Maximum number of undelivered batches.
+            overflow_policy (OverflowPolicyEnum): Behaviour when the queue is full.
+
+        Returns:
+            TradeSubscription: Async iterator of trade DataFrames.
+
+        Raises:
+            ValueError: If no ticker is provided or the limits are invalid.
+        """
+        if not tickers or not all(isinstance(t, str) and t for t in tickers):
+            raise ValueError("Expected 'tickers' to be a non-empty list of strings.")
+
+        base = NatsSubjects.MARKETDATA_TRADE_STREAM.value
+        subjects = [f"{base}.{ticker}" for ticker in dict.fromkeys(tickers)]
+
+        return TradeSubscription(
+            logger=self.logger,
+            nats_client=self.nats_client,
+            trade_codec=self.trade_codec,
+            subjects=subjects,
+            max_batch_size=max_batch_size,
+            max_latency_ms=max_latency_ms,
+            max_queue_size=max_queue_size,
+            overflow_policy=overflow_policy,
+        )
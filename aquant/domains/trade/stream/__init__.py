@@ -0,0 +1,4 @@
+from .trade_bar_aggregator import TradeBarAggregator
+from .trade_subscription import TradeSubscription
+
+__all__ = ["TradeBarAggregator", "TradeSubscription"]
@@ -0,0 +1,172 @@
+import numpy as np
+import pandas as pd
+
+from aquant.domains.trade.utils.buckets import bucket_end, time_bucket
+from aquant.domains.trade.utils.dictionaries import BarColumnsList
+from aquant.domains.trade.utils.enums import TimescaleIntervalEnum
+from aquant.domains.trade.utils.reducers import (
+    group_trades,
+    reduce_ohlcv,
+    segment_starts,
+)
+
+# Positions inside the per-ticker bar state list.
+_BUCKET, _OPEN, _HIGH, _LOW, _CLOSE, _VOLUME, _NOTIONAL, _TRADES = range(8)
+
+
+class TradeBarAggregator:
+    """
+    Incremental OHLCV bar builder for live trade batches.
+
+    Keeps one open bar per ticker for the given interval. Each call to `update`
+    reduces the batch with `np.*.reduceat` (one segment per ticker and bucket)
+    and folds the segments into the open bars, so the cost per trade is O(1)
+    regardless of how long the aggregator has been running. Bars are emitted
+    once a later bucket starts for the same ticker, or when `advance` moves the
+    clock past their bucket end.
+
+    Trades older than a ticker's open bar are ignored and counted in
+    `late_trades`.
+
+    Example:
+        ```python
+        bars = TradeBarAggregator(TimescaleIntervalEnum.MINUTE_1)
+        async with aquant.subscribe_trades(["PETR4"]) as trades:
+            async for batch in trades:
+                completed = bars.update(batch)
+                current = bars.partial_bars()
+        ```
+    """
+
+    def __init__(self, interval: TimescaleIntervalEnum) -> None:
+        if not isinstance(interval, TimescaleIntervalEnum):
+            raise ValueError(
+                f"Expected 'interval' to be a TimescaleIntervalEnum value, but got {type(interval)}"
+            )
+        self.interval = interval
+        self.late_trades = 0
+        self._bars: dict[str, list] = {}
+
+    def update(self, trades: pd.DataFrame) -> pd.DataFrame:
+        """
+        Folds a batch of trades into the open bars.
+
+        Args:
+            trades (pd.DataFrame): Trades with 'ticker', 'event_time', 'price'
+                and 'quantity' columns, as returned by `get_trades` or a
+                trade subscription.
+
+        Returns:
+            pd.DataFrame: Bars completed by this batch, in BarColumnsList layout.
+        """
+        if trades.empty:
+            return self._to_frame([])
+
+        rows, codes, tickers, ts = group_trades(trades, sort=False)
+        price = trades["price"].to_numpy(dtype=np.float64)[rows]
+        quantity = trades["quantity"].to_numpy(dtype=np.float64)[rows]
+
+        buckets = time_bucket(ts, self.interval)
+        starts = segment_starts(codes, buckets)
+        reduced = reduce_ohlcv(starts, price, quantity)
+
+        segments = zip(
+            codes[starts].tolist(),
+            buckets[starts].tolist(),
+            reduced["open"].tolist(),
+            reduced["high"].tolist(),
+            reduced["low"].tolist(),
+            reduced["close"].tolist(),
+            reduced["volume"].tolist(),
+            reduced["notional"].tolist(),
+            reduced["trades"].tolist(),
+            strict=True,
+        )
+
+        completed = []
+        for code, bucket, o, h, lo, c, v, notional, n in segments:
+            ticker = tickers[code]
+            bar = self._bars.get(ticker)
+            if bar is None or bucket > bar[_BUCKET]:
+                if bar is not None:
+                    completed.append((ticker, *bar))
+                self._bars[ticker] = [bucket, o, h, lo, c, v, notional, n]
+            elif bucket == bar[_BUCKET]:
+                bar[_HIGH] = max(bar[_HIGH], h)
+                bar[_LOW] = min(bar[_LOW], lo)
+                bar[_CLOSE] = c
+                bar[_VOLUME] += v
+                bar[_NOTIONAL] += notional
+                bar[_TRADES] += n
+            else:
+                self.late_trades += n
+
+        return self._to_frame(completed)
+
+    def advance(self, now: pd.Timestamp | np.datetime64) -> pd.DataFrame:
+        """
+        Closes every open bar whose bucket ends at or before `now`.
+
+        Use it on a timer so bars close even when a ticker stops trading.
+
+        Args:
+            now (pd.Timestamp | np.datetime64): Current time (naive UTC).
+
+        Returns:
+            pd.DataFrame: The bars that were closed.
+        """
+        if not self._bars:
+            return self._to_frame([])
+
+        now_ns = pd.Timestamp(now).as_unit("ns").value
+        tickers = list(self._bars)
+        starts = np.fromiter(
+            (self._bars[t][_BUCKET] for t in tickers),
+            dtype=np.int64,
+            count=len(tickers),
+        )
+        closed = bucket_end(starts, self.interval) <= now_ns
+
+        completed = []
+        for ticker in np.asarray(tickers, dtype=object)[closed]:
+            completed.append((ticker, *self._bars.pop(ticker)))
+        return self._to_frame(completed)
+
+    def flush(self) -> pd.DataFrame:
+        """Closes and returns every open bar, e.g. at the end of a session."""
+        completed = [(ticker, *bar) for ticker, bar in self._bars.items()]
+        self._bars.clear()
+        return self._to_frame(completed)
+
+    def partial_bars(self) -> pd.DataFrame:
+        """Returns the still-open bar of every ticker, without closing them."""
+        return self._to_frame([(ticker, *bar) for ticker, bar in self._bars.items()])
+
+    def _to_frame(self, rows: list[tuple]) -> pd.DataFrame:
+        if not rows:
+            return pd.DataFrame(
+                {
+                    "ticker": pd.Series(dtype=object),
+                    "timestamp": pd.Series(dtype="datetime64[ns]"),
+                    **{c: pd.Series(dtype=np.float64) for c in BarColumnsList[2:-1]},
+                    "trades": pd.Series(dtype=np.int64),
+                }
+            )
+
+        ticker, bucket, o, h, lo, c, v, notional, n = zip(*rows, strict=True)
+        volume = np.asarray(v, dtype=np.float64)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            vwap = np.asarray(notional, dtype=np.float64) / volume
+        return pd.DataFrame(
+            {
+                "ticker": ticker,
+                "timestamp": np.asarray(bucket, dtype=np.int64).view("datetime64[ns]"),
+                "open": o,
+                "high": h,
+                "low": lo,
+                "close": c,
+                "volume": volume,
+                "vwap": vwap,
+                "trades": np.asarray(n, dtype=np.int64),
+            }
+        )
@@ -0,0 +1,200 @@
+import asyncio
+
+import pandas as pd
+
+from aquant.core.logger import Logger
+from aquant.domains.trade.codecs import TradeBinaryCodec
+from aquant.domains.trade.utils.enums import OverflowPolicyEnum
+from aquant.infra.nats import NatsClient
+
+_CLOSED = object()
+
+
+class TradeSubscription:
+    """
+    Async iterator over micro-batches of live trades.
+
+    Binary trade records received from NATS are buffered as raw bytes and decoded
+    in a single vectorized pass by `TradeBinaryCodec` once `max_batch_size` trades
+    have accumulated or every `max_latency_ms`, whichever comes first. Each batch
+    is a columnar `pd.DataFrame` with the same columns returned by `get_trades`.
+
+    Batches are delivered through a bounded queue owned by this subscription;
+    `overflow_policy` decides what happens when the consumer falls behind.
+    Trades still buffered when the subscription is closed are delivered as a
+    last batch before the iteration ends.
+
+    Example:
+        ```python
+        async with aquant.subscribe_trades(["PETR4", "VALE3"]) as trades:
+            async for batch in trades:
+                print(batch)
+        ```
+    """
+
+    def __init__(
+        self,
+        logger: Logger,
+        nats_client: NatsClient,
+        trade_codec: TradeBinaryCodec,
+        subjects: list[str],
+        max_batch_size: int = 1000,
+        max_latency_ms: float = 50.0,
+        max_queue_size: int = 64,
+        overflow_policy: OverflowPolicyEnum = OverflowPolicyEnum.DROP_OLDEST,
+    ) -> None:
+        if max_batch_size <= 0:
+            raise ValueError("max_batch_size must be greater than zero.")
+        if max_latency_ms <= 0:
+            raise ValueError("max_latency_ms must be greater than zero.")
+        if max_queue_size <= 0:
+            raise ValueError("max_queue_size must be greater than zero.")
+
+        self._logger = logger
+        self._nats_client = nats_client
+        self._trade_codec = trade_codec
+        self._subjects = subjects
+        self._record_size = trade_codec.DTYPE.itemsize
+        self._max_batch_size = max_batch_size
+        self._max_latency = max_latency_ms / 1000
+        self._overflow_policy = overflow_policy
+
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue_size)
+        self._buffer: list[bytes] = []
+        self._buffered = 0
+        self._subscriptions = []
+        self._flusher: asyncio.Task | None = None
+        self._started = False
+        self._closed = False
+
+        self.delivered_batches = 0
+        self.dropped_batches = 0
+        self.discarded_messages = 0
+
+    async def start(self) -> None:
+        """Subscribes to every subject; called implicitly on first iteration."""
+        if self._started or self._closed:
+            return
+        self._started = True
+        for subject in self._subjects:
+            subscription = await self._nats_client.subscribe(subject, self._on_message)
+            self._subscriptions.append(subscription)
+        self._flusher = asyncio.create_task(self._flush_periodically())
+        self._logger.debug(f"Trade subscription started on {self._subjects}")
+
+    async def aclose(self) -> None:
+        """
+        Unsubscribes from NATS and ends the iteration.
+
+        Trades buffered but not yet flushed are decoded and queued as a last
+        batch. It is queued without waiting for room, since the consumer may
+        already be gone: a full queue applies `overflow_policy`, dropping the
+        oldest batch under `OverflowPolicyEnum.BLOCK`.
+        """
+        if self._closed:
+            return
+        self._closed = True
+
+        if self._flusher is not None:
+            self._flusher.cancel()
+        for subscription in self._subscriptions:
+            try:
+                await subscription.unsubscribe()
+            except Exception as e:
+                self._logger.warning(f"Error unsubscribing trade subscription: {e}")
+        self._subscriptions.clear()
+
+        batch = self._take_batch()
+        if batch is not None:
+            self._offer(batch)
+        # The sentinel wakes a consumer waiting on an empty queue; with a full
+        # queue nobody waits, and the iteration ends once it is drained.
+        if not self._queue.full():
+            self._queue.put_nowait(_CLOSED)
+        self._logger.debug(f"Trade subscription closed on {self._subjects}")
+
+    async def _on_message(self, subject: str, data: bytes, reply: str) -> None:
+        if self._closed or not data:
+            return
+        if len(data) % self._record_size != 0:
+            self.discarded_messages += 1
+            self._logger.warning(
+                f"Discarding message from {subject}: {len(data)} bytes is not a "
+                f"multiple of {self._record_size}"
+            )
+            return
+
+        self._buffer.append(data)
+        self._buffered += len(data) // self._record_size
+        if self._buffered >= self._max_batch_size:
+            await self._flush()
+
+    async def _flush_periodically(self) -> None:
+        while not self._closed:
+            await asyncio.sleep(self._max_latency)
+            if self._buffer:
+                await self._flush()
+
+    async def _flush(self) -> None:
+        batch = self._take_batch()
+        if batch is not None:
+            await self._deliver(batch)
+
+    def _take_batch(self) -> pd.DataFrame | None:
+        chunks = self._buffer
+        self._buffer = []
+        self._buffered = 0
+        if not chunks:
+            return None
+
+        try:
+            return self._trade_codec.parse_trades_binary_to_dataframe(b"".join(chunks))
+        except Exception as e:
+            self._logger.error(f"Error decoding live trade batch: {e}")
+            return None
+
+    async def _deliver(self, batch: pd.DataFrame) -> None:
+        if self._closed:
+            return
+
+        if self._overflow_policy is OverflowPolicyEnum.BLOCK:
+            await self._queue.put(batch)
+            self.delivered_batches += 1
+        else:
+            self._offer(batch)
+
+    def _offer(self, batch: pd.DataFrame) -> None:
+        """Queues `batch` without waiting; a full queue drops by `overflow_policy`."""
+        if not self._queue.full():
+            self._queue.put_nowait(batch)
+        elif self._overflow_policy is OverflowPolicyEnum.DROP_NEWEST:
+            self.dropped_batches += 1
+            self._logger.warning("Trade subscription queue full, dropping newest batch")
+            return
+        else:
+            self._queue.get_nowait()
+            self._queue.put_nowait(batch)
+            self.dropped_batches += 1
+            self._logger.warning("Trade subscription queue full, dropping oldest batch")
+
+        self.delivered_batches += 1
+
+    def __aiter__(self) -> "TradeSubscription":
+        return self
+
+    async def __anext__(self) -> pd.DataFrame:
+        await self.start()
+        if self._closed and self._queue.empty():
+            raise StopAsyncIteration
+
+        batch = await self._queue.get()
+        if batch is _CLOSED:
+            raise StopAsyncIteration
+        return batch
+
+    async def __aenter__(self) -> "TradeSubscription":
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
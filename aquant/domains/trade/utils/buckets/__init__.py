@@ -0,0 +1,3 @@
+from .time_bucket import bucket_end, interval_months, interval_nanoseconds, time_bucket
+
+__all__ = ["bucket_end", "interval_months", "interval_nanoseconds", "time_bucket"]
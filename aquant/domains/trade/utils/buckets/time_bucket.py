@@ -0,0 +1,114 @@
+import numpy as np
+
+from aquant.domains.trade.utils.enums import TimescaleIntervalEnum
+
+_MINUTE_NS = 60 * 1_000_000_000
+_HOUR_NS = 60 * _MINUTE_NS
+_DAY_NS = 24 * _HOUR_NS
+
+_FIXED_INTERVALS_NS = {
+    TimescaleIntervalEnum.MINUTE_1: _MINUTE_NS,
+    TimescaleIntervalEnum.MINUTE_5: 5 * _MINUTE_NS,
+    TimescaleIntervalEnum.MINUTE_15: 15 * _MINUTE_NS,
+    TimescaleIntervalEnum.MINUTE_30: 30 * _MINUTE_NS,
+    TimescaleIntervalEnum.HOUR_1: _HOUR_NS,
+    TimescaleIntervalEnum.HOUR_2: 2 * _HOUR_NS,
+    TimescaleIntervalEnum.HOUR_4: 4 * _HOUR_NS,
+    TimescaleIntervalEnum.HOUR_6: 6 * _HOUR_NS,
+    TimescaleIntervalEnum.HOUR_8: 8 * _HOUR_NS,
+    TimescaleIntervalEnum.HOUR_12: 12 * _HOUR_NS,
+    TimescaleIntervalEnum.DAY_1: _DAY_NS,
+    TimescaleIntervalEnum.DAY_3: 3 * _DAY_NS,
+    TimescaleIntervalEnum.DAY_5: 5 * _DAY_NS,
+    TimescaleIntervalEnum.DAY_7: 7 * _DAY_NS,
+    TimescaleIntervalEnum.DAY_15: 15 * _DAY_NS,
+}
+
+_CALENDAR_INTERVALS_MONTHS = {
+    TimescaleIntervalEnum.MONTH_1: 1,
+    TimescaleIntervalEnum.MONTH_3: 3,
+    TimescaleIntervalEnum.MONTH_6: 6,
+    TimescaleIntervalEnum.YEAR_1: 12,
+}
+
+# Same origins as TimescaleDB's time_bucket, so client-side buckets line up with
+# the bars computed by the server.
+_FIXED_ORIGIN_NS = int(np.datetime64("2000-01-03", "ns").astype(np.int64))
+_CALENDAR_ORIGIN_MONTHS = int(np.datetime64("2000-01", "M").astype(np.int64))
+
+
+def interval_nanoseconds(interval: TimescaleIntervalEnum) -> int | None:
+    """
+    Returns the fixed width of an interval in nanoseconds.
+
+    Calendar intervals (months and years) have no fixed width and return None.
+    """
+    return _FIXED_INTERVALS_NS.get(interval)
+
+
+def interval_months(interval: TimescaleIntervalEnum) -> int | None:
+    """Returns the width of a calendar interval in months, or None."""
+    return _CALENDAR_INTERVALS_MONTHS.get(interval)
+
+
+def time_bucket(
+    timestamps_ns: np.ndarray, interval: TimescaleIntervalEnum
+) -> np.ndarray:
+    """
+    Maps nanosecond epoch timestamps to the start of their bucket.
+
+    Args:
+        timestamps_ns (np.ndarray): int64 nanoseconds since epoch (UTC).
+        interval (TimescaleIntervalEnum): Bucket width.
+
+    Returns:
+        np.ndarray: int64 bucket starts, in nanoseconds since epoch.
+    """
+    ts = np.asarray(timestamps_ns, dtype=np.int64)
+
+    width = _FIXED_INTERVALS_NS.get(interval)
+    if width is not None:
+        return (ts - _FIXED_ORIGIN_NS) // width * width + _FIXED_ORIGIN_NS
+
+    months = _CALENDAR_INTERVALS_MONTHS.get(interval)
+    if months is None:
+        raise ValueError(f"Unsupported interval: {interval}")
+
+    ts_months = ts.view("datetime64[ns]").astype("datetime64[M]").astype(np.int64)
+    bucket_months = (
+        ts_months - _CALENDAR_ORIGIN_MONTHS
+    ) // months * months + _CALENDAR_ORIGIN_MONTHS
+    return _months_to_ns(bucket_months)
+
+
+def bucket_end(
+    bucket_starts_ns: np.ndarray, interval: TimescaleIntervalEnum
+) -> np.ndarray:
+    """
+    Returns the exclusive end of each bucket, i.e. the start of the next one.
+
+    Args:
+        bucket_starts_ns (np.ndarray): int64 bucket starts from `time_bucket`.
+        interval (TimescaleIntervalEnum): Bucket width.
+
+    Returns:
+        np.ndarray: int64 bucket ends, in nanoseconds since epoch.
+    """
+    starts = np.asarray(bucket_starts_ns, dtype=np.int64)
+
+    width = _FIXED_INTERVALS_NS.get(interval)
+    if width is not None:
+        return starts + width
+
+    months = _CALENDAR_INTERVALS_MONTHS.get(interval)
+    if months is None:
+        raise ValueError(f"Unsupported interval: {interval}")
+
+    start_months = (
+        starts.view("datetime64[ns]").astype("datetime64[M]").astype(np.int64)
+    )
+    return _months_to_ns(start_months + months)
+
+
+def _months_to_ns(months: np.ndarray) -> np.ndarray:
+    return months.astype("datetime64[M]").astype("datetime64[ns]").astype(np.int64)
@@ -0,0 +1,3 @@
+from .bar_columns_list import BarColumnsList
+
+__all__ = ["BarColumnsList"]
@@ -0,0 +1,11 @@
+BarColumnsList = [
+    "ticker",
+    "timestamp",
+    "open",
+    "high",
+    "low",
+    "close",
+    "volume",
+    "vwap",
+    "trades",
+]
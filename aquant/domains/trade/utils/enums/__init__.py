@@ -1,4 +1,5 @@
 from .actions import Actions
+from .overflow_policy_enum import OverflowPolicyEnum
 from .timescale_interval_enum import TimescaleIntervalEnum
 
-__all__ = ["Actions", "TimescaleIntervalEnum"]
+__all__ = ["Actions", "OverflowPolicyEnum", "TimescaleIntervalEnum"]
@@ -0,0 +1,9 @@
+from enum import Enum
+
+
+class OverflowPolicyEnum(Enum):
+    """What a subscription does when its delivery queue is full."""
+
+    DROP_OLDEST = "drop_oldest"
+    DROP_NEWEST = "drop_newest"
+    BLOCK = "block"
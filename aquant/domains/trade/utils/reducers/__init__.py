@@ -0,0 +1,8 @@
+from .segment_reducer import (
+    group_time_order,
+    group_trades,
+    reduce_ohlcv,
+    segment_starts,
+)
+
+__all__ = ["group_time_order", "group_trades", "reduce_ohlcv", "segment_starts"]
@@ -0,0 +1,124 @@
+import numpy as np
+import pandas as pd
+
+
+def group_time_order(codes: np.ndarray, timestamps: np.ndarray) -> np.ndarray:
+    """
+    Returns the permutation sorting rows by group code, then by timestamp.
+
+    Trade replies usually arrive in time order; in that case a stable sort on
+    the (small) group codes alone is enough and much cheaper than a lexsort.
+
+    Args:
+        codes (np.ndarray): Non-negative integer group codes (e.g. from
+            `pd.factorize` once rows with a missing key are dropped).
+        timestamps (np.ndarray): int64 timestamps of each row.
+
+    Returns:
+        np.ndarray: Indices that sort the rows by (code, timestamp).
+
+    Raises:
+        ValueError: If a code is negative (the -1 `pd.factorize` gives NaN keys).
+    """
+    if codes.min(initial=0) < 0:
+        raise ValueError("Group codes must be non-negative; drop missing keys first.")
+    if len(timestamps) < 2 or np.all(timestamps[1:] >= timestamps[:-1]):
+        # Narrow codes let numpy use a radix sort for the stable argsort.
+        narrow = codes.astype(np.min_scalar_type(max(int(codes.max(initial=0)), 0)))
+        return np.argsort(narrow, kind="stable")
+    return np.lexsort((timestamps, codes))
+
+
+def group_trades(
+    trades: pd.DataFrame, sort: bool = True
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Orders the usable rows of a trade frame by ticker, then by event time.
+
+    Rows without a price or a ticker are dropped; the remaining tickers are
+    mapped to dense codes with `pd.factorize` and sorted with
+    `group_time_order`.
+
+    Args:
+        trades (pd.DataFrame): Trades with 'ticker', 'event_time' and 'price'
+            columns.
+        sort (bool): If True, codes follow the sorted tickers; otherwise the
+            order in which tickers first appear.
+
+    Returns:
+        tuple: `rows`, positions in `trades` of the kept rows in group order
+        (select any other column with `column.to_numpy()[rows]`); `codes`,
+        the ticker code of each of those rows; `tickers`, the ticker of each
+        code; and `timestamps`, their int64 event times.
+    """
+    price = trades["price"].to_numpy(dtype=np.float64)
+    valid = ~np.isnan(price) & trades["ticker"].notna().to_numpy()
+    rows = np.flatnonzero(valid)
+    codes, tickers = pd.factorize(trades["ticker"].to_numpy()[rows], sort=sort)
+    ts = trades["event_time"].to_numpy(dtype="datetime64[ns]")[rows].view(np.int64)
+
+    order = group_time_order(codes, ts)
+    return rows[order], codes[order], tickers, ts[order]
+
+
+def segment_starts(*keys: np.ndarray) -> np.ndarray:
+    """
+    Returns the positions where a run of equal keys begins.
+
+    All keys must have the same length and already be sorted so that equal
+    key tuples are contiguous.
+
+    Args:
+        *keys (np.ndarray): Grouping columns (e.g. ticker codes, bucket starts).
+
+    Returns:
+        np.ndarray: int64 indices of the first row of every segment.
+    """
+    size = len(keys[0])
+    if size == 0:
+        return np.empty(0, dtype=np.int64)
+
+    boundary = np.zeros(size, dtype=bool)
+    boundary[0] = True
+    for key in keys:
+        boundary[1:] |= key[1:] != key[:-1]
+    return np.flatnonzero(boundary)
+
+
+def reduce_ohlcv(
+    starts: np.ndarray, price: np.ndarray, quantity: np.ndarray
+) -> dict[str, np.ndarray]:
+    """
+    Reduces contiguous segments of trades into OHLCV values with `np.*.reduceat`.
+
+    Args:
+        starts (np.ndarray): Segment start indices from `segment_starts`.
+        price (np.ndarray): float64 trade prices, ordered by segment then time.
+        quantity (np.ndarray): float64 trade quantities, in the same order.
+
+    Returns:
+        dict[str, np.ndarray]: Columns 'open', 'high', 'low', 'close', 'volume',
+        'notional' (sum of price * quantity) and 'trades', one row per segment.
+    """
+    if len(starts) == 0:
+        empty = np.empty(0, dtype=np.float64)
+        return {
+            "open": empty,
+            "high": empty,
+            "low": empty,
+            "close": empty,
+            "volume": empty,
+            "notional": empty,
+            "trades": np.empty(0, dtype=np.int64),
+        }
+
+    bounds = np.append(starts, len(price))
+    return {
+        "open": price[starts],
+        "high": np.maximum.reduceat(price, starts),
+        "low": np.minimum.reduceat(price, starts),
+        "close": price[bounds[1:] - 1],
+        "volume": np.add.reduceat(quantity, starts),
+        "notional": np.add.reduceat(price * quantity, starts),
+        "trades": np.diff(bounds),
+    }
@@ -0,0 +1,77 @@
+from collections import deque
+
+import numpy as np
+
+
+class LatencyTracker:
+    """
+    Sliding-window request latency per subject.
+
+    Keeps the last `window` successful latencies (in seconds) of every subject
+    and derives percentiles and adaptive deadlines from them. Percentiles are
+    only reported once `min_samples` latencies were recorded.
+    """
+
+    __slots__ = (
+        "window",
+        "min_samples",
+        "deadline_percentile",
+        "deadline_multiplier",
+        "min_deadline",
+        "_samples",
+    )
+
+    def __init__(
+        self,
+        window: int = 256,
+        min_samples: int = 20,
+        deadline_percentile: float = 0.99,
+        deadline_multiplier: float = 3.0,
+        min_deadline: float = 0.25,
+    ) -> None:
+        self.window = window
+        self.min_samples = min_samples
+        self.deadline_percentile = deadline_percentile
+        self.deadline_multiplier = deadline_multiplier
+        self.min_deadline = min_deadline
+        self._samples: dict[str, deque[float]] = {}
+
+    def record(self, subject: str, seconds: float) -> None:
+        samples = self._samples.get(subject)
+        if samples is None:
+            samples = self._samples[subject] = deque(maxlen=self.window)
+        samples.append(seconds)
+
+    def percentile(self, subject: str, q: float) -> float | None:
+        """Returns the q-quantile (0..1) latency of `subject`, or None without enough samples."""
+        samples = self._samples.get(subject)
+        if samples is None or len(samples) < self.min_samples:
+            return None
+        return float(np.quantile(np.fromiter(samples, dtype=np.float64), q))
+
+    def deadline(self, subject: str, timeout: float) -> float:
+        """
+        Returns the deadline for the next request on `subject`.
+
+        The deadline is `deadline_multiplier` times the `deadline_percentile`
+        latency, never below `min_deadline` and never above `timeout`, which is
+        also used until enough samples exist.
+        """
+        latency = self.percentile(subject, self.deadline_percentile)
+        if latency is None:
+            return timeout
+        return min(timeout, max(self.min_deadline, latency * self.deadline_multiplier))
+
+    def snapshot(self) -> dict[str, dict[str, float]]:
+        """Returns count, p50, p95 and p99 latency per subject."""
+        result = {}
+        for subject, samples in self._samples.items():
+            values = np.fromiter(samples, dtype=np.float64)
+            p50, p95, p99 = np.quantile(values, [0.5, 0.95, 0.99])
+            result[subject] = {
+                "count": len(values),
+                "p50": float(p50),
+                "p95": float(p95),
+                "p99": float(p99),
+            }
+        return result
@@ -1,17 +1,54 @@
 import asyncio
+import functools
 import ssl
+import time
+from collections import Counter
 
 from nats.aio.client import Client as Nats
 from nats.aio.errors import ErrNoServers
 from nats.errors import TimeoutError
 
 from aquant.core.logger import Logger
+from aquant.infra.nats.latency_tracker import LatencyTracker
 from aquant.infra.nats.nats_interface import NatsInterface
 
 
+@functools.cache
+def _tls_context() -> ssl.SSLContext:
+    """Builds the client TLS context once per process; it is immutable after setup."""
+    tls_context = ssl.create_default_context()
+    tls_context.check_hostname = False
+    tls_context.verify_mode = ssl.CERT_NONE
+    return tls_context
+
+
 class NatsClient(NatsInterface):
+    """
+    NATS client with per-subject latency tracking.
+
+    Every successful request records its latency. With `adaptive_deadlines`,
+    the timeout passed to `request` becomes a ceiling and the actual deadline
+    is derived from the subject's p99 latency. With `hedge_requests`, a
+    duplicate request is sent once the subject's p95 latency has elapsed and
+    the first reply wins; hedges are limited to `max_hedge_ratio` of requests.
+
+    One client is shared by every service of an Aquant instance, so requests
+    in flight are counted per subject (`inflight`, `peak_inflight`).
+
+    With `lazy_connect`, `connect` is deferred until the first request,
+    subscription or publish.
+    """
+
     def __init__(
-        self, logger: Logger, servers: list[str], user: str = None, password: str = None
+        self,
+        logger: Logger,
+        servers: list[str],
+        user: str = None,
+        password: str = None,
+        adaptive_deadlines: bool = False,
+        hedge_requests: bool = False,
+        max_hedge_ratio: float = 0.05,
+        lazy_connect: bool = False,
     ) -> None:
         self.logger = logger
         self.servers = servers
@@ -19,12 +56,22 @@ class NatsClient(NatsInterface):
         self.password = password
         self.nc = Nats()
         self.reconnect_attempts = 3
+        self.latency = LatencyTracker()
+        self.adaptive_deadlines = adaptive_deadlines
+        self.hedge_requests = hedge_requests
+        self.max_hedge_ratio = max_hedge_ratio
+        self.hedged_requests = 0
+        self._hedge_budget = 0.0
+        self.inflight: Counter[str] = Counter()
+        self.peak_inflight: Counter[str] = Counter()
+        self.lazy_connect = lazy_connect
+        self._connect_lock: asyncio.Lock | None = None
+        self._has_connected = False
+        self._closed = False
 
     async def connect(self):
         """Tenta conectar ao NATS com reconexão automática."""
-        tls_context = ssl.create_default_context()
-        tls_context.check_hostname = False
-        tls_context.verify_mode = ssl.CERT_NONE
+        tls_context = _tls_context()
         for attempt in range(self.reconnect_attempts):
             try:
                 await self.nc.connect(
@@ -35,6 +82,7 @@ class NatsClient(NatsInterface):
                     connect_timeout=5,
                     tls_handshake_first=True,
                 )
+                self._has_connected = True
                 self.logger.debug(
                     f"Connected to NATS servers on attempt {attempt + 1}."
                 )
@@ -48,15 +96,37 @@ class NatsClient(NatsInterface):
                 else:
                     raise ErrNoServers from e
 
+    async def ensure_connected(self):
+        """
+        Connects a lazy client on first use; concurrent callers share one attempt.
+
+        It connects at most once: eager clients connect in `create`, reconnects
+        after a dropped connection are left to nats-py, and a closed client
+        stays closed.
+        """
+        if not self.lazy_connect or self._has_connected or self._closed:
+            return
+        if self._connect_lock is None:
+            self._connect_lock = asyncio.Lock()
+        async with self._connect_lock:
+            if not self._has_connected and not self._closed:
+                await self.connect()
+
     async def subscribe(self, subject: str, callback):
-        """Inscreve-se em um tópico e define um callback para processar mensagens."""
+        """
+        Inscreve-se em um tópico e define um callback para processar mensagens.
+
+        Returns the underlying subscription so callers can unsubscribe later.
+        """
 
         async def message_handler(msg):
             await callback(msg.subject, msg.data, msg.reply)
 
+        await self.ensure_connected()
         try:
-            await self.nc.subscribe(subject, cb=message_handler)
+            subscription = await self.nc.subscribe(subject, cb=message_handler)
             self.logger.debug(f"Subscribed to topic: {subject}")
+            return subscription
         except Exception as e:
             self.logger.error(f"Cannot subscribe to NATS: {e}")
             raise Exception from e
@@ -66,6 +136,7 @@ class NatsClient(NatsInterface):
         try:
             if isinstance(message, str):
                 message = message.encode()
+            await self.ensure_connected()
             await self.nc.publish(subject, message)
             self.logger.debug(f"📤 Message published to {subject}")
         except Exception as e:
@@ -78,9 +149,15 @@ class NatsClient(NatsInterface):
             if isinstance(message, str):
                 message = message.encode()
 
-            response = await self.nc.request(subject, message, timeout=timeout)
+            await self.ensure_connected()
 
-            return response.data
+            if self.adaptive_deadlines:
+                timeout = self.latency.deadline(subject, timeout)
+
+            if self.hedge_requests:
+                return await self._hedged_request(subject, message, timeout)
+
+            return await self._timed_request(subject, message, timeout)
 
         except TimeoutError as e:
             self.logger.error(f"Request to {subject} timed out.")
@@ -89,7 +166,57 @@ class NatsClient(NatsInterface):
             self.logger.error(f"Error in request-response: {e}")
             raise Exception from e
 
+    async def _timed_request(self, subject: str, message: bytes, timeout: float):
+        self.inflight[subject] += 1
+        self.peak_inflight[subject] = max(
+            self.peak_inflight[subject], self.inflight[subject]
+        )
+        try:
+            started = time.perf_counter()
+            response = await self.nc.request(subject, message, timeout=timeout)
+            self.latency.record(subject, time.perf_counter() - started)
+            return response.data
+        finally:
+            self.inflight[subject] -= 1
+
+    async def _hedged_request(self, subject: str, message: bytes, timeout: float):
+        """Sends a duplicate request after the p95 latency; the first reply wins."""
+        self._hedge_budget = min(self._hedge_budget + self.max_hedge_ratio, 10.0)
+        delay = self.latency.percentile(subject, 0.95)
+        if delay is None or delay >= timeout:
+            return await self._timed_request(subject, message, timeout)
+
+        primary = asyncio.ensure_future(self._timed_request(subject, message, timeout))
+        pending = {primary}
+        try:
+            done, _ = await asyncio.wait(pending, timeout=delay)
+            if done or self._hedge_budget < 1.0:
+                return await primary
+
+            self._hedge_budget -= 1.0
+            self.hedged_requests += 1
+            self.logger.debug(f"Hedging request to {subject} after {delay:.3f}s")
+            pending.add(
+                asyncio.ensure_future(
+                    self._timed_request(subject, message, timeout - delay)
+                )
+            )
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+            return primary.result()
+        finally:
+            for task in pending:
+                task.cancel()
+
     async def close(self):
         """Fecha a conexão com o NATS."""
+        self._closed = True
+        if self.nc.is_closed or not self._has_connected:
+            return
         await self.nc.close()
         self.logger.debug("🔌 NATS connection closed.")
@@ -6,3 +6,4 @@ class NatsSubjects(Enum):
     MARKETDATA_BROKER_REQUEST = "marketdata.broker.request"
     MARKETDATA_SECURITY_REQUEST = "marketdata.security.request"
     MARKETDATA_TRADE_REQUEST = "marketdata.trade.request"
+    MARKETDATA_TRADE_STREAM = "marketdata.trade.stream"
@@ -1,10 +1,24 @@
+from __future__ import annotations
+
+import asyncio
+import time
 from datetime import datetime
+from typing import TYPE_CHECKING
+
+from aquant.core.executors import ExecutorKindEnum
+from aquant.domains.trade.utils.enums import OverflowPolicyEnum, TimescaleIntervalEnum
 
-import pandas as pd
+if TYPE_CHECKING:
+    # Heavy dependencies (pandas, dependency_injector, nats, redis, pydantic) are
+    # imported when an Aquant is created, not when the package is imported.
+    import pandas as pd
 
-from aquant.core.dependencies.containers import AquantContainer
-from aquant.domains.trade.entity import OpenHighLowCloseVolume
-from aquant.domains.trade.utils.enums import TimescaleIntervalEnum
+    from aquant.core.metrics import MetricsSinkInterface
+    from aquant.core.profiling import SDKProfiler
+    from aquant.domains.security.entity import ExpiryIndex, Security
+    from aquant.domains.trade.analytics import TradeTape
+    from aquant.domains.trade.entity import OHLCVSeries, OpenHighLowCloseVolume
+    from aquant.domains.trade.stream import TradeSubscription
 
 
 class Aquant:
@@ -18,6 +32,8 @@ class Aquant:
         container (AquantContainer): The dependency injection container for managing services.
         marketdata: Service for accessing market data functionalities.
         trade: Service for accessing trade-related functionalities.
+        metrics (Metrics): Per-stage latency histograms of the SDK calls (see `metrics_sinks`).
+        security_master (SecurityMasterService): Local security master with indexed lookups.
 
     Args:
         redis_url (str): The connection URL for the Redis server.
@@ -26,15 +42,19 @@ class Aquant:
         nats_password (str): Password for NATS authentication.
         redis_use_tls (bool, optional): Indicates whether to use TLS for Redis connections. Defaults to True.
 
+    Instances created with identical connection settings on the same event loop share
+    one NATS connection and one Redis pool (see `share_connections`). Close them with
+    `aclose()` or use the instance as an async context manager.
+
     Example:
         ```python
-        aquant = Aquant(
+        async with Aquant(
             redis_url="redis://localhost:6379",
             nats_servers=["nats://localhost:4222"],
             nats_user="your_nats_user",
             nats_password="..."
-        )
-        await aquant.initialize()
+        ) as aquant:
+            trades = await aquant.get_trades(ticker="PETR4", start_time=start_time)
         ```
     """
 
@@ -45,6 +65,17 @@ class Aquant:
         nats_user: str,
         nats_password: str,
         redis_use_tls: bool = False,
+        nats_adaptive_deadlines: bool = False,
+        nats_hedge_requests: bool = False,
+        lazy_connect: bool = False,
+        share_connections: bool = True,
+        decode_executor: ExecutorKindEnum = ExecutorKindEnum.THREAD,
+        decode_threshold_bytes: int = 1 << 20,
+        parallel_decode_workers: int = 0,
+        metrics_sinks: list[MetricsSinkInterface] | None = None,
+        security_cache_ttl: float = 3600.0,
+        security_batch_requests: bool = False,
+        security_snapshot_path: str | None = None,
     ) -> None:
         """
         Initializes the Aquant instance with the provided configuration.
@@ -58,13 +89,83 @@ class Aquant:
             nats_user (str): Username for NATS authentication.
             nats_password (str): Password for NATS authentication.
             redis_use_tls (bool, optional): Indicates whether to use TLS for Redis connections. Defaults to True.
+            nats_adaptive_deadlines (bool, optional): Derives NATS request deadlines from the
+                observed per-subject p99 latency (the fixed timeouts become ceilings). Defaults to False.
+            nats_hedge_requests (bool, optional): Sends a duplicate NATS request once the subject's
+                p95 latency has elapsed and uses the first reply, for at most 5% extra requests.
+                Defaults to False.
+            lazy_connect (bool, optional): Defers the NATS connection until the first request
+                or subscription instead of connecting in `create`. Defaults to False.
+            share_connections (bool, optional): Reuses the connections of other open Aquant
+                instances with identical settings on the same event loop. Defaults to True.
+            decode_executor (ExecutorKindEnum, optional): Pool that decodes large replies off
+                the event loop (threads or processes). Defaults to ExecutorKindEnum.THREAD.
+            decode_threshold_bytes (int, optional): Replies of at least this size are decoded
+                in the pool; smaller ones inline. Defaults to 1 MiB.
+            parallel_decode_workers (int, optional): Splits trade replies of 32 MiB or more
+                across this many processes through shared memory. 0 disables it. Defaults to 0.
+            metrics_sinks (list[MetricsSinkInterface], optional): Receive the per-stage timings
+                and byte counts of every call (see `aquant.core.metrics`). Without sinks,
+                instrumentation is a no-op. Defaults to None.
+            security_cache_ttl (float, optional): Seconds after which securities held by the
+                local security master are fetched again (see `get_securities(use_cache=True)`).
+                Defaults to 3600.
+            security_batch_requests (bool, optional): `get_securities_many` sends up to 500
+                tickers per request ('get_securities_by_tickers' action) instead of one
+                request per ticker. Enable it when the server supports the action; rejected
+                batches fall back to single requests. Defaults to False.
+            security_snapshot_path (str, optional): Security master snapshot file
+                (see `save_security_snapshot`). When it exists, lookups are served
+                from it, memory-mapped and shared with every process that opens it,
+                instead of being requested; once older than `security_cache_ttl` it
+                is refreshed in the background. Defaults to None.
         """
+        started = time.perf_counter()
+        from aquant.core.dependencies.containers import AquantContainer
+
+        self.startup_timings: dict[str, float] = {}
+        self._initialized = False
+        self._share_connections = share_connections
+        self._session_key = (
+            redis_url,
+            redis_use_tls,
+            tuple(nats_servers),
+            nats_user,
+            nats_password,
+            nats_adaptive_deadlines,
+            nats_hedge_requests,
+            lazy_connect,
+            ExecutorKindEnum(decode_executor),
+            decode_threshold_bytes,
+            parallel_decode_workers,
+            tuple(metrics_sinks or ()),
+            security_cache_ttl,
+            security_batch_requests,
+            security_snapshot_path,
+        )
         self.container = AquantContainer()
         self.container.config.redis_url.from_value(redis_url)
         self.container.config.redis_use_tls.from_value(redis_use_tls)
         self.container.config.nats_servers.from_value(nats_servers)
         self.container.config.nats_user.from_value(nats_user)
         self.container.config.nats_password.from_value(nats_password)
+        self.container.config.nats_adaptive_deadlines.from_value(
+            nats_adaptive_deadlines
+        )
+        self.container.config.nats_hedge_requests.from_value(nats_hedge_requests)
+        self.container.config.nats_lazy_connect.from_value(lazy_connect)
+        self.container.config.decode_executor.from_value(decode_executor)
+        self.container.config.decode_threshold_bytes.from_value(decode_threshold_bytes)
+        self.container.config.parallel_decode_workers.from_value(
+            parallel_decode_workers
+        )
+        self.container.config.metrics_sinks.from_value(list(metrics_sinks or ()))
+        self.container.config.security_cache_ttl.from_value(security_cache_ttl)
+        self.container.config.security_batch_requests.from_value(
+            security_batch_requests
+        )
+        self.container.config.security_snapshot_path.from_value(security_snapshot_path)
+        self.startup_timings["container"] = time.perf_counter() - started
 
     @classmethod
     async def create(
@@ -74,6 +175,17 @@ class Aquant:
         nats_user: str,
         nats_password: str,
         redis_use_tls: bool = False,
+        nats_adaptive_deadlines: bool = False,
+        nats_hedge_requests: bool = False,
+        lazy_connect: bool = False,
+        share_connections: bool = True,
+        decode_executor: ExecutorKindEnum = ExecutorKindEnum.THREAD,
+        decode_threshold_bytes: int = 1 << 20,
+        parallel_decode_workers: int = 0,
+        metrics_sinks: list[MetricsSinkInterface] | None = None,
+        security_cache_ttl: float = 3600.0,
+        security_batch_requests: bool = False,
+        security_snapshot_path: str | None = None,
     ):
         """
         Factory asynchronous method for create and initialize one Aquant instance
@@ -84,6 +196,19 @@ class Aquant:
             nats_user (str): Username for NATS authentication.
             nats_password (str): Password for NATS authentication.
             redis_use_tls (bool, optional): Indicates whether to use TLS for Redis connections. Defaults to True.
+            nats_adaptive_deadlines (bool, optional): See `Aquant.__init__`. Defaults to False.
+            nats_hedge_requests (bool, optional): See `Aquant.__init__`. Defaults to False.
+            lazy_connect (bool, optional): See `Aquant.__init__`. Defaults to False.
+            share_connections (bool, optional): See `Aquant.__init__`. Defaults to True.
+            decode_executor (ExecutorKindEnum, optional): See `Aquant.__init__`.
+                Defaults to ExecutorKindEnum.THREAD.
+            decode_threshold_bytes (int, optional): See `Aquant.__init__`. Defaults to 1 MiB.
+            parallel_decode_workers (int, optional): See `Aquant.__init__`. Defaults to 0.
+            metrics_sinks (list[MetricsSinkInterface], optional): See `Aquant.__init__`.
+                Defaults to None.
+            security_cache_ttl (float, optional): See `Aquant.__init__`. Defaults to 3600.
+            security_batch_requests (bool, optional): See `Aquant.__init__`. Defaults to False.
+            security_snapshot_path (str, optional): See `Aquant.__init__`. Defaults to None.
         Returns:
             Aquant: One Aquant instance initialized.
         """
@@ -93,49 +218,182 @@ class Aquant:
             nats_user,
             nats_password,
             redis_use_tls,
+            nats_adaptive_deadlines,
+            nats_hedge_requests,
+            lazy_connect,
+            share_connections,
+            decode_executor,
+            decode_threshold_bytes,
+            parallel_decode_workers,
+            metrics_sinks,
+            security_cache_ttl,
+            security_batch_requests,
+            security_snapshot_path,
         )
 
         await self._initialize()
         return self
 
+    async def __aenter__(self) -> Aquant:
+        if not self._initialized:
+            await self._initialize()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
+
     async def _initialize(self):
         """
-        Initializes and wires the necessary services.
+        Initializes the resources and the services.
 
-        This asynchronous method wires the dependency injection container and
-        initializes the market data and trade services for subsequent operations.
+        All container resources (the shared NATS connection and the Redis pool) are
+        brought up concurrently, then the services are resolved. The duration of each
+        phase is stored in `startup_timings` (seconds): 'container', 'resources',
+        'services' and 'total'.
 
         Example:
             ```python
             await aquant.initialize()
             ```
         """
-        self.container.wire(modules=[__name__])
-        self.marketdata = await self.container.marketdata.marketdata_service()
-        self.trade = await self.container.trade.trade_service()
+        from aquant.core.utils import maybe_await
+
+        started = time.perf_counter()
+        if self._share_connections:
+            from aquant.core.dependencies.registry import container_registry
+
+            own_container = self.container
+            self.container = await container_registry.acquire(
+                self._session_key, lambda: own_container
+            )
+        else:
+            await maybe_await(self.container.init_resources())
+        self._initialized = True
+        resources_ready = time.perf_counter()
+
+        (
+            self.marketdata,
+            self.trade,
+            self.trade_stream,
+            self.trade_ohlcv_cache,
+            self.broker,
+            self.broker_flow,
+            self.security,
+            self.security_master,
+        ) = await asyncio.gather(
+            maybe_await(self.container.marketdata.marketdata_service()),
+            maybe_await(self.container.trade.trade_service()),
+            maybe_await(self.container.trade.trade_stream_service()),
+            maybe_await(self.container.trade.trade_ohlcv_cache_service()),
+            maybe_await(self.container.broker.broker_service()),
+            maybe_await(self.container.broker.broker_flow_service()),
+            maybe_await(self.container.security.security_service()),
+            maybe_await(self.container.security.security_master_service()),
+        )
         self.trade_payload_builder_service = (
             self.container.trade.trade_payload_builder_service()
         )
         self.trade_parser_service = self.container.trade.trade_parser_service()
+        self.metrics = self.container.metrics()
         self.open_high_low_close_volume = (
             self.container.open_high_low_close_volume.open_high_low_close_volume_service()
         )
-        self.broker = await self.container.broker.broker_service()
-        self.security = await self.container.security.security_service()
+        self.open_high_low_close_volume_resample = (
+            self.container.open_high_low_close_volume.open_high_low_close_volume_resample_service()
+        )
+        services_ready = time.perf_counter()
+
+        self.startup_timings["resources"] = resources_ready - started
+        self.startup_timings["services"] = services_ready - resources_ready
+        self.startup_timings["total"] = (
+            self.startup_timings.get("container", 0.0) + services_ready - started
+        )
+
+    async def aclose(self) -> None:
+        """
+        Releases the connections of this instance.
+
+        Shared connections are shut down when the last instance using them is closed.
+        Calling it more than once is a no-op.
+
+        Example:
+            ```python
+            await aquant.aclose()
+            ```
+        """
+        if not self._initialized:
+            return
+        self._initialized = False
+
+        if self._share_connections:
+            from aquant.core.dependencies.registry import container_registry
+
+            await container_registry.release(self._session_key)
+        else:
+            from aquant.core.utils import maybe_await
+
+            await maybe_await(self.container.shutdown_resources())
 
     def shutdown(self):
         """
-        Unwires and cleans up resources.
+        Schedules `aclose()` on the running event loop.
 
-        This method unwires the dependency injection container, effectively
-        releasing any resources held by the services.
+        Kept for backwards compatibility; prefer `await aquant.aclose()` or
+        `async with`, which wait until the connections are closed. Called
+        without a running loop, it unwires the container synchronously, as it
+        always did; the connections are then left to `aclose()`.
 
         Example:
             ```python
             aquant.shutdown()
             ```
         """
-        self.container.unwire()
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.container.unwire()
+            return
+        self._closing = loop.create_task(self.aclose())
+
+    def profile(
+        self,
+        name: str | None = None,
+        output_dir: str | None = None,
+        top: int = 25,
+        trace_memory: bool = True,
+    ) -> SDKProfiler:
+        """
+        Profiles the SDK calls made inside a block or a decorated function.
+
+        Captures a cProfile of the calling thread, the peak traced memory and
+        the top allocation sites, and the time spent in every SDK stage (see
+        `metrics_sinks`). Works without any metrics sink configured.
+
+        Args:
+            name (str | None): Label of the report and of the dumped files.
+            output_dir (str | None): Directory for `<name>-<timestamp>.prof` and
+                `.txt`; nothing is written when None.
+            top (int): Number of functions and allocation sites in the summary.
+            trace_memory (bool): Trace allocations with tracemalloc. It slows
+                allocation-heavy decodes down several times; disable it to
+                profile time only.
+
+        Returns:
+            SDKProfiler: A context manager (sync or async) and decorator; the
+            result is in its `report` after the block.
+
+        Example:
+            ```python
+            with aquant.profile("asset-pull", output_dir="profiles") as profiler:
+                df = await aquant.get_trades(asset="PETR", start_time=start_time)
+            print(profiler.report.summary())
+            ```
+        """
+        from aquant.core.profiling import SDKProfiler
+
+        return SDKProfiler(
+            getattr(self, "metrics", None), name, output_dir, top, trace_memory
+        )
 
     def get_current_order_book(
         self, tickers: list[str], max_entries: int = 20
@@ -165,11 +423,15 @@ class Aquant:
         start_time: datetime | None = None,
         end_time: datetime | None = None,
         ohlcv: bool = False,
-    ) -> pd.DataFrame | OpenHighLowCloseVolume:
+        use_cache: bool = False,
+        as_series: bool = False,
+    ) -> pd.DataFrame | OHLCVSeries | OpenHighLowCloseVolume:
         """
         Retrieves all trades within the specified time range.
 
         This asynchronous method fetches trade data based on the provided parameters.
+        With `use_cache=True` (OHLCV by ticker and interval only), closed bars are kept
+        locally and only the bars from the last closed bucket onward are requested again.
 
         Args:
             ticker (Optional[str]): The ticker symbol for the asset.
@@ -178,13 +440,18 @@ class Aquant:
             start_time (Optional[datetime]): The beginning of the time range for fetching trades.
             end_time (Optional[datetime]): The end of the time range for fetching trades.
             ohlcv (bool): If True, returns OHLCV (Open-High-Low-Close-Volume) data instead of raw trade data.
+            use_cache (bool): If True, serves OHLCV bars through the bucket-aligned bar cache.
+            as_series (bool): If True (with 'ohlcv'), returns an array-backed OHLCVSeries
+                instead of a DataFrame.
 
         Returns:
             Optional[pd.DataFrame]: A DataFrame containing trade data or None if invalid parameters are provided.
             OpenHighLowCloseVolume: A class containing ohlcv results or None if an error has raised.
+            OHLCVSeries: The OHLCV bars backed by a single structured array, when 'as_series' is set.
 
         Raises:
             ValueError: If neither 'ticker' nor 'asset' is provided, or if start_time > end_time.
+            ValueError: If 'use_cache' is set without 'ohlcv', 'ticker', 'interval' and 'start_time'.
 
         Example:
             ```python
@@ -204,6 +471,19 @@ class Aquant:
         if start_time and end_time and start_time > end_time:
             raise ValueError("start_time cannot be greater than end_time.")
 
+        if use_cache:
+            if not (ohlcv and ticker and interval and start_time) or asset:
+                raise ValueError(
+                    "'use_cache' requires 'ohlcv', 'ticker', 'interval' and 'start_time', and no 'asset'."
+                )
+            return await self.trade_ohlcv_cache.get_ohlcv(
+                ticker=ticker,
+                interval=interval,
+                start_time=start_time,
+                end_time=end_time,
+                as_series=as_series,
+            )
+
         return await self.trade.get_trades(
             ticker=ticker,
             interval=interval,
@@ -211,6 +491,50 @@ class Aquant:
             start_time=start_time,
             end_time=end_time,
             ohlcv=ohlcv,
+            as_series=as_series,
+        )
+
+    def subscribe_trades(
+        self,
+        tickers: list[str],
+        max_batch_size: int = 1000,
+        max_latency_ms: float = 50.0,
+        max_queue_size: int = 64,
+        overflow_policy: OverflowPolicyEnum = OverflowPolicyEnum.DROP_OLDEST,
+    ) -> TradeSubscription:
+        """
+        Subscribes to live trades for the specified tickers.
+
+        Incoming binary trades are decoded in micro-batches: a batch is flushed
+        every `max_batch_size` trades or every `max_latency_ms` milliseconds, and
+        is delivered as a DataFrame with the same columns as `get_trades`.
+
+        Args:
+            tickers (list[str]): A list of ticker symbols to subscribe to.
+            max_batch_size (int): Maximum number of trades per batch.
+            max_latency_ms (float): Maximum time a trade waits before its batch is flushed.
+            max_queue_size (int): Maximum number of undelivered batches kept for this subscriber.
+            overflow_policy (OverflowPolicyEnum): What to do when the queue is full. Defaults to DROP_OLDEST.
+
+        Returns:
+            TradeSubscription: An async iterator (and async context manager) of trade DataFrames.
+
+        Raises:
+            ValueError: If 'tickers' is empty or the limits are invalid.
+
+        Example:
+            ```python
+            async with aquant.subscribe_trades(["PETR4", "VALE3"]) as trades:
+                async for batch in trades:
+                    print(batch)
+            ```
+        """
+        return self.trade_stream.subscribe_trades(
+            tickers,
+            max_batch_size=max_batch_size,
+            max_latency_ms=max_latency_ms,
+            max_queue_size=max_queue_size,
+            overflow_policy=overflow_policy,
         )
 
     async def get_broker(self, fk_id: int) -> pd.DataFrame:
@@ -238,22 +562,69 @@ class Aquant:
         """
         return await self.broker.get_broker_by_fk_id(fk_id)
 
+    async def get_broker_flow(
+        self, df: pd.DataFrame, by_ticker: bool = False, resolve_names: bool = True
+    ) -> pd.DataFrame:
+        """
+        Aggregates bought, sold and net quantity/notional per broker over a trade frame.
+
+        Distinct broker ids are resolved concurrently and cached, so repeated calls only
+        request brokers that were never seen before.
+
+        Args:
+            df (pd.DataFrame): The DataFrame containing trade data, as returned by `get_trades`.
+            by_ticker (bool): If True, returns one row per ticker and broker.
+            resolve_names (bool): If True, adds a 'broker_name' column.
+
+        Returns:
+            pd.DataFrame: One row per broker with the columns broker_id, bought_quantity,
+            sold_quantity, net_quantity, bought_notional, sold_notional, net_notional,
+            buy_trades, sell_trades and broker_name.
+
+        Raises:
+            ValueError: If a required column is missing.
+
+        Example:
+            ```python
+            trades_df = await aquant.get_trades(ticker="PETR4", start_time=start_time)
+            flow = await aquant.get_broker_flow(trades_df)
+            print(flow.sort_values("net_notional"))
+            ```
+        """
+        return await self.broker_flow.get_broker_flow(
+            df, by_ticker=by_ticker, resolve_names=resolve_names
+        )
+
     async def get_securities(
-        self, ticker: str = None, asset: str = None, expires_at: datetime = None
-    ) -> dict:
+        self,
+        ticker: str = None,
+        asset: str = None,
+        expires_at: datetime = None,
+        use_cache: bool = False,
+        as_frame: bool = False,
+    ) -> list[Security] | pd.DataFrame:
         """
         Fetches security details based on ticker, asset, or expiration date.
 
         This asynchronous method queries the security service to retrieve security
         information for a given ticker, asset name, or expiration date.
 
+        With `use_cache=True` the lookup is served by the local security master
+        (`aquant.security_master`): a ticker is fetched once, an asset is loaded
+        entirely, and both are fetched again after `security_cache_ttl` seconds.
+        A lookup by asset and `expires_at` is always requested from the server.
+
         Args:
             ticker (Optional[str]): The ticker symbol of the security.
             asset (Optional[str]): The name of the asset associated with the security.
             expires_at (Optional[datetime]): The expiration date of the security.
+            use_cache (bool): If True, serves the lookup from the security master.
+            as_frame (bool): If True, returns one DataFrame decoded column by column
+                (nullable integers, tz-aware UTC dates) without building a
+                `Security` model per record.
 
         Returns:
-            dict: A dictionary containing security details.
+            list[Security] | pd.DataFrame: The matching securities.
 
         Raises:
             ValueError: If none of the parameters are provided or if the query fails.
@@ -268,7 +639,116 @@ class Aquant:
             print(security_info)
             ```
         """
-        return await self.security.get_securities(ticker, asset, expires_at)
+        if use_cache:
+            return await self.security_master.get_securities(
+                ticker, asset, expires_at, as_frame
+            )
+        return await self.security.get_securities(ticker, asset, expires_at, as_frame)
+
+    async def get_securities_many(self, tickers: list[str]) -> pd.DataFrame:
+        """
+        Resolves many tickers at once into one DataFrame.
+
+        Tickers already held by the security master (and younger than
+        `security_cache_ttl`) are not requested again. The others are fetched in
+        multi-ticker requests when `security_batch_requests` is set, otherwise with
+        one request per ticker, at most 32 in flight.
+
+        Args:
+            tickers (list[str]): Ticker codes; duplicates are ignored.
+
+        Returns:
+            pd.DataFrame: One row per known ticker, in request order, with the columns
+            of `get_securities(..., as_frame=True)`. Unknown tickers are left out.
+
+        Example:
+            ```python
+            tickers = ["PETR4", "VALE3", "DOLK25"]
+            watchlist = await aquant.get_securities_many(tickers)
+            missing = set(tickers) - set(watchlist["ticker"])
+            ```
+        """
+        return await self.security_master.get_securities_many(tickers)
+
+    async def get_expiry_index(self, assets: list[str]) -> ExpiryIndex:
+        """
+        Returns an expiry index for rolling futures and options contracts.
+
+        The assets are loaded into the security master when missing or older than
+        `security_cache_ttl`; the index then answers from memory: the front contract
+        as of a date, the next N contracts, the contracts expiring in a window, and
+        the front contract for a whole array of dates at once.
+
+        Args:
+            assets (list[str]): Asset codes, e.g. ["DOL", "WIN"].
+
+        Returns:
+            ExpiryIndex: Index over every dated security held by the security master.
+
+        Example:
+            ```python
+            index = await aquant.get_expiry_index(["DOL"])
+            index.front("DOL", as_of=datetime(2025, 4, 10))        # "DOLK25"
+            index.next("DOL", 3)                                   # front and next two
+            index.expiring_between("DOL", datetime(2025, 5, 1), datetime(2025, 8, 1))
+            index.front_many("DOL", trades_df["event_time"], roll_before=timedelta(days=2))
+            ```
+        """
+        stale = [asset for asset in assets if self.security_master.is_stale(asset)]
+        if stale:
+            await self.security_master.preload(stale)
+        return self.security_master.expiry_index()
+
+    async def preload_securities(self, assets: list[str] | None = None) -> int:
+        """
+        Loads securities into the local security master for lookups without requests.
+
+        Once loaded, `aquant.security_master.by_ticker`, `by_isin` and `by_asset`
+        answer from memory, and `get_securities(use_cache=True)` only requests data
+        that is missing or older than `security_cache_ttl`.
+
+        Args:
+            assets (Optional[list[str]]): Asset codes to load. When None, the entire
+                universe is loaded (requires server support for 'get_all_securities').
+
+        Returns:
+            int: Number of securities held by the security master.
+
+        Example:
+            ```python
+            await aquant.preload_securities(["DOL", "WIN", "PETR"])
+            security = aquant.security_master.by_ticker("DOLK25")
+            contracts = aquant.security_master.by_asset("DOL", expires_from=datetime.now())
+            ```
+        """
+        return await self.security_master.preload(assets)
+
+    def save_security_snapshot(self, path: str | None = None) -> int:
+        """
+        Saves the local security master to a memory-mapped snapshot file.
+
+        Worker processes created with `security_snapshot_path` pointing to the file
+        start with every saved security instead of downloading them again. The file
+        is replaced atomically, so workers may keep running while it is rewritten.
+
+        Args:
+            path (Optional[str]): Snapshot file. Defaults to `security_snapshot_path`.
+
+        Returns:
+            int: Number of securities written.
+
+        Example:
+            ```python
+            # parent process
+            await aquant.preload_securities()
+            aquant.save_security_snapshot("/dev/shm/securities.snap")
+
+            # each worker
+            aquant = await Aquant.create(..., security_snapshot_path="/dev/shm/securities.snap")
+            security = aquant.security_master.by_ticker("DOLK25")
+            ```
+        """
+        return self.security_master.save_snapshot(path)
 
     """
     Auxiliary functions for OHLCV calculations in DataFrames.
@@ -291,6 +771,9 @@ class Aquant:
         Returns:
             float: The first recorded trade price (open price).
 
+        Raises:
+            ValueError: If the DataFrame is empty or has no 'price' column.
+
         Example:
             ```python
             open_price = aquant.calculate_ohlcv_open(df)
@@ -309,6 +792,9 @@ class Aquant:
         Returns:
             float: The highest recorded trade price.
 
+        Raises:
+            ValueError: If the DataFrame has no 'price' column.
+
         Example:
             ```python
             high_price = aquant.calculate_ohlcv_high(df)
@@ -327,6 +813,9 @@ class Aquant:
         Returns:
             float: The lowest recorded trade price.
 
+        Raises:
+            ValueError: If the DataFrame has no 'price' column.
+
         Example:
             ```python
             low_price = aquant.calculate_ohlcv_low(df)
@@ -347,6 +836,9 @@ class Aquant:
         Returns:
             float: The last recorded trade price (close price).
 
+        Raises:
+            ValueError: If the DataFrame is empty or has no 'price' column.
+
         Example:
             ```python
             close_price = aquant.calculate_ohlcv_close(df)
@@ -367,6 +859,9 @@ class Aquant:
         Returns:
             float: The total trade volume.
 
+        Raises:
+            ValueError: If the DataFrame has no 'quantity' column.
+
         Example:
             ```python
             total_volume = aquant.calculate_ohlcv_volume(df)
@@ -394,3 +889,83 @@ class Aquant:
             ```
         """
         return self.open_high_low_close_volume.calculate_ohlcv(df)
+
+    def calculate_ohlcv_by_ticker(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Computes OHLCV, VWAP, trade count and buy/sell volume for every ticker at once.
+
+        This is intended for asset-level trade frames containing many tickers.
+
+        Args:
+            df (pd.DataFrame): The DataFrame containing trade data.
+
+        Returns:
+            pd.DataFrame: One row per ticker with the columns ticker, open, high, low, close,
+            volume, vwap, trades, buy_volume and sell_volume.
+
+        Raises:
+            ValueError: If a required column is missing.
+
+        Example:
+            ```python
+            trades_df = await aquant.get_trades(asset="PETR", start_time=start_time, end_time=end_time)
+            summary = aquant.calculate_ohlcv_by_ticker(trades_df)
+            print(summary)
+            ```
+        """
+        return self.open_high_low_close_volume.calculate_ohlcv_by_ticker(df)
+
+    def resample_ohlcv(
+        self, df: pd.DataFrame, intervals: list[TimescaleIntervalEnum]
+    ) -> dict[TimescaleIntervalEnum, pd.DataFrame]:
+        """
+        Resamples raw trades into OHLCV bars for several intervals at once.
+
+        The trades may contain many tickers. Coarser intervals aligned with a finer
+        requested one are derived from the finer bars instead of the raw trades.
+
+        Args:
+            df (pd.DataFrame): The DataFrame containing trade data, as returned by `get_trades`.
+            intervals (list[TimescaleIntervalEnum]): The bar intervals to produce.
+
+        Returns:
+            dict[TimescaleIntervalEnum, pd.DataFrame]: Bars per interval, with the columns
+            ticker, timestamp, open, high, low, close, volume, vwap and trades.
+
+        Example:
+            ```python
+            bars = aquant.resample_ohlcv(
+                trades_df,
+                [TimescaleIntervalEnum.MINUTE_1, TimescaleIntervalEnum.MINUTE_15],
+            )
+            print(bars[TimescaleIntervalEnum.MINUTE_15])
+            ```
+        """
+        return self.open_high_low_close_volume_resample.resample(df, intervals)
+
+    def analyze_trades(self, df: pd.DataFrame) -> TradeTape:
+        """
+        Builds a TradeTape for VWAP/TWAP, signed volume, imbalance and tick-rule analytics.
+
+        The prefix sums are computed once; window, bucketed and rolling queries reuse them.
+
+        Args:
+            df (pd.DataFrame): The DataFrame containing trade data, as returned by `get_trades`.
+
+        Returns:
+            TradeTape: The precomputed tape.
+
+        Raises:
+            ValueError: If a required column is missing.
+
+        Example:
+            ```python
+            tape = aquant.analyze_trades(trades_df)
+            stats = tape.window("PETR4", start_time, end_time)
+            five_minutes = tape.bucketed(TimescaleIntervalEnum.MINUTE_5)
+            trailing = tape.rolling(timedelta(minutes=1))
+            ```
+        """
+        from aquant.domains.trade.analytics import TradeTape
+
+        return TradeTape(df)
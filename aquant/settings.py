@@ -1,3 +1,5 @@
+import functools
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -13,4 +15,14 @@ class Settings(BaseSettings):
     model_config = SettingsConfigDict(env_file=".env", extra="ignore")
 
 
-settings = Settings()
+@functools.cache
+def get_settings() -> Settings:
+    """Reads the environment (and `.env`) once, on first use."""
+    return Settings()
+
+
+def __getattr__(name: str):
+    # `settings` is resolved lazily so importing this module does not read `.env`.
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
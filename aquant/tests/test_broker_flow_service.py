@@ -0,0 +1,88 @@
+import asyncio
+from unittest.mock import MagicMock
+
+import pandas as pd
+import pytest
+
+from aquant.domains.broker.service import BrokerDirectoryService, BrokerFlowService
+
+
+class FakeBrokerService:
+    def __init__(self) -> None:
+        self.requested: list[int] = []
+
+    async def get_broker_name(self, fk_id: int) -> str:
+        self.requested.append(fk_id)
+        await asyncio.sleep(0)
+        if fk_id == 99:
+            raise TimeoutError("no reply")
+        return f"BROKER {fk_id}"
+
+
+def make_trades() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "ticker": ["PETR4", "PETR4", "VALE3"],
+            "buyer_id": [1, 2, 1],
+            "seller_id": [2, 99, 2],
+            "price": [10.0, 11.0, 50.0],
+            "quantity": [100.0, 200.0, 10.0],
+        }
+    )
+
+
+def test_aggregate_per_broker_and_ticker():
+    service = BrokerFlowService(MagicMock(), MagicMock())
+
+    flow = service.aggregate(make_trades()).set_index("broker_id")
+    per_ticker = service.aggregate(make_trades(), by_ticker=True)
+
+    assert flow.loc[1, "bought_quantity"] == 110
+    assert flow.loc[2, "net_quantity"] == 200 - 110
+    assert flow.loc[2, "net_notional"] == pytest.approx(2200 - 1500)
+    assert flow.loc[99, "sell_trades"] == 1
+    assert per_ticker[["ticker", "broker_id"]].values.tolist() == [
+        ["PETR4", 1],
+        ["PETR4", 2],
+        ["PETR4", 99],
+        ["VALE3", 1],
+        ["VALE3", 2],
+    ]
+
+
+def test_trades_without_a_ticker_are_ignored_per_ticker():
+    service = BrokerFlowService(MagicMock(), MagicMock())
+    trades = make_trades()
+    trades.loc[1, "ticker"] = None
+
+    per_ticker = service.aggregate(trades, by_ticker=True)
+
+    assert per_ticker[["ticker", "broker_id"]].values.tolist() == [
+        ["PETR4", 1],
+        ["PETR4", 2],
+        ["VALE3", 1],
+        ["VALE3", 2],
+    ]
+    assert service.aggregate(trades)["buy_trades"].sum() == 3
+
+
+def test_names_are_resolved_once_and_failures_are_retried():
+    brokers = FakeBrokerService()
+    directory = BrokerDirectoryService(MagicMock(), brokers)
+    service = BrokerFlowService(MagicMock(), directory)
+
+    async def run():
+        flows = await asyncio.gather(
+            service.get_broker_flow(make_trades()),
+            service.get_broker_flow(make_trades()),
+        )
+        await service.get_broker_flow(make_trades())
+        return flows[0]
+
+    flow = asyncio.run(run())
+
+    names = flow.set_index("broker_id")["broker_name"]
+    assert names[1] == "BROKER 1"
+    assert names[2] == "BROKER 2"
+    assert pd.isna(names[99])
+    assert sorted(brokers.requested) == [1, 2, 99, 99]
@@ -0,0 +1,70 @@
+import asyncio
+from unittest.mock import MagicMock
+
+from dependency_injector import containers, providers
+
+from aquant.core.dependencies.registry import ContainerRegistry
+from aquant.main import Aquant
+
+events: list[str] = []
+
+
+async def init_connection():
+    events.append("open")
+    await asyncio.sleep(0.01)
+    yield object()
+    events.append("close")
+
+
+class FakeContainer(containers.DeclarativeContainer):
+    connection = providers.Resource(init_connection)
+
+
+def test_same_key_shares_one_container_until_last_release():
+    registry = ContainerRegistry()
+    events.clear()
+
+    async def run():
+        first, second = await asyncio.gather(
+            registry.acquire("settings", FakeContainer),
+            registry.acquire("settings", FakeContainer),
+        )
+        other = await registry.acquire("other-settings", FakeContainer)
+        assert first is second
+        assert other is not first
+
+        await registry.release("settings")
+        assert events == ["open", "open"]
+        await registry.release("settings")
+        await registry.release("other-settings")
+
+    asyncio.run(run())
+
+    assert events == ["open", "open", "close", "close"]
+    assert len(registry) == 0
+
+
+def test_containers_without_async_resources_are_supported():
+    registry = ContainerRegistry()
+    events.clear()
+
+    async def run():
+        container = FakeContainer()
+        container.connection.override(providers.Object("stand-in"))
+        acquired = await registry.acquire("settings", lambda: container)
+        assert acquired.connection() == "stand-in"
+        await registry.release("settings")
+
+    asyncio.run(run())
+
+    assert events == []
+    assert len(registry) == 0
+
+
+def test_shutdown_without_a_running_loop_unwires_the_container():
+    aquant = Aquant.__new__(Aquant)
+    aquant.container = MagicMock()
+
+    aquant.shutdown()
+
+    aquant.container.unwire.assert_called_once_with()
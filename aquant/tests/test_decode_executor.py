@@ -0,0 +1,92 @@
+import asyncio
+import threading
+import time
+
+import numpy as np
+
+from aquant.core.dependencies.providers import init_decode_executor
+from aquant.core.executors import DecodeExecutor, ExecutorKindEnum
+from aquant.core.logger import Logger
+from aquant.core.utils import LoopLagMonitor
+from aquant.domains.trade.codecs import TradeBinaryCodec
+
+
+def trade_payload(count: int) -> bytes:
+    records = np.zeros(count, dtype=TradeBinaryCodec.DTYPE)
+    records["ticker"] = b"PETR4"
+    records["event_time"] = 1_700_000_000_000_000_000 + np.arange(count)
+    records["price_ascii"] = b"37.25"
+    records["quantity"] = 100
+    records["side"] = b"B"
+    return records.tobytes()
+
+
+def decoding_thread(payload: bytes) -> str:
+    return threading.current_thread().name
+
+
+def test_small_payloads_stay_inline_and_large_ones_are_offloaded():
+    executor = DecodeExecutor(threshold_bytes=16)
+
+    async def run():
+        return (
+            await executor.run(decoding_thread, b"small"),
+            await executor.run(decoding_thread, b"x" * 16),
+        )
+
+    try:
+        inline, offloaded = asyncio.run(run())
+    finally:
+        executor.shutdown()
+
+    assert inline == "MainThread"
+    assert offloaded.startswith("aquant-decode")
+    assert (executor.inline, executor.offloaded) == (1, 1)
+
+
+def test_provider_keeps_an_explicit_zero_threshold():
+    provider = init_decode_executor(threshold_bytes=0)
+    executor = next(provider)
+    default_provider = init_decode_executor()
+    default = next(default_provider)
+
+    assert executor.threshold_bytes == 0
+    assert executor.kind == ExecutorKindEnum.THREAD
+    assert default.threshold_bytes == 1 << 20
+    provider.close()
+    default_provider.close()
+
+
+def test_process_pool_decodes_with_a_pickled_codec():
+    codec = TradeBinaryCodec(Logger("test"))
+    payload = trade_payload(1000)
+    executor = DecodeExecutor(
+        ExecutorKindEnum.PROCESS, threshold_bytes=0, max_workers=1
+    )
+
+    async def run():
+        return await executor.run(codec.parse_trades_binary_to_dataframe, payload)
+
+    try:
+        df = asyncio.run(run())
+    finally:
+        executor.shutdown()
+
+    assert len(df) == 1000
+    assert set(df["ticker"]) == {"PETR4"}
+    assert df["price"].eq(37.25).all()
+
+
+def test_loop_lag_monitor_sees_a_blocking_call():
+    async def run():
+        async with LoopLagMonitor(interval=0.001) as lag:
+            await asyncio.sleep(0.02)
+            time.sleep(0.1)
+            await asyncio.sleep(0.02)
+        return lag.snapshot()
+
+    snapshot = asyncio.run(run())
+
+    assert snapshot["samples"] > 2
+    assert snapshot["max_ms"] >= 80
+    assert snapshot["p50_ms"] < snapshot["max_ms"]
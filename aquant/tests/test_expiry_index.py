@@ -0,0 +1,69 @@
+import asyncio
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+
+import numpy as np
+import pandas as pd
+
+from aquant.domains.security.entity import ExpiryIndex, Security
+from aquant.domains.security.service import SecurityMasterService
+
+CONTRACTS = [
+    Security(ticker="DOLM25", asset="DOL", expires_at=datetime(2025, 6, 2)),
+    Security(ticker="DOLK25", asset="DOL", expires_at=datetime(2025, 5, 2)),
+    Security(ticker="DOLN25", asset="DOL", expires_at=datetime(2025, 7, 1)),
+    Security(ticker="WINM25", asset="WIN", expires_at=datetime(2025, 6, 18)),
+    Security(ticker="PETR4", asset="PETR"),
+]
+
+
+def test_front_next_and_window_lookups():
+    index = ExpiryIndex.from_securities(CONTRACTS)
+
+    assert index.assets == ["DOL", "WIN"]
+    assert len(index) == 4
+    assert index.front("DOL", datetime(2025, 4, 10)) == "DOLK25"
+    assert index.front("DOL", datetime(2025, 5, 2)) == "DOLK25"
+    assert index.front("DOL", datetime(2025, 5, 2, 0, 1)) == "DOLM25"
+    assert index.front("DOL", datetime(2025, 4, 10), nth=1) == "DOLM25"
+    assert index.front("DOL", datetime(2025, 4, 30), roll_before=timedelta(days=3)) == (
+        "DOLM25"
+    )
+    assert index.front("DOL", datetime(2025, 8, 1)) is None
+    assert index.front("PETR", datetime(2025, 1, 1)) is None
+    assert index.next("DOL", 2, datetime(2025, 5, 10)) == ["DOLM25", "DOLN25"]
+    assert index.expiring_between("DOL", datetime(2025, 5, 3), "2025-07-01") == [
+        "DOLM25",
+        "DOLN25",
+    ]
+    assert index.contracts("WIN")["ticker"].tolist() == ["WINM25"]
+
+
+def test_front_many_matches_scalar_lookups():
+    index = ExpiryIndex.from_securities(CONTRACTS)
+    dates = pd.date_range("2025-04-01", "2025-08-01", freq="7h")
+
+    resolved = index.front_many("DOL", dates, nth=1, roll_before=timedelta(days=1))
+
+    expected = [
+        index.front("DOL", date, nth=1, roll_before=timedelta(days=1)) for date in dates
+    ]
+    assert resolved.tolist() == expected
+    assert index.front_many("DOL", [np.datetime64("NaT")]).tolist() == [None]
+
+
+def test_master_index_is_rebuilt_only_after_changes():
+    class Service:
+        async def get_securities(self, ticker=None, asset=None, expires_at=None):
+            return [s for s in CONTRACTS if s.asset == asset]
+
+    master = SecurityMasterService(MagicMock(), Service())
+    asyncio.run(master.preload(["DOL"]))
+
+    index = master.expiry_index()
+    assert master.expiry_index() is index
+    assert index.next("DOL", 5, datetime(2025, 1, 1)) == ["DOLK25", "DOLM25", "DOLN25"]
+
+    asyncio.run(master.preload(["WIN"]))
+    assert master.expiry_index() is not index
+    assert master.expiry_index().front("WIN", datetime(2025, 6, 1)) == "WINM25"
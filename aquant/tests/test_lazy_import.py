@@ -0,0 +1,15 @@
+import subprocess
+import sys
+
+
+def test_import_aquant_defers_heavy_dependencies():
+    code = (
+        "import sys, aquant; from aquant import Aquant; "
+        "heavy = {'pandas', 'dependency_injector', 'nats', 'redis', 'pydantic_settings'}; "
+        "print(sorted(heavy & set(sys.modules)))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+
+    assert result.stdout.strip() == "[]"
@@ -0,0 +1,94 @@
+import asyncio
+import importlib.util
+from unittest.mock import MagicMock
+
+import pytest
+
+from aquant.core.metrics import (
+    CallbackMetricsSink,
+    Histogram,
+    Metrics,
+    NullMetrics,
+    OpenTelemetryMetricsSink,
+    PrometheusMetricsSink,
+)
+from aquant.domains.broker.service import BrokerService
+
+
+class BrokerNats:
+    async def request(self, subject, message, timeout=2.0):
+        await asyncio.sleep(0.001)
+        return b"XP INVESTIMENTOS".ljust(64, b"\x00")
+
+
+def test_service_stages_reach_histograms_and_sinks():
+    records = []
+    prometheus = PrometheusMetricsSink()
+    metrics = Metrics([CallbackMetricsSink(records.append), prometheus])
+    service = BrokerService(MagicMock(), BrokerNats(), metrics=metrics)
+
+    assert asyncio.run(service.get_broker_name(3)) == "XP INVESTIMENTOS"
+
+    assert [(r.operation, r.stage) for r in records] == [
+        ("get_broker_name", "request"),
+        ("get_broker_name", "parse"),
+    ]
+    assert records[0].nbytes == 64
+    assert records[0].duration >= 0.001
+    snapshot = metrics.snapshot()
+    assert snapshot["get_broker_name.request"]["count"] == 1
+    assert snapshot["get_broker_name.request"]["total_bytes"] == 64
+    assert snapshot["get_broker_name.request"]["mean_bytes"] == 64
+    assert 32 <= snapshot["get_broker_name.request"]["p50_bytes"] <= 64
+    assert "total_bytes" not in snapshot["get_broker_name.parse"]
+
+    text = prometheus.render()
+    assert "# TYPE aquant_stage_duration_seconds histogram" in text
+    assert (
+        'aquant_stage_bytes_bucket{operation="get_broker_name",stage="request",le="64"} 1'
+        in text
+    )
+    assert (
+        'aquant_stage_duration_seconds_count{operation="get_broker_name",stage="parse"} 1'
+        in text
+    )
+
+
+def test_failed_stages_are_recorded_as_errors():
+    records = []
+    metrics = Metrics([CallbackMetricsSink(records.append)])
+
+    with pytest.raises(ValueError):
+        with metrics.stage("get_trades", "decode"):
+            raise ValueError("bad payload")
+
+    assert records[0].error
+
+
+def test_null_metrics_records_nothing():
+    metrics = NullMetrics()
+
+    with metrics.stage("get_trades", "request") as stage:
+        stage.nbytes = 10
+
+    assert not metrics.enabled
+    assert metrics.snapshot() == {}
+
+
+def test_histogram_quantiles_interpolate_within_buckets():
+    histogram = Histogram((1.0, 2.0, 4.0))
+    for value in (0.5, 1.5, 1.5, 3.0):
+        histogram.observe(value)
+
+    assert histogram.count == 4
+    assert histogram.quantile(0.5) == pytest.approx(1.5)
+    assert histogram.cumulative()[-1] == (float("inf"), 4)
+
+
+@pytest.mark.skipif(
+    importlib.util.find_spec("opentelemetry") is not None,
+    reason="opentelemetry is installed",
+)
+def test_open_telemetry_sink_requires_the_optional_package():
+    with pytest.raises(ImportError, match="opentelemetry-api"):
+        OpenTelemetryMetricsSink()
@@ -0,0 +1,128 @@
+import asyncio
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from aquant.infra.nats import NatsClient
+
+
+class ScriptedNats:
+    """Replies after the next scripted delay (default 10 ms)."""
+
+    def __init__(self) -> None:
+        self.delays: list[float] = []
+        self.requests = 0
+        self.is_connected = True
+
+    async def request(self, subject, message, timeout):
+        self.requests += 1
+        delay = self.delays.pop(0) if self.delays else 0.01
+        if delay > timeout:
+            await asyncio.sleep(timeout)
+            raise TimeoutError
+        await asyncio.sleep(delay)
+        return SimpleNamespace(data=b"reply-%d" % self.requests)
+
+
+def make_client(**kwargs) -> tuple[NatsClient, ScriptedNats]:
+    client = NatsClient(MagicMock(), ["nats://localhost:4222"], **kwargs)
+    client.nc = ScriptedNats()
+    return client, client.nc
+
+
+def test_adaptive_deadline_follows_observed_latency():
+    client, _ = make_client(adaptive_deadlines=True)
+
+    async def run():
+        for _ in range(30):
+            await client.request("marketdata.broker.request", b"x", timeout=20)
+
+    asyncio.run(run())
+
+    deadline = client.latency.deadline("marketdata.broker.request", 20)
+    assert client.latency.min_deadline <= deadline < 1.0
+    assert client.latency.deadline("marketdata.trade.request", 20) == 20
+
+
+def test_slow_reply_is_hedged_within_budget():
+    client, nats = make_client(hedge_requests=True, max_hedge_ratio=1.0)
+
+    async def run():
+        for _ in range(30):
+            await client.request("marketdata.security.request", b"x", timeout=5)
+        nats.delays = [1.0]
+        started = time.perf_counter()
+        data = await client.request("marketdata.security.request", b"x", timeout=5)
+        return data, time.perf_counter() - started
+
+    data, elapsed = asyncio.run(run())
+
+    assert data == b"reply-32"
+    assert elapsed < 0.5
+    assert client.hedged_requests == 1
+
+
+def test_inflight_requests_are_counted_per_subject():
+    client, _ = make_client()
+
+    async def run():
+        await asyncio.gather(
+            *(client.request("marketdata.trade.request", b"x") for _ in range(3)),
+            client.request("marketdata.broker.request", b"x"),
+        )
+
+    asyncio.run(run())
+
+    assert client.peak_inflight["marketdata.trade.request"] == 3
+    assert client.peak_inflight["marketdata.broker.request"] == 1
+    assert sum(client.inflight.values()) == 0
+
+
+def test_lazy_client_connects_once_on_first_request():
+    client, nats = make_client(lazy_connect=True)
+    connects = []
+
+    async def connect():
+        connects.append(1)
+        await asyncio.sleep(0.01)
+        nats.is_connected = True
+        client._has_connected = True
+
+    nats.is_connected = False
+    client.connect = connect
+
+    async def run():
+        await asyncio.gather(
+            *(client.request("marketdata.broker.request", b"x") for _ in range(3))
+        )
+
+    asyncio.run(run())
+
+    assert connects == [1]
+    assert nats.requests == 3
+
+
+def test_eager_client_leaves_reconnects_to_nats():
+    client, nats = make_client()
+    client.connect = MagicMock(side_effect=AssertionError("connect called"))
+    # nats-py reports is_connected=False while it is reconnecting.
+    nats.is_connected = False
+
+    asyncio.run(client.request("marketdata.broker.request", b"x"))
+
+    assert nats.requests == 1
+
+
+def test_closed_client_is_not_reconnected():
+    client, nats = make_client(lazy_connect=True)
+    client.connect = MagicMock(side_effect=AssertionError("connect called"))
+    nats.is_closed = True
+    nats.is_connected = False
+
+    async def run():
+        await client.close()
+        await client.ensure_connected()
+
+    asyncio.run(run())
+
+    client.connect.assert_not_called()
@@ -0,0 +1,71 @@
+import struct
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import numpy as np
+import pandas as pd
+
+from aquant.domains.trade.codecs import OpenHighLowCloseVolumeBinaryCodec
+
+
+def build_blob(rows: list[tuple[str, str, float]]) -> bytes:
+    return b"".join(
+        struct.pack(
+            "<10sqddddd",
+            ticker.encode(),
+            pd.Timestamp(ts).value,
+            price,
+            price + 1,
+            price - 1,
+            price,
+            100.0,
+        )
+        for ticker, ts, price in rows
+    )
+
+
+def test_series_wraps_blob_and_decodes_the_packed_values():
+    codec = OpenHighLowCloseVolumeBinaryCodec(MagicMock())
+    blob = build_blob(
+        [
+            ("PETR4", "2025-05-05 10:00:00.000000001", 10.0),
+            ("PETR4", "2025-05-05 10:01:00", 11.0),
+            ("PETR4", "2025-05-05 10:02:00", 12.0),
+        ]
+    )
+
+    series = codec.decode_series(blob)
+    bars = series.to_dataclasses()
+
+    assert np.shares_memory(series.close, np.frombuffer(blob, dtype=np.uint8))
+    assert bars[0].ticker == "PETR4"
+    assert bars[0].timestamp == pd.Timestamp("2025-05-05 10:00:00.000000001")
+    assert bars[2].high_price == 13.0
+    expected = pd.DataFrame(
+        {
+            "ticker": ["PETR4"] * 3,
+            "timestamp": [
+                pd.Timestamp("2025-05-05 10:00:00.000000001"),
+                pd.Timestamp("2025-05-05 10:01:00"),
+                pd.Timestamp("2025-05-05 10:02:00"),
+            ],
+            "open": [10.0, 11.0, 12.0],
+            "high": [11.0, 12.0, 13.0],
+            "low": [9.0, 10.0, 11.0],
+            "close": [10.0, 11.0, 12.0],
+            "volume": [100.0] * 3,
+        }
+    )
+    pd.testing.assert_frame_equal(series.to_dataframe(), expected, check_dtype=False)
+
+
+def test_between_slices_by_time():
+    codec = OpenHighLowCloseVolumeBinaryCodec(MagicMock())
+    series = codec.decode_series(
+        build_blob([("VALE3", f"2025-05-05 10:0{m}:00", 50.0 + m) for m in range(6)])
+    )
+
+    window = series.between(datetime(2025, 5, 5, 10, 2), datetime(2025, 5, 5, 10, 4))
+
+    assert len(window) == 3
+    assert window.close.tolist() == [52.0, 53.0, 54.0]
@@ -0,0 +1,99 @@
+import asyncio
+import pstats
+from unittest.mock import MagicMock
+
+import pytest
+
+from aquant.core.metrics import CallbackMetricsSink, NullMetrics
+from aquant.core.profiling import SDKProfiler
+from aquant.domains.broker.service import BrokerService
+
+
+class BrokerNats:
+    async def request(self, subject, message, timeout=2.0):
+        await asyncio.sleep(0.001)
+        return b"XP INVESTIMENTOS".ljust(64, b"\x00")
+
+
+def test_profile_attributes_stages_without_configured_sinks(tmp_path):
+    metrics = NullMetrics()
+    service = BrokerService(MagicMock(), BrokerNats(), metrics=metrics)
+
+    async def pull():
+        async with SDKProfiler(metrics, "broker", output_dir=tmp_path) as profiler:
+            await service.get_broker_name(3)
+        return profiler
+
+    report = asyncio.run(pull()).report
+
+    assert report.stages["get_broker_name.request"]["count"] == 1
+    assert report.stages["get_broker_name.parse"]["count"] == 1
+    assert report.peak_memory_bytes is not None
+    assert any("broker_service.py" in site["site"] for site in report.sdk_allocations)
+    assert metrics.sinks == []
+
+    suffixes = sorted(path.suffix for path in report.files)
+    assert suffixes == [".prof", ".txt"]
+    assert pstats.Stats(str(report.files[suffixes.index(".prof")])).total_calls > 0
+    assert "get_broker_name.request" in report.files[1].read_text()
+
+
+def test_decorator_profiles_every_call_without_tracing_memory():
+    profiler = SDKProfiler(trace_memory=False)
+
+    @profiler
+    async def work():
+        await asyncio.sleep(0)
+        return 42
+
+    assert asyncio.run(work()) == 42
+    assert work.__name__ == "work"
+    assert profiler.last.report.name == "work"
+    assert profiler.last.report.wall_time > 0
+
+
+def test_overlapping_decorated_calls_are_not_rejected():
+    profiler = SDKProfiler(trace_memory=False)
+
+    @profiler
+    async def work(value):
+        await asyncio.sleep(0.001)
+        return value
+
+    async def run():
+        return await asyncio.gather(work(1), work(2), work(3))
+
+    assert asyncio.run(run()) == [1, 2, 3]
+    assert profiler.last.report.wall_time > 0
+    assert not SDKProfiler._active
+
+    with SDKProfiler(trace_memory=False):
+        assert asyncio.run(run()) == [1, 2, 3]
+
+
+def test_nested_profilers_are_rejected():
+    with SDKProfiler(trace_memory=False) as outer:
+        with pytest.raises(RuntimeError):
+            with SDKProfiler(trace_memory=False):
+                pass
+
+    assert outer.report.peak_memory_bytes is None
+    assert "memory not traced" in outer.report.summary()
+
+
+def test_null_metrics_forwards_only_while_a_sink_is_attached():
+    metrics = NullMetrics()
+    records = []
+    sink = CallbackMetricsSink(records.append)
+
+    with metrics.stage("get_trades", "decode"):
+        pass
+    metrics.add_sink(sink)
+    with metrics.stage("get_trades", "decode"):
+        pass
+    metrics.remove_sink(sink)
+    with metrics.stage("get_trades", "decode"):
+        pass
+
+    assert len(records) == 1
+    assert metrics.snapshot() == {}
@@ -0,0 +1,193 @@
+import asyncio
+from datetime import UTC, datetime
+from unittest.mock import MagicMock
+
+import pandas as pd
+import pytest
+
+from aquant.domains.security.entity import Security
+from aquant.domains.security.service import SecurityMasterService
+
+
+def _security(ticker, asset="DOL", expires_at=None, isin=None):
+    return Security(
+        ticker=ticker, asset=asset, expires_at=expires_at, isin=isin or f"BR{ticker}"
+    )
+
+
+class FakeSecurityService:
+    def __init__(self, securities):
+        self.securities = securities
+        self.requests = []
+        self.fail = False
+
+    async def get_securities(self, ticker=None, asset=None, expires_at=None):
+        self.requests.append((asset, expires_at) if expires_at else ticker or asset)
+        if self.fail:
+            return None
+        return [
+            s
+            for s in self.securities
+            if (ticker and s.ticker == ticker)
+            or (
+                asset
+                and s.asset == asset
+                # Stands in for whatever the server matches on an expiry.
+                and (expires_at is None or (s.expires_at or expires_at) >= expires_at)
+            )
+        ]
+
+    async def get_all_securities(self):
+        self.requests.append("*")
+        return None if self.fail else list(self.securities)
+
+
+UNIVERSE = [
+    _security("DOLN25", expires_at=datetime(2025, 7, 1)),
+    _security("DOLK25", expires_at=datetime(2025, 5, 2)),
+    _security("DOLM25", expires_at=datetime(2025, 6, 2)),
+    _security("DOLSPOT"),
+    _security("PETR4", asset="PETR"),
+]
+
+
+def test_preloaded_asset_is_indexed_by_ticker_isin_and_expiry():
+    service = FakeSecurityService(UNIVERSE)
+    master = SecurityMasterService(MagicMock(), service)
+
+    assert asyncio.run(master.preload(["DOL"])) == 4
+
+    assert master.by_ticker("DOLK25").expires_at == datetime(2025, 5, 2)
+    assert master.by_isin("BRDOLM25").ticker == "DOLM25"
+    assert master.by_ticker("PETR4") is None
+    assert [s.ticker for s in master.by_asset("DOL")] == [
+        "DOLK25",
+        "DOLM25",
+        "DOLN25",
+        "DOLSPOT",
+    ]
+    assert [s.ticker for s in master.by_asset("DOL", datetime(2025, 5, 3))] == [
+        "DOLM25",
+        "DOLN25",
+    ]
+    assert [
+        s.ticker for s in master.by_asset("DOL", expires_to=datetime(2025, 6, 2))
+    ] == ["DOLK25", "DOLM25"]
+    assert service.requests == ["DOL"]
+
+
+def test_lookups_are_cached_until_the_ttl_expires():
+    service = FakeSecurityService(UNIVERSE)
+    master = SecurityMasterService(MagicMock(), service)
+
+    async def lookups():
+        first = await master.get_securities(ticker="PETR4")
+        second = await master.get_securities(ticker="PETR4")
+        contracts = await master.get_securities(
+            asset="DOL", expires_at=datetime(2025, 6, 2)
+        )
+        await master.get_securities(asset="DOL")
+        return first, second, contracts
+
+    first, second, contracts = asyncio.run(lookups())
+
+    assert first == second == [UNIVERSE[-1]]
+    assert [s.ticker for s in contracts] == ["DOLN25", "DOLM25", "DOLSPOT"]
+    assert service.requests == ["PETR4", ("DOL", datetime(2025, 6, 2)), "DOL"]
+
+    master.ttl = 0
+    asyncio.run(master.get_securities(ticker="PETR4"))
+    assert service.requests[-1] == "PETR4"
+
+
+def test_asset_and_expiry_lookup_matches_the_uncached_request():
+    service = FakeSecurityService(UNIVERSE)
+    master = SecurityMasterService(MagicMock(), service)
+    expires_at = datetime(2025, 6, 2)
+
+    async def lookups():
+        await master.preload(["DOL"])
+        cached = await master.get_securities(asset="DOL", expires_at=expires_at)
+        uncached = await service.get_securities(asset="DOL", expires_at=expires_at)
+        return cached, uncached
+
+    cached, uncached = asyncio.run(lookups())
+
+    assert cached == uncached
+    assert service.requests == ["DOL", ("DOL", expires_at), ("DOL", expires_at)]
+
+
+def test_failed_refresh_keeps_stale_data_and_refresh_drops_delisted():
+    service = FakeSecurityService(UNIVERSE)
+    master = SecurityMasterService(MagicMock(), service, ttl=0)
+    asyncio.run(master.preload())
+    assert len(master) == 5
+    assert service.requests == ["*"]
+
+    service.fail = True
+    assert [s.ticker for s in asyncio.run(master.get_securities(ticker="DOLK25"))] == [
+        "DOLK25"
+    ]
+    assert asyncio.run(master.get_securities(ticker="WINQ25")) is None
+
+    service.fail = False
+    service.securities = [s for s in UNIVERSE if s.ticker != "DOLK25"]
+    asyncio.run(master.refresh())
+    assert master.by_ticker("DOLK25") is None
+    assert master.by_isin("BRDOLK25") is None
+    assert [s.ticker for s in master.by_asset("DOL")][0] == "DOLM25"
+
+    with pytest.raises(ValueError):
+        asyncio.run(master.get_securities())
+
+
+class BatchSecurityService(FakeSecurityService):
+    def __init__(self, securities, supports_batches=True):
+        super().__init__(securities)
+        self.supports_batches = supports_batches
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def get_securities(self, ticker=None, asset=None, expires_at=None):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0)
+        self.in_flight -= 1
+        return await super().get_securities(ticker, asset, expires_at)
+
+    async def get_securities_by_tickers(self, tickers):
+        self.requests.append(tuple(tickers))
+        if not self.supports_batches:
+            return None
+        return [s for s in self.securities if s.ticker in tickers]
+
+
+def test_many_tickers_are_deduplicated_against_the_cache_and_batched():
+    service = BatchSecurityService(UNIVERSE)
+    master = SecurityMasterService(
+        MagicMock(), service, batch_requests=True, batch_size=2
+    )
+    asyncio.run(master.get_securities(ticker="PETR4"))
+
+    df = asyncio.run(
+        master.get_securities_many(["DOLM25", "PETR4", "DOLK25", "DOLM25", "WINQ25"])
+    )
+
+    assert df["ticker"].tolist() == ["DOLM25", "PETR4", "DOLK25"]
+    expires_at = pd.Timestamp(datetime(2025, 6, 2).astimezone(UTC))
+    assert df["expires_at"].iloc[0] == expires_at
+    assert service.requests == ["PETR4", ("DOLM25", "DOLK25"), ("WINQ25",)]
+
+
+def test_many_tickers_fan_out_with_limited_concurrency_without_batches():
+    service = BatchSecurityService(UNIVERSE, supports_batches=False)
+    master = SecurityMasterService(
+        MagicMock(), service, batch_requests=True, max_concurrency=2
+    )
+
+    df = asyncio.run(master.get_securities_many([s.ticker for s in UNIVERSE]))
+
+    assert len(df) == len(UNIVERSE)
+    assert service.requests[0] == tuple(s.ticker for s in UNIVERSE)
+    assert sorted(service.requests[1:]) == sorted(s.ticker for s in UNIVERSE)
+    assert service.max_in_flight == 2
@@ -0,0 +1,128 @@
+import asyncio
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pytest
+
+from aquant.domains.security.entity import Security, SecuritySnapshot, SecurityTable
+from aquant.domains.security.service import SecurityMasterService
+
+
+def _security(ticker, asset="DOL", expires_at=None, isin=None):
+    return Security(
+        ticker=ticker, asset=asset, expires_at=expires_at, isin=isin or f"BR{ticker}"
+    )
+
+
+UNIVERSE = [
+    _security("DOLN25", expires_at=datetime(2025, 7, 1)),
+    _security("DOLK25", expires_at=datetime(2025, 5, 2)),
+    _security("DOLSPOT"),
+    _security("PETR4", asset="PETR"),
+]
+
+
+class FakeSecurityService:
+    def __init__(self, securities):
+        self.securities = securities
+        self.requests = []
+
+    async def get_securities(self, ticker=None, asset=None, expires_at=None):
+        self.requests.append(ticker or asset)
+        return [
+            s
+            for s in self.securities
+            if (ticker and s.ticker == ticker) or (asset and s.asset == asset)
+        ]
+
+    async def get_all_securities(self):
+        self.requests.append("*")
+        return list(self.securities)
+
+
+def test_snapshot_is_mapped_with_its_indexes(tmp_path):
+    path = tmp_path / "securities.snap"
+    renamed = _security("DOLK25", expires_at=datetime(2025, 5, 2), isin="BRNEW")
+    table = SecurityTable.from_securities([*UNIVERSE, renamed])
+
+    assert SecuritySnapshot.write(path, table, assets=["DOL"], created_at=1.0) == 4
+    snapshot = SecuritySnapshot.open(path)
+
+    assert len(snapshot) == 4 and "PETR4" in snapshot and "WINQ25" not in snapshot
+    assert snapshot.created_at == 1.0 and not snapshot.universe
+    assert snapshot.assets == ["DOL"] and not snapshot.has_asset("PETR")
+    assert snapshot.by_ticker("DOLK25").isin == "BRNEW"
+    assert snapshot.by_isin("BRDOLK25") is None
+    assert snapshot.by_isin("BRPETR4").ticker == "PETR4"
+    assert [s.ticker for s in snapshot.by_asset("DOL")] == [
+        "DOLK25",
+        "DOLN25",
+        "DOLSPOT",
+    ]
+    assert [s.ticker for s in snapshot.by_asset("DOL", datetime(2025, 5, 3))] == [
+        "DOLN25"
+    ]
+    assert not snapshot.changed_on_disk()
+
+    SecuritySnapshot.write(path, table[:1])
+    assert snapshot.changed_on_disk()
+    assert snapshot.by_ticker("PETR4").asset == "PETR"
+    snapshot.close()
+
+    path.write_bytes(b"\0" * 128)
+    with pytest.raises(ValueError):
+        SecuritySnapshot.open(path)
+
+
+def test_workers_start_from_the_snapshot_without_requests(tmp_path):
+    path = tmp_path / "securities.snap"
+    parent = SecurityMasterService(MagicMock(), FakeSecurityService(UNIVERSE))
+    asyncio.run(parent.preload())
+    assert parent.save_snapshot(path) == 4
+
+    service = FakeSecurityService(UNIVERSE)
+    worker = SecurityMasterService(MagicMock(), service, snapshot_path=path)
+
+    async def lookups():
+        await worker.preload()
+        await worker.preload(["DOL"])
+        ticker = await worker.get_securities(ticker="DOLK25")
+        contracts = await worker.get_securities(asset="DOL")
+        return ticker, contracts, await worker.get_securities_many(["PETR4", "DOLN25"])
+
+    ticker, contracts, df = asyncio.run(lookups())
+
+    assert ticker[0].expires_at == datetime(2025, 5, 2)
+    assert [s.ticker for s in contracts] == ["DOLK25", "DOLN25", "DOLSPOT"]
+    assert df["ticker"].tolist() == ["PETR4", "DOLN25"]
+    assert worker.by_isin("BRDOLSPOT").ticker == "DOLSPOT"
+    assert worker.expiry_index().front("DOL", datetime(2025, 5, 3)) == "DOLN25"
+    assert not worker.is_stale() and len(worker) == 4
+    assert service.requests == []
+
+
+def test_stale_snapshot_is_served_while_refreshed_in_the_background(tmp_path):
+    path = tmp_path / "securities.snap"
+    SecuritySnapshot.write(
+        path, SecurityTable.from_securities(UNIVERSE), ["DOL"], created_at=0.0
+    )
+    relisted = [*UNIVERSE[1:], _security("DOLQ25", expires_at=datetime(2025, 8, 1))]
+    service = FakeSecurityService(relisted)
+    worker = SecurityMasterService(MagicMock(), service, snapshot_path=path)
+
+    async def lookup_then_wait():
+        stale = await worker.get_securities(ticker="DOLN25")
+        await worker._snapshot_refresh
+        return stale
+
+    assert asyncio.run(lookup_then_wait())[0].ticker == "DOLN25"
+
+    assert service.requests == ["DOL"]
+    assert worker.by_ticker("DOLN25") is None
+    assert worker.by_ticker("DOLQ25").expires_at == datetime(2025, 8, 1)
+    # PETR4 was saved outside a fully loaded asset.
+    assert worker.by_ticker("PETR4") is None
+    assert not worker.is_stale("DOL")
+
+    other = SecurityMasterService(MagicMock(), service, snapshot_path=path)
+    assert [s.ticker for s in other.by_asset("DOL")] == ["DOLK25", "DOLQ25", "DOLSPOT"]
@@ -0,0 +1,97 @@
+import struct
+from datetime import UTC, datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from aquant.domains.security.entity import SecurityTable
+from aquant.domains.security.utils import decode_securities, decode_securities_frame
+
+FORMAT = "!50s13s50s50sI I 50s50s50sI3s I I I I f I 50s I I"
+ISSUED = int(datetime(2024, 1, 2).timestamp())
+EXPIRES = int(datetime(2025, 5, 2).timestamp())
+
+
+def _record(ticker, product=1, round_lot=100, increment=0.5, expires_at=EXPIRES):
+    return struct.pack(
+        FORMAT,
+        b"DOL",
+        ticker,
+        b"BRBMEF" + ticker,
+        b"FFCCSX",
+        product,
+        2,
+        b"FUTURE",
+        "DÓLAR COMERCIAL".encode(),
+        b"FUTURES",
+        1,
+        b"BRL",
+        round_lot,
+        0,
+        5,
+        0,
+        increment,
+        ISSUED,
+        b"BR",
+        expires_at,
+        0,
+    )
+
+
+PAYLOAD = _record(b"DOLK25") + _record(b"DOLSPOT", 0, 0, 0.0, 0)
+
+
+def test_frame_decodes_columns_and_null_sentinels():
+    assert SecurityTable.DTYPE.itemsize == struct.calcsize(FORMAT)
+
+    df = decode_securities_frame(PAYLOAD)
+
+    assert list(df.columns) == list(SecurityTable.DTYPE.names)
+    assert df["ticker"].tolist() == ["DOLK25", "DOLSPOT"]
+    assert df["name"].iloc[0] == "DÓLAR COMERCIAL"
+    assert df["product"].tolist() == [1, pd.NA]
+    assert df["round_lot"].dtype == "UInt32"
+    assert df["tick_size_denominator"].isna().all()
+    assert df["min_price_increment"].iloc[0] == 0.5
+    assert np.isnan(df["min_price_increment"].iloc[1])
+    assert df["issued_at"].iloc[0] == pd.Timestamp(ISSUED, unit="s", tz="UTC")
+    assert df["expires_at"].iloc[0] == pd.Timestamp(EXPIRES, unit="s", tz="UTC")
+    assert df["expires_at"].isna().tolist() == [False, True]
+    assert df["expired_at"].isna().all()
+
+
+def test_models_match_the_record_by_record_decode():
+    securities = decode_securities(PAYLOAD)
+
+    first, spot = securities
+    assert first.ticker == "DOLK25" and first.isin == "BRBMEFDOLK25"
+    assert first.round_lot == 100 and first.tick_size_denominator is None
+    assert first.expires_at == datetime.fromtimestamp(EXPIRES)
+    assert spot.product is None and spot.min_price_increment is None
+    assert spot.expires_at is None and spot.price_type == 1
+
+    table = SecurityTable.from_securities(securities)
+    assert table.records.tobytes() == PAYLOAD
+    assert table[1].ticker == "DOLSPOT"
+    assert len(table[:1]) == 1
+
+
+def test_frame_and_models_give_the_same_instants():
+    df = decode_securities_frame(PAYLOAD)
+    securities = decode_securities(PAYLOAD)
+
+    for column in ("issued_at", "expires_at", "expired_at"):
+        dates = [getattr(security, column) for security in securities]
+        expected = pd.Series(
+            [date.astimezone(UTC) if date else None for date in dates],
+            dtype="datetime64[ns, UTC]",
+            name=column,
+        )
+        pd.testing.assert_series_equal(df[column], expected)
+
+
+def test_truncated_reply_is_rejected():
+    with pytest.raises(ValueError):
+        decode_securities_frame(PAYLOAD[:-1])
+    assert decode_securities(b"") == []
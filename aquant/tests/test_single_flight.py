@@ -0,0 +1,81 @@
+import asyncio
+from unittest.mock import MagicMock
+
+import pandas as pd
+import pytest
+
+from aquant.core.utils import SingleFlight
+from aquant.domains.broker.service import BrokerService
+
+
+class SlowNatsClient:
+    def __init__(self) -> None:
+        self.requests = 0
+
+    async def request(self, subject, message, timeout=2.0):
+        self.requests += 1
+        await asyncio.sleep(0.01)
+        return b"XP INVESTIMENTOS".ljust(64, b"\x00")
+
+
+def test_identical_requests_share_one_round_trip():
+    nats = SlowNatsClient()
+    service = BrokerService(MagicMock(), nats)
+
+    async def run():
+        return await asyncio.gather(
+            *(service.get_broker_name(3) for _ in range(5)),
+            service.get_broker_name(4),
+        )
+
+    names = asyncio.run(run())
+
+    assert names[0] == "XP INVESTIMENTOS"
+    assert nats.requests == 2
+    assert service.single_flight.coalesced == 4
+    assert len(service.single_flight) == 0
+
+
+def test_errors_reach_every_caller_and_are_not_cached():
+    flight = SingleFlight()
+    calls = 0
+
+    async def failing():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0)
+        raise TimeoutError("no reply")
+
+    async def run():
+        results = await asyncio.gather(
+            flight.do("k", failing), flight.do("k", failing), return_exceptions=True
+        )
+        with pytest.raises(TimeoutError):
+            await flight.do("k", failing)
+        return results
+
+    results = asyncio.run(run())
+
+    assert all(isinstance(r, TimeoutError) for r in results)
+    assert calls == 2
+
+
+def test_shared_results_are_copied_for_each_caller():
+    flight = SingleFlight()
+
+    async def frame():
+        await asyncio.sleep(0)
+        return pd.DataFrame({"price": [1.0, 2.0]})
+
+    async def run():
+        first, second = await asyncio.gather(
+            flight.do("k", frame), flight.do("k", frame)
+        )
+        first["price"] = 0.0
+        return first, second, await flight.do("k", frame)
+
+    first, second, alone = asyncio.run(run())
+
+    assert first is not second
+    assert second["price"].tolist() == [1.0, 2.0]
+    assert alone["price"].tolist() == [1.0, 2.0]
@@ -0,0 +1,83 @@
+import numpy as np
+import pandas as pd
+
+from aquant.domains.trade.stream import TradeBarAggregator
+from aquant.domains.trade.utils.buckets import time_bucket
+from aquant.domains.trade.utils.enums import TimescaleIntervalEnum
+
+
+def make_trades(rows: list[tuple[str, str, float, float]]) -> pd.DataFrame:
+    ticker, event_time, price, quantity = zip(*rows, strict=True)
+    return pd.DataFrame(
+        {
+            "ticker": ticker,
+            "event_time": pd.to_datetime(list(event_time)),
+            "price": price,
+            "quantity": quantity,
+        }
+    )
+
+
+def test_time_bucket_matches_timescale_origins():
+    ts = np.array(
+        ["2025-05-17T10:03:10", "2025-05-17T10:03:10"], dtype="datetime64[ns]"
+    )
+    ts = ts.astype(np.int64)
+
+    weekly = time_bucket(ts, TimescaleIntervalEnum.DAY_7).view("datetime64[ns]")
+    quarterly = time_bucket(ts, TimescaleIntervalEnum.MONTH_3).view("datetime64[ns]")
+
+    assert weekly[0] == np.datetime64("2025-05-12")
+    assert quarterly[0] == np.datetime64("2025-04-01")
+
+
+def test_bars_close_when_next_bucket_starts():
+    bars = TradeBarAggregator(TimescaleIntervalEnum.MINUTE_1)
+
+    completed = bars.update(
+        make_trades(
+            [
+                ("PETR4", "2025-05-05 10:00:05", 10.0, 100),
+                ("PETR4", "2025-05-05 10:00:30", 12.0, 100),
+            ]
+        )
+    )
+    assert completed.empty
+
+    completed = bars.update(
+        make_trades(
+            [
+                ("PETR4", "2025-05-05 10:00:50", 9.0, 200),
+                ("PETR4", "2025-05-05 10:01:10", 11.0, 50),
+            ]
+        )
+    )
+
+    assert len(completed) == 1
+    bar = completed.iloc[0]
+    assert bar["timestamp"] == pd.Timestamp("2025-05-05 10:00")
+    assert (bar["open"], bar["high"], bar["low"], bar["close"]) == (
+        10.0,
+        12.0,
+        9.0,
+        9.0,
+    )
+    assert bar["volume"] == 400
+    assert bar["vwap"] == (10.0 * 100 + 12.0 * 100 + 9.0 * 200) / 400
+    assert bar["trades"] == 3
+
+    partial = bars.partial_bars()
+    assert partial["timestamp"].tolist() == [pd.Timestamp("2025-05-05 10:01")]
+
+
+def test_advance_closes_idle_tickers_and_counts_late_trades():
+    bars = TradeBarAggregator(TimescaleIntervalEnum.MINUTE_5)
+    bars.update(make_trades([("VALE3", "2025-05-05 10:02:00", 60.0, 10)]))
+    bars.update(make_trades([("VALE3", "2025-05-05 09:59:00", 61.0, 10)]))
+
+    assert bars.late_trades == 1
+    assert bars.advance(pd.Timestamp("2025-05-05 10:04:59")).empty
+
+    closed = bars.advance(pd.Timestamp("2025-05-05 10:05:00"))
+    assert closed["ticker"].tolist() == ["VALE3"]
+    assert bars.partial_bars().empty
@@ -0,0 +1,131 @@
+import asyncio
+from datetime import UTC, datetime, timedelta
+from unittest.mock import MagicMock
+
+import numpy as np
+import pandas as pd
+
+from aquant.domains.trade.entity import OHLCVSeries
+from aquant.domains.trade.service import TradeOHLCVCacheService
+from aquant.domains.trade.utils.enums import TimescaleIntervalEnum
+
+MINUTE = TimescaleIntervalEnum.MINUTE_1
+
+
+class FakeTradeService:
+    """Replies with one 1-minute bar per bucket; closes encode the request number."""
+
+    def __init__(self):
+        self.requests = []
+
+    async def get_trades(
+        self, ticker, interval, start_time, end_time, ohlcv=False, as_series=False
+    ):
+        self.requests.append((ticker, start_time, end_time))
+        stamps = pd.date_range(
+            pd.Timestamp(start_time).floor("min"), end_time, freq="min"
+        )
+        records = np.zeros(len(stamps), dtype=OHLCVSeries.DTYPE)
+        records["ticker"] = ticker.encode()
+        records["timestamp"] = stamps.as_unit("ns").asi8
+        records["close"] = len(self.requests)
+        return OHLCVSeries(records)
+
+
+def _minutes(start, end):
+    return pd.date_range(start, end, freq="min").as_unit("ns").tolist()
+
+
+def test_overlapping_window_is_served_from_cache():
+    service = FakeTradeService()
+    cache = TradeOHLCVCacheService(MagicMock(), service)
+
+    async def calls():
+        first = await cache.get_ohlcv(
+            "PETR4", MINUTE, datetime(2025, 5, 5, 10), datetime(2025, 5, 5, 11)
+        )
+        second = await cache.get_ohlcv(
+            "PETR4",
+            MINUTE,
+            datetime(2025, 5, 5, 10, 10, 30),
+            datetime(2025, 5, 5, 10, 50),
+        )
+        return first, second
+
+    first, second = asyncio.run(calls())
+
+    assert len(service.requests) == 1
+    assert first["timestamp"].tolist() == _minutes(
+        "2025-05-05 10:00", "2025-05-05 11:00"
+    )
+    assert second["timestamp"].tolist() == _minutes(
+        "2025-05-05 10:10", "2025-05-05 10:50"
+    )
+    assert (second["close"] == 1).all()
+
+
+def test_open_bar_is_always_fetched_again():
+    service = FakeTradeService()
+    cache = TradeOHLCVCacheService(MagicMock(), service)
+    start = datetime.now(UTC) - timedelta(minutes=10)
+
+    async def calls():
+        first = await cache.get_ohlcv("PETR4", MINUTE, start)
+        second = await cache.get_ohlcv("PETR4", MINUTE, start)
+        return first, second
+
+    first, second = asyncio.run(calls())
+
+    assert len(service.requests) == 2
+    # Only the bar that was still open is requested again.
+    open_bar = first["timestamp"].iloc[-1]
+    assert pd.Timestamp(service.requests[1][1]) == open_bar
+    assert (second.loc[second["timestamp"] < open_bar, "close"] == 1).all()
+    assert (second.loc[second["timestamp"] >= open_bar, "close"] == 2).all()
+    assert second["timestamp"].tolist()[: len(first)] == first["timestamp"].tolist()
+
+
+def test_max_bars_evicts_the_oldest_bars():
+    service = FakeTradeService()
+    cache = TradeOHLCVCacheService(MagicMock(), service, max_bars=10)
+
+    async def calls():
+        await cache.get_ohlcv(
+            "PETR4", MINUTE, datetime(2025, 5, 5, 10), datetime(2025, 5, 5, 11)
+        )
+        recent = await cache.get_ohlcv(
+            "PETR4", MINUTE, datetime(2025, 5, 5, 10, 52), datetime(2025, 5, 5, 10, 55)
+        )
+        evicted = await cache.get_ohlcv(
+            "PETR4", MINUTE, datetime(2025, 5, 5, 10), datetime(2025, 5, 5, 10, 5)
+        )
+        return recent, evicted
+
+    recent, evicted = asyncio.run(calls())
+
+    assert len(service.requests) == 2
+    assert recent["timestamp"].tolist() == _minutes(
+        "2025-05-05 10:52", "2025-05-05 10:55"
+    )
+    assert evicted["timestamp"].tolist() == _minutes(
+        "2025-05-05 10:00", "2025-05-05 10:05"
+    )
+    assert all(len(entry.closed) <= 10 for entry in cache._entries.values())
+
+
+def test_invalidate_forces_a_new_request():
+    service = FakeTradeService()
+    cache = TradeOHLCVCacheService(MagicMock(), service)
+    window = (datetime(2025, 5, 5, 10), datetime(2025, 5, 5, 11))
+
+    async def calls():
+        await cache.get_ohlcv("PETR4", MINUTE, *window)
+        cache.invalidate("VALE3")
+        await cache.get_ohlcv("PETR4", MINUTE, window[0], datetime(2025, 5, 5, 10, 30))
+        cache.invalidate("PETR4")
+        return await cache.get_ohlcv("PETR4", MINUTE, *window)
+
+    bars = asyncio.run(calls())
+
+    assert [request[1] for request in service.requests] == [window[0], window[0]]
+    assert (bars["close"] == 2).all()
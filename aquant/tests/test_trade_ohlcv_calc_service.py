@@ -0,0 +1,108 @@
+from unittest.mock import MagicMock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from aquant.domains.trade.entity import OpenHighLowCloseVolume
+from aquant.domains.trade.service import TradeOHLCVCalcService
+
+
+def make_trades(size: int = 2_000) -> pd.DataFrame:
+    rng = np.random.default_rng(11)
+    start = np.datetime64("2025-05-05T10:00", "ns").astype(np.int64)
+    # Unique timestamps in random order, so open/close depend on sorting by time.
+    event_time = rng.permutation(size) * 10**9 + start
+    return pd.DataFrame(
+        {
+            "ticker": rng.choice(["PETR4", "VALE3", "ITUB4"], size),
+            "event_time": event_time.view("datetime64[ns]"),
+            "price": rng.random(size) * 10 + 20,
+            "quantity": rng.integers(1, 500, size).astype(float),
+            "side": rng.choice(["B", "S", "U"], size),
+        }
+    )
+
+
+def test_by_ticker_matches_pandas_groupby():
+    trades = make_trades()
+    service = TradeOHLCVCalcService(MagicMock())
+
+    result = service.calculate_ohlcv_by_ticker(trades)
+
+    ordered = trades.sort_values("event_time").assign(
+        notional=lambda df: df["price"] * df["quantity"],
+        buy=lambda df: df["quantity"].where(df["side"] == "B", 0.0),
+        sell=lambda df: df["quantity"].where(df["side"] == "S", 0.0),
+    )
+    expected = (
+        ordered.groupby("ticker")
+        .agg(
+            open=("price", "first"),
+            high=("price", "max"),
+            low=("price", "min"),
+            close=("price", "last"),
+            volume=("quantity", "sum"),
+            notional=("notional", "sum"),
+            trades=("price", "size"),
+            buy_volume=("buy", "sum"),
+            sell_volume=("sell", "sum"),
+        )
+        .reset_index()
+    )
+    expected["vwap"] = expected["notional"] / expected["volume"]
+
+    assert result["ticker"].tolist() == expected["ticker"].tolist()
+    for column in (
+        "open",
+        "high",
+        "low",
+        "close",
+        "volume",
+        "vwap",
+        "trades",
+        "buy_volume",
+        "sell_volume",
+    ):
+        np.testing.assert_allclose(result[column], expected[column])
+
+
+def test_calculate_ohlcv_builds_the_dataclass():
+    trades = make_trades(10).sort_values("event_time").reset_index(drop=True)
+    trades["ticker"] = "PETR4"
+    service = TradeOHLCVCalcService(MagicMock())
+
+    ohlcv = service.calculate_ohlcv(trades)
+
+    assert isinstance(ohlcv, OpenHighLowCloseVolume)
+    assert ohlcv.ticker == "PETR4"
+    assert ohlcv.timestamp == trades["event_time"].iloc[0]
+    assert ohlcv.open_price == trades["price"].iloc[0]
+    assert ohlcv.close_price == trades["price"].iloc[-1]
+    assert ohlcv.high_price == trades["price"].max()
+    assert ohlcv.low_price == trades["price"].min()
+    assert ohlcv.volume == trades["quantity"].sum()
+
+
+def test_missing_columns_raise_value_error():
+    trades = make_trades(10)
+    service = TradeOHLCVCalcService(MagicMock())
+
+    with pytest.raises(ValueError, match="side"):
+        service.calculate_ohlcv_by_ticker(trades.drop(columns="side"))
+    with pytest.raises(ValueError):
+        service.calculate_ohlcv(trades.drop(columns="ticker"))
+
+
+def test_helpers_raise_instead_of_returning_none():
+    service = TradeOHLCVCalcService(MagicMock())
+    empty = make_trades(0)
+
+    with pytest.raises(ValueError):
+        service.calculate_open(empty)
+    with pytest.raises(ValueError):
+        service.calculate_high(empty.drop(columns="price"))
+    with pytest.raises(ValueError):
+        service.calculate_volume(empty.drop(columns="quantity"))
+    with pytest.raises(ValueError):
+        service.calculate_ohlcv(make_trades(10).drop(columns="price"))
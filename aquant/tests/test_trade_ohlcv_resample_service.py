@@ -0,0 +1,82 @@
+from unittest.mock import MagicMock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from aquant.domains.trade.service import TradeOHLCVResampleService
+from aquant.domains.trade.utils.enums import TimescaleIntervalEnum
+from aquant.domains.trade.utils.reducers import group_time_order
+
+
+def make_trades(size: int = 5_000) -> pd.DataFrame:
+    rng = np.random.default_rng(7)
+    start = np.datetime64("2025-05-05T10:00", "ns").astype(np.int64)
+    event_time = np.sort(rng.integers(0, 6 * 3_600 * 10**9, size)) + start
+    return pd.DataFrame(
+        {
+            "ticker": rng.choice(["PETR4", "VALE3", "ITUB4"], size),
+            "event_time": event_time.view("datetime64[ns]"),
+            "price": rng.random(size) * 10 + 20,
+            "quantity": rng.integers(1, 500, size).astype(float),
+        }
+    )
+
+
+def test_resample_matches_pandas_groupby():
+    trades = make_trades()
+    service = TradeOHLCVResampleService(MagicMock())
+
+    bars = service.resample(trades, [TimescaleIntervalEnum.MINUTE_15])[
+        TimescaleIntervalEnum.MINUTE_15
+    ]
+
+    expected = (
+        trades.assign(timestamp=trades["event_time"].dt.floor("15min"))
+        .groupby(["ticker", "timestamp"])
+        .agg(
+            open=("price", "first"),
+            high=("price", "max"),
+            low=("price", "min"),
+            close=("price", "last"),
+            volume=("quantity", "sum"),
+            trades=("price", "size"),
+        )
+        .reset_index()
+    )
+    assert bars["ticker"].tolist() == expected["ticker"].tolist()
+    assert (bars["timestamp"].to_numpy() == expected["timestamp"].to_numpy()).all()
+    for column in ("open", "high", "low", "close", "volume", "trades"):
+        np.testing.assert_allclose(bars[column], expected[column])
+
+
+def test_derived_intervals_match_direct_computation():
+    trades = make_trades()
+    service = TradeOHLCVResampleService(MagicMock())
+    coarse = [TimescaleIntervalEnum.HOUR_1, TimescaleIntervalEnum.DAY_1]
+
+    derived = service.resample(trades, [TimescaleIntervalEnum.MINUTE_5, *coarse])
+    direct = {
+        interval: service.resample(trades, [interval])[interval] for interval in coarse
+    }
+
+    for interval in coarse:
+        pd.testing.assert_frame_equal(derived[interval], direct[interval])
+
+
+def test_trades_without_a_ticker_are_ignored():
+    trades = make_trades(1_000)
+    service = TradeOHLCVResampleService(MagicMock())
+    with_gaps = trades.astype({"ticker": object})
+    with_gaps.loc[::7, "ticker"] = None
+
+    bars = service.resample(with_gaps, [TimescaleIntervalEnum.HOUR_1])
+    expected = service.resample(
+        trades[with_gaps["ticker"].notna()], [TimescaleIntervalEnum.HOUR_1]
+    )
+
+    pd.testing.assert_frame_equal(
+        bars[TimescaleIntervalEnum.HOUR_1], expected[TimescaleIntervalEnum.HOUR_1]
+    )
+    with pytest.raises(ValueError):
+        group_time_order(np.array([0, -1, 1]), np.arange(3))
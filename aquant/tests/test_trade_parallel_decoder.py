@@ -0,0 +1,65 @@
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from aquant.core.logger import Logger
+from aquant.domains.trade.codecs import TradeBinaryCodec, TradeParallelDecoder
+
+
+def trade_payload(count: int) -> bytes:
+    rng = np.random.default_rng(7)
+    records = np.zeros(count, dtype=TradeBinaryCodec.DTYPE)
+    records["ticker"] = rng.choice([b"PETR4", b"VALE3", b"WINZ25"], count)
+    records["asset"] = b"EQUITY"
+    records["fk_order_id"] = [f"ORD{i}".encode() for i in range(count)]
+    records["event_time"] = 1_700_000_000_000_000_000 + np.arange(count) * 1_000
+    records["price_ascii"] = np.char.encode(
+        np.round(10 + rng.random(count) * 30, 2).astype(str), "ascii"
+    )
+    records["price_ascii"][::97] = b"n/a"
+    records["quantity"] = rng.integers(1, 1000, count)
+    records["side"] = rng.choice([b"B", b"S"], count)
+    records["tick_direction"] = rng.choice([b"+", b"-", b"0"], count)
+    records["seller_id"] = rng.integers(1, 200, count)
+    records["buyer_id"] = rng.integers(1, 200, count)
+    return records.tobytes()
+
+
+@pytest.fixture
+def codec():
+    return TradeBinaryCodec(Logger("test"))
+
+
+def test_parallel_decode_matches_the_serial_codec(codec):
+    payload = trade_payload(5_001)
+    decoder = TradeParallelDecoder(
+        Logger("test"), codec, max_workers=3, threshold_bytes=0, min_slice_bytes=1
+    )
+    try:
+        # The trailing partial record is truncated, as in the serial codec.
+        parallel = decoder.parse_trades_binary_to_dataframe(payload + b"\x00" * 7)
+    finally:
+        decoder.shutdown()
+
+    pd.testing.assert_frame_equal(
+        parallel, codec.parse_trades_binary_to_dataframe(payload)
+    )
+    assert parallel["price"].isna().sum() == len(range(0, 5_001, 97))
+
+
+def test_small_replies_and_pickled_decoders_decode_serially(codec):
+    decoder = TradeParallelDecoder(Logger("test"), codec, max_workers=4)
+    payload = trade_payload(10)
+
+    assert not decoder.accepts(len(payload))
+    pd.testing.assert_frame_equal(
+        decoder.parse_trades_binary_to_dataframe(payload),
+        codec.parse_trades_binary_to_dataframe(payload),
+    )
+    assert decoder._executor is None
+
+    copy = pickle.loads(pickle.dumps(decoder))
+    assert copy.max_workers == 1
+    assert not copy.accepts(1 << 40)
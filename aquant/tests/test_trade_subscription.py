@@ -0,0 +1,132 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import numpy as np
+
+from aquant.domains.trade.codecs import TradeBinaryCodec
+from aquant.domains.trade.stream import TradeSubscription
+from aquant.domains.trade.utils.enums import OverflowPolicyEnum
+
+
+def build_trades(count: int, ticker: str = "PETR4") -> bytes:
+    records = np.zeros(count, dtype=TradeBinaryCodec.DTYPE)
+    records["ticker"] = ticker.encode()
+    records["asset"] = ticker[:4].encode()
+    records["event_time"] = 1_700_000_000_000_000_000 + np.arange(count)
+    records["price_ascii"] = [f"{10 + i / 100:.2f}".encode() for i in range(count)]
+    records["quantity"] = 100.0
+    records["side"] = b"B"
+    records["tick_direction"] = b"+"
+    return records.tobytes()
+
+
+class FakeNatsClient:
+    def __init__(self) -> None:
+        self.callbacks = {}
+
+    async def subscribe(self, subject, callback):
+        self.callbacks[subject] = callback
+        subscription = MagicMock()
+        subscription.unsubscribe = AsyncMock()
+        return subscription
+
+    async def publish(self, subject, data):
+        await self.callbacks[subject](subject, data, None)
+
+
+def make_subscription(nats_client, **kwargs) -> TradeSubscription:
+    logger = MagicMock()
+    return TradeSubscription(
+        logger=logger,
+        nats_client=nats_client,
+        trade_codec=TradeBinaryCodec(logger),
+        subjects=["marketdata.trade.stream.PETR4"],
+        **kwargs,
+    )
+
+
+def test_flushes_on_batch_size():
+    async def scenario():
+        nats_client = FakeNatsClient()
+        async with make_subscription(
+            nats_client, max_batch_size=5, max_latency_ms=10_000
+        ) as trades:
+            for _ in range(5):
+                await nats_client.publish(
+                    "marketdata.trade.stream.PETR4", build_trades(1)
+                )
+            batch = await asyncio.wait_for(anext(trades), timeout=1)
+        return batch
+
+    batch = asyncio.run(scenario())
+    assert len(batch) == 5
+    assert batch["ticker"].tolist() == ["PETR4"] * 5
+
+
+def test_flushes_on_latency():
+    async def scenario():
+        nats_client = FakeNatsClient()
+        async with make_subscription(
+            nats_client, max_batch_size=1000, max_latency_ms=10
+        ) as trades:
+            await nats_client.publish("marketdata.trade.stream.PETR4", build_trades(3))
+            return await asyncio.wait_for(anext(trades), timeout=1)
+
+    batch = asyncio.run(scenario())
+    assert len(batch) == 3
+    assert batch["price"].tolist() == [10.0, 10.01, 10.02]
+
+
+def test_drop_oldest_keeps_latest_batches():
+    async def scenario():
+        nats_client = FakeNatsClient()
+        subscription = make_subscription(
+            nats_client,
+            max_batch_size=1,
+            max_latency_ms=10_000,
+            max_queue_size=2,
+            overflow_policy=OverflowPolicyEnum.DROP_OLDEST,
+        )
+        await subscription.start()
+        for ticker in ("AAAA3", "BBBB3", "CCCC3"):
+            await nats_client.publish(
+                "marketdata.trade.stream.PETR4", build_trades(1, ticker)
+            )
+        received = [await anext(subscription), await anext(subscription)]
+        await subscription.aclose()
+        remaining = [batch async for batch in subscription]
+        return subscription, received, remaining
+
+    subscription, received, remaining = asyncio.run(scenario())
+    assert [batch["ticker"].iloc[0] for batch in received] == ["BBBB3", "CCCC3"]
+    assert remaining == []
+    assert subscription.dropped_batches == 1
+
+
+def test_discards_misaligned_messages():
+    async def scenario():
+        nats_client = FakeNatsClient()
+        subscription = make_subscription(nats_client, max_batch_size=1)
+        await subscription.start()
+        await nats_client.publish("marketdata.trade.stream.PETR4", b"\x00" * 7)
+        await subscription.aclose()
+        return subscription
+
+    subscription = asyncio.run(scenario())
+    assert subscription.discarded_messages == 1
+    assert subscription.delivered_batches == 0
+
+
+def test_close_delivers_buffered_trades():
+    async def scenario():
+        nats_client = FakeNatsClient()
+        subscription = make_subscription(
+            nats_client, max_batch_size=1000, max_latency_ms=10_000
+        )
+        await subscription.start()
+        await nats_client.publish("marketdata.trade.stream.PETR4", build_trades(3))
+        await subscription.aclose()
+        return [batch async for batch in subscription]
+
+    batches = asyncio.run(scenario())
+    assert [len(batch) for batch in batches] == [3]
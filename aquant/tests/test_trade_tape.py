@@ -0,0 +1,62 @@
+from datetime import datetime, timedelta
+
+import pandas as pd
+import pytest
+
+from aquant.domains.trade.analytics import TradeTape
+from aquant.domains.trade.utils.enums import TimescaleIntervalEnum
+
+
+def make_tape() -> TradeTape:
+    rows = [
+        ("PETR4", "2025-05-05 10:00:00", 10.0, 100, "B"),
+        ("PETR4", "2025-05-05 10:00:30", 12.0, 100, "S"),
+        ("PETR4", "2025-05-05 10:01:00", 12.0, 200, "B"),
+        ("PETR4", "2025-05-05 10:02:00", 11.0, 100, "S"),
+        ("VALE3", "2025-05-05 10:00:10", 50.0, 10, "S"),
+    ]
+    ticker, event_time, price, quantity, side = zip(*rows, strict=True)
+    return TradeTape(
+        pd.DataFrame(
+            {
+                "ticker": ticker,
+                "event_time": pd.to_datetime(list(event_time)),
+                "price": price,
+                "quantity": quantity,
+                "side": side,
+            }
+        )
+    )
+
+
+def test_window_statistics():
+    stats = make_tape().window(
+        "PETR4", datetime(2025, 5, 5, 10, 0), datetime(2025, 5, 5, 10, 2)
+    )
+
+    assert stats["trades"] == 4
+    assert stats["vwap"] == pytest.approx((1000 + 1200 + 2400 + 1100) / 500)
+    # 10.0 for 30s, then 12.0 for 90s.
+    assert stats["twap"] == pytest.approx((10.0 * 30 + 12.0 * 90) / 120)
+    assert stats["signed_volume"] == 100
+    assert stats["imbalance"] == pytest.approx(100 / 500)
+    # Ticks: first, up, zero (carries up), down.
+    assert (stats["upticks"], stats["downticks"]) == (2, 1)
+    assert stats["tick_signed_volume"] == 200
+
+
+def test_bucketed_and_rolling():
+    tape = make_tape()
+
+    bars = tape.bucketed(TimescaleIntervalEnum.MINUTE_1)
+    rolling = tape.rolling(timedelta(seconds=45))
+
+    petr = bars[bars["ticker"] == "PETR4"]
+    assert petr["trades"].tolist() == [2, 1, 1]
+    assert petr["vwap"].tolist() == pytest.approx([11.0, 12.0, 11.0])
+    assert rolling.loc[rolling["ticker"] == "PETR4", "volume"].tolist() == [
+        100,
+        200,
+        300,
+        100,
+    ]
@@ -0,0 +1,200 @@
+"""
+Codec micro-benchmarks on synthetic payloads.
+
+Decodes (or encodes) generated payloads with every wire codec at several
+sizes and reports records/s, bytes/s and peak traced memory of one call.
+Results can be written as JSON and compared against a committed baseline:
+a case whose throughput drops by more than the tolerance is flagged and the
+script exits with status 1.
+
+Usage:
+    python benchmarks/codec_throughput.py
+    python benchmarks/codec_throughput.py --sizes 1000 100000 --case trade
+    python benchmarks/codec_throughput.py --json results.json
+    python benchmarks/codec_throughput.py --compare benchmarks/baselines/codec_throughput.json
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import time
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+
+import numpy as np
+import orjson
+import pandas as pd
+import payloads
+
+from aquant.core.logger import Logger
+from aquant.domains.broker.utils import parse_brokers_binary_to_string
+from aquant.domains.marketdata.repository import MarketdataRepository
+from aquant.domains.security.utils import decode_securities, decode_securities_frame
+from aquant.domains.trade.codecs import (
+    OpenHighLowCloseVolumeBinaryCodec,
+    TradeBinaryCodec,
+    TradeBinaryRequestCodec,
+)
+from aquant.infra.redis import BufferedMessageProcessor
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000]
+
+logger = Logger("benchmark")
+
+
+class _NoRedis:
+    def get_client(self):
+        return None
+
+
+def _cases() -> dict[str, Callable[[int], tuple[Callable[[], object], int]]]:
+    trade = TradeBinaryCodec(logger)
+    ohlcv = OpenHighLowCloseVolumeBinaryCodec(logger)
+    request = TradeBinaryRequestCodec(logger)
+    repository = MarketdataRepository(logger, _NoRedis(), BufferedMessageProcessor())
+
+    def trade_dataframe(n):
+        data = payloads.trade_payload(n)
+        return lambda: trade.parse_trades_binary_to_dataframe(data), len(data)
+
+    def ohlcv_dataframe(n):
+        data = payloads.ohlcv_payload(n)
+        return lambda: ohlcv.parse_ohlcv_binary_into_dataframe(data), len(data)
+
+    def ohlcv_series(n):
+        data = payloads.ohlcv_payload(n)
+        return lambda: ohlcv.decode_series(data).to_dataframe(), len(data)
+
+    def trade_request_encode(n):
+        dtos = payloads.trade_requests(n)
+        return lambda: [request.encode(dto) for dto in dtos], n * request.SIZE
+
+    def trade_request_decode(n):
+        blobs = [request.encode(dto) for dto in payloads.trade_requests(n)]
+        return lambda: [request.decode(blob) for blob in blobs], n * request.SIZE
+
+    def securities(n):
+        data = payloads.security_payload(n)
+        return lambda: decode_securities(data), len(data)
+
+    def securities_frame(n):
+        data = payloads.security_payload(n)
+        return lambda: decode_securities_frame(data), len(data)
+
+    def broker_names(n):
+        blobs = payloads.broker_payloads(n)
+        return (
+            lambda: [parse_brokers_binary_to_string(blob) for blob in blobs],
+            n * payloads.BROKER_NAME_SIZE,
+        )
+
+    def book_entries(n):
+        data = payloads.book_payload(n)
+        return (
+            lambda: repository._process_key_entries(
+                "aquant.security,PETR4.book.buy", orjson.loads(data), -1
+            ),
+            len(data),
+        )
+
+    return {
+        "trade.dataframe": trade_dataframe,
+        "ohlcv.dataframe": ohlcv_dataframe,
+        "ohlcv.series": ohlcv_series,
+        "trade_request.encode": trade_request_encode,
+        "trade_request.decode": trade_request_decode,
+        "security.decode": securities,
+        "security.frame": securities_frame,
+        "broker.name": broker_names,
+        "book.json": book_entries,
+    }
+
+
+def run_case(setup: Callable, size: int, repeat: int) -> dict:
+    call, nbytes = setup(size)
+    call()  # warm-up
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        call()
+        timings.append(time.perf_counter() - started)
+
+    tracemalloc.start()
+    call()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    seconds = statistics.median(timings)
+    return {
+        "records": size,
+        "bytes": nbytes,
+        "median_s": seconds,
+        "records_per_s": size / seconds,
+        "bytes_per_s": nbytes / seconds,
+        "peak_memory_bytes": peak,
+    }
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    """Returns the cases whose records/s dropped by more than `tolerance`."""
+    regressions = []
+    for key, result in results["cases"].items():
+        reference = baseline["cases"].get(key)
+        if reference is None:
+            continue
+        ratio = result["records_per_s"] / reference["records_per_s"]
+        flag = "  REGRESSION" if ratio < 1 - tolerance else ""
+        print(f"{key:32s} {ratio:6.2f}x baseline{flag}")
+        if flag:
+            regressions.append(key)
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--case", action="append", dest="cases", help="Only run cases with this prefix."
+    )
+    parser.add_argument(
+        "--json", type=Path, help="Also write the results to this file."
+    )
+    parser.add_argument("--compare", type=Path, help="Baseline JSON to compare with.")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    args = parser.parse_args()
+
+    results = {
+        "environment": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "pandas": pd.__version__,
+            "machine": platform.machine(),
+            "system": platform.system(),
+        },
+        "cases": {},
+    }
+    for name, setup in _cases().items():
+        if args.cases and not any(name.startswith(case) for case in args.cases):
+            continue
+        for size in args.sizes:
+            result = run_case(setup, size, args.repeat)
+            results["cases"][f"{name}[{size}]"] = result
+            print(
+                f"{name:22s} {size:>8d}  {result['records_per_s']:>13,.0f} rec/s  "
+                f"{result['bytes_per_s'] / 2**20:>9.1f} MiB/s  "
+                f"peak {result['peak_memory_bytes'] / 2**20:>8.1f} MiB"
+            )
+
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2))
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())
+        if compare(results, baseline, args.tolerance):
+            raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Cold-start import benchmark for the aquant package.
+
+Runs each statement in a fresh interpreter with `python -X importtime`, repeats
+it a few times and reports the median import time of the modules it pulled in
+(modules already imported by a bare interpreter, e.g. via `site`, are excluded)
+plus the slowest of them.
+
+Usage:
+    python benchmarks/import_time.py
+    python benchmarks/import_time.py --statement "from aquant import Aquant; Aquant" --top 15
+    python benchmarks/import_time.py --json import_time.json
+"""
+
+import argparse
+import json
+import re
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+DEFAULT_STATEMENTS = [
+    "import aquant",
+    "from aquant import Aquant",
+    "from aquant import Aquant; Aquant('', [], '', '')",
+]
+
+_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)$")
+
+
+def measure(statement: str) -> dict[str, tuple[int, int]]:
+    """Returns {module: (self_us, cumulative_us)} for one fresh interpreter run."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    modules = {}
+    for line in result.stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            modules[match.group(4)] = (int(match.group(1)), int(match.group(2)))
+    return modules
+
+
+def benchmark(statement: str, repeat: int, top: int, baseline: set[str]) -> dict:
+    runs = [measure(statement) for _ in range(repeat)]
+    modules = set().union(*runs) - baseline
+    median_cumulative = {
+        module: statistics.median(run.get(module, (0, 0))[1] for run in runs)
+        for module in modules
+    }
+    total = sum(
+        statistics.median(run.get(m, (0, 0))[0] for run in runs) for m in modules
+    )
+    slowest = sorted(median_cumulative.items(), key=lambda item: -item[1])[:top]
+    return {
+        "statement": statement,
+        "repeat": repeat,
+        "total_ms": total / 1000,
+        "modules": len(modules),
+        "slowest": [{"module": m, "cumulative_ms": us / 1000} for m, us in slowest],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--statement", action="append", dest="statements")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument(
+        "--json", type=Path, help="Also write the results to this file."
+    )
+    args = parser.parse_args()
+
+    baseline = set(measure("pass"))
+    results = [
+        benchmark(statement, args.repeat, args.top, baseline)
+        for statement in args.statements or DEFAULT_STATEMENTS
+    ]
+    for result in results:
+        print(
+            f"{result['statement']!r}: {result['total_ms']:.1f} ms "
+            f"({result['modules']} modules, median of {result['repeat']})"
+        )
+        for entry in result["slowest"]:
+            print(f"    {entry['cumulative_ms']:9.1f} ms  {entry['module']}")
+
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+"""
+End-to-end load test against in-process stand-ins of NATS and Redis.
+
+Starts fake responders for the NATS request subjects (generated binary
+replies with configurable size and latency) and a Redis stand-in seeded with
+synthetic books, then drives N concurrent Aquant clients, each issuing its
+requests back to back. Reports p50/p99/p999 latency and throughput per API.
+
+Every request uses distinct parameters, so identical-request coalescing does
+not hide load. The order book API is synchronous and runs in a worker thread.
+
+Usage:
+    python benchmarks/load_test.py
+    python benchmarks/load_test.py --clients 50 --requests 200 --latency-ms 2
+    python benchmarks/load_test.py --api get_trades --trades-per-reply 50000
+    python benchmarks/load_test.py --no-share-connections --json load.json
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta
+from itertools import count
+from pathlib import Path
+
+import numpy as np
+import stand_ins
+
+from aquant import Aquant
+from aquant.domains.trade.utils.enums import TimescaleIntervalEnum
+
+TICKERS = ["PETR4", "VALE3", "ITUB4", "BBDC4", "WINZ25", "DOLF26"]
+START = datetime(2025, 1, 2, 10)
+_sequence = count()
+
+
+def _ticker(i: int) -> str:
+    return TICKERS[i % len(TICKERS)]
+
+
+async def get_trades(aquant: Aquant, i: int):
+    start = START + timedelta(seconds=i)
+    return await aquant.get_trades(
+        ticker=_ticker(i), start_time=start, end_time=start + timedelta(hours=1)
+    )
+
+
+async def get_ohlcv(aquant: Aquant, i: int):
+    start = START + timedelta(seconds=i)
+    return await aquant.get_trades(
+        ticker=_ticker(i),
+        interval=TimescaleIntervalEnum.MINUTE_1,
+        start_time=start,
+        end_time=start + timedelta(hours=6),
+        ohlcv=True,
+    )
+
+
+async def get_securities(aquant: Aquant, i: int):
+    return await aquant.get_securities(ticker=f"{_ticker(i)}{i}")
+
+
+async def get_broker(aquant: Aquant, i: int):
+    return await aquant.get_broker(i)
+
+
+async def get_current_order_book(aquant: Aquant, i: int):
+    return await asyncio.to_thread(
+        aquant.get_current_order_book, [_ticker(i), _ticker(i + 1)]
+    )
+
+
+APIS = {
+    "get_trades": get_trades,
+    "get_trades.ohlcv": get_ohlcv,
+    "get_securities": get_securities,
+    "get_broker": get_broker,
+    "get_current_order_book": get_current_order_book,
+}
+
+
+async def run_client(aquant: Aquant, apis: list[str], requests: int, samples, errors):
+    for _ in range(requests):
+        for api in apis:
+            i = next(_sequence)
+            started = time.perf_counter()
+            try:
+                await APIS[api](aquant, i)
+            except Exception:
+                errors[api] += 1
+                continue
+            samples[api].append(time.perf_counter() - started)
+
+
+async def run(args: argparse.Namespace) -> dict:
+    server = stand_ins.FakeMarketdataServer(
+        trades_per_reply=args.trades_per_reply,
+        bars_per_reply=args.bars_per_reply,
+        securities_per_reply=args.securities_per_reply,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+    )
+    redis = stand_ins.seeded_redis(TICKERS, args.book_entries)
+
+    clients = []
+    for _ in range(args.clients):
+        aquant = Aquant(
+            redis_url="redis://stand-in:6379",
+            nats_servers=["nats://stand-in:4222"],
+            nats_user="load",
+            nats_password="test",
+            lazy_connect=True,
+            share_connections=args.share_connections,
+        )
+        stand_ins.attach(aquant, server, redis)
+        clients.append(await aquant.__aenter__())
+
+    samples: dict[str, list[float]] = defaultdict(list)
+    errors: dict[str, int] = defaultdict(int)
+    apis = args.apis or list(APIS)
+    started = time.perf_counter()
+    try:
+        await asyncio.gather(
+            *(
+                run_client(aquant, apis, args.requests, samples, errors)
+                for aquant in clients
+            )
+        )
+    finally:
+        elapsed = time.perf_counter() - started
+        await asyncio.gather(*(aquant.aclose() for aquant in clients))
+
+    report = {
+        "clients": args.clients,
+        "requests_per_client": args.requests,
+        "share_connections": args.share_connections,
+        "elapsed_s": elapsed,
+        "server_requests": server.requests,
+        "apis": {},
+    }
+    for api in apis:
+        latencies = np.asarray(samples[api]) * 1000
+        p50, p99, p999 = (
+            np.quantile(latencies, [0.5, 0.99, 0.999]) if len(latencies) else (0, 0, 0)
+        )
+        report["apis"][api] = {
+            "requests": len(latencies),
+            "errors": errors[api],
+            "throughput_per_s": len(latencies) / elapsed,
+            "p50_ms": float(p50),
+            "p99_ms": float(p99),
+            "p999_ms": float(p999),
+        }
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--clients", type=int, default=10)
+    parser.add_argument("--requests", type=int, default=50, help="Per client and API.")
+    parser.add_argument("--api", action="append", dest="apis", choices=list(APIS))
+    parser.add_argument("--latency-ms", type=float, default=1.0)
+    parser.add_argument("--jitter-ms", type=float, default=1.0)
+    parser.add_argument("--trades-per-reply", type=int, default=1_000)
+    parser.add_argument("--bars-per-reply", type=int, default=390)
+    parser.add_argument("--securities-per-reply", type=int, default=20)
+    parser.add_argument("--book-entries", type=int, default=50)
+    parser.add_argument(
+        "--share-connections", action=argparse.BooleanOptionalAction, default=True
+    )
+    parser.add_argument("--json", type=Path, help="Also write the report to this file.")
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args))
+    print(
+        f"{report['clients']} clients, {report['server_requests']} server requests "
+        f"in {report['elapsed_s']:.2f} s"
+    )
+    for api, stats in report["apis"].items():
+        print(
+            f"{api:24s} {stats['requests']:>7d} ok {stats['errors']:>5d} err  "
+            f"{stats['throughput_per_s']:>9.1f} req/s  p50 {stats['p50_ms']:7.2f} ms  "
+            f"p99 {stats['p99_ms']:7.2f} ms  p999 {stats['p999_ms']:7.2f} ms"
+        )
+
+    if args.json:
+        args.json.write_text(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
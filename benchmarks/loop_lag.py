@@ -0,0 +1,69 @@
+"""
+Event-loop lag while decoding a large trade reply.
+
+Decodes a synthetic binary trade payload inline on the event loop and through
+the DecodeExecutor (thread and process pools) while a LoopLagMonitor samples
+the loop, and prints the decode time and the observed loop lag of each mode.
+
+Usage:
+    python benchmarks/loop_lag.py
+    python benchmarks/loop_lag.py --trades 1000000
+"""
+
+import argparse
+import asyncio
+import time
+
+import payloads
+
+from aquant.core.executors import DecodeExecutor, ExecutorKindEnum
+from aquant.core.logger import Logger
+from aquant.core.utils import LoopLagMonitor
+from aquant.domains.trade.codecs import TradeBinaryCodec
+
+
+async def measure(decode, payload: bytes, executor: DecodeExecutor | None) -> dict:
+    async with LoopLagMonitor(interval=0.005) as lag:
+        await asyncio.sleep(0.05)
+        started = time.perf_counter()
+        if executor is None:
+            decode(payload)
+        else:
+            await executor.run(decode, payload)
+        elapsed = time.perf_counter() - started
+        await asyncio.sleep(0.05)
+    return {"decode_ms": elapsed * 1000, **lag.snapshot()}
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--trades", type=int, default=500_000)
+    args = parser.parse_args()
+
+    codec = TradeBinaryCodec(Logger("benchmark"))
+    payload = payloads.trade_payload(args.trades)
+    decode = codec.parse_trades_binary_to_dataframe
+    print(f"{args.trades} trades, {len(payload) / 2**20:.1f} MiB")
+
+    modes = {
+        "inline": None,
+        "thread": DecodeExecutor(ExecutorKindEnum.THREAD),
+        "process": DecodeExecutor(ExecutorKindEnum.PROCESS),
+    }
+    for name, executor in modes.items():
+        if executor is not None:
+            # Warm the pool up so worker start-up is not measured.
+            await executor.run(decode, payload[: codec.DTYPE.itemsize * 1000])
+            executor.threshold_bytes = 0
+        result = await measure(decode, payload, executor)
+        print(
+            f"{name:8s} decode {result['decode_ms']:8.1f} ms   "
+            f"loop lag p50 {result['p50_ms']:6.1f} ms  p99 {result['p99_ms']:7.1f} ms  "
+            f"max {result['max_ms']:7.1f} ms"
+        )
+        if executor is not None:
+            executor.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
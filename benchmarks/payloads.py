@@ -0,0 +1,140 @@
+"""
+Synthetic payload generators for the benchmarks.
+
+Each generator returns deterministic bytes in the live wire format of one
+codec, so benchmarks and load tests can run without the market-data servers.
+"""
+
+import struct
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+import orjson
+
+from aquant.domains.trade.codecs import (
+    OpenHighLowCloseVolumeBinaryCodec,
+    TradeBinaryCodec,
+)
+from aquant.domains.trade.dtos import TradeDTO, TradeParamsDTO
+from aquant.domains.trade.utils.enums import Actions, TimescaleIntervalEnum
+
+TICKERS = [b"PETR4", b"VALE3", b"ITUB4", b"BBDC4", b"WINZ25", b"DOLF26"]
+SECURITY_FORMAT = "!50s13s50s50sI I 50s50s50sI3s I I I I f I 50s I I"
+BROKER_NAME_SIZE = 64
+
+
+def trade_payload(count: int, seed: int = 0) -> bytes:
+    """`count` trade records in the `TradeBinaryCodec.DTYPE` layout."""
+    rng = np.random.default_rng(seed)
+    records = np.zeros(count, dtype=TradeBinaryCodec.DTYPE)
+    records["ticker"] = rng.choice(TICKERS, count)
+    records["asset"] = b"EQUITY"
+    records["fk_order_id"] = np.char.add(b"ORD", np.arange(count).astype("S12"))
+    records["event_time"] = time.time_ns() + np.arange(count, dtype=np.uint64) * 1_000
+    prices = np.round(10 + rng.random(count) * 30, 2)
+    records["price_ascii"] = np.char.encode(prices.astype(str), "ascii")
+    records["quantity"] = rng.integers(1, 1000, count)
+    records["side"] = rng.choice([b"B", b"S"], count)
+    records["tick_direction"] = rng.choice([b"+", b"-", b"0"], count)
+    records["seller_id"] = rng.integers(1, 200, count)
+    records["buyer_id"] = rng.integers(1, 200, count)
+    return records.tobytes()
+
+
+def ohlcv_payload(count: int, seed: int = 0) -> bytes:
+    """`count` OHLCV bars in the `OpenHighLowCloseVolumeBinaryCodec` layout."""
+    rng = np.random.default_rng(seed)
+    records = np.zeros(count, dtype=OpenHighLowCloseVolumeBinaryCodec.DTYPE)
+    records["ticker"] = rng.choice(TICKERS, count)
+    records["timestamp"] = (
+        time.time_ns() + np.arange(count, dtype=np.int64) * 60 * 10**9
+    )
+    opens = 10 + rng.random(count) * 30
+    closes = opens + rng.normal(0, 0.1, count)
+    records["open"] = opens
+    records["close"] = closes
+    records["high"] = np.maximum(opens, closes) + rng.random(count) * 0.1
+    records["low"] = np.minimum(opens, closes) - rng.random(count) * 0.1
+    records["volume"] = rng.integers(100, 100_000, count)
+    return records.tobytes()
+
+
+def trade_requests(count: int) -> list[TradeDTO]:
+    """`count` trade request DTOs, as encoded by `TradeBinaryRequestCodec`."""
+    start = datetime(2025, 1, 2, 10)
+    return [
+        TradeDTO(
+            action=Actions.GET_TRADES_BY_TICKER_AND_TIMERANGE,
+            params=TradeParamsDTO(
+                ticker=TICKERS[i % len(TICKERS)].decode(),
+                interval=TimescaleIntervalEnum.MINUTE_1,
+                asset=None,
+                start_time=start + timedelta(minutes=i),
+                end_time=start + timedelta(minutes=i + 60),
+            ),
+        )
+        for i in range(count)
+    ]
+
+
+def security_payload(count: int, seed: int = 0) -> bytes:
+    """`count` security records in the layout read by `decode_securities`."""
+    rng = np.random.default_rng(seed)
+    record = struct.Struct(SECURITY_FORMAT)
+    issued_at = int(datetime(2024, 1, 2).timestamp())
+    expiries = issued_at + rng.integers(1, 720, count) * 86_400
+    chunks = []
+    for i in range(count):
+        ticker = f"PETR{i:08d}".encode()
+        chunks.append(
+            record.pack(
+                b"PETR",
+                ticker,
+                f"BRPETR{i:06d}".encode(),
+                b"OCAFXS",
+                1 + i % 5,
+                1 + i % 3,
+                b"OPTION",
+                b"PETROBRAS PN " + ticker,
+                b"OPTIONS",
+                1,
+                b"BRL",
+                100,
+                100,
+                1,
+                1_000_000,
+                0.01,
+                issued_at,
+                b"BR",
+                int(expiries[i]),
+                0,
+            )
+        )
+    return b"".join(chunks)
+
+
+def broker_payloads(count: int) -> list[bytes]:
+    """`count` broker-name replies, one per broker id."""
+    return [
+        f"BROKER {i:05d} CORRETORA DE VALORES".encode().ljust(BROKER_NAME_SIZE, b"\x00")
+        for i in range(count)
+    ]
+
+
+def book_payload(count: int, seed: int = 0) -> bytes:
+    """A JSON list of `count` book entries, as stored in Redis for one key."""
+    rng = np.random.default_rng(seed)
+    return orjson.dumps(
+        [
+            {
+                "entry_date": "20250102",
+                "entry_time": int(100_000_000 + i % 60 * 100_000 + i % 1000),
+                "price": round(float(10 + rng.random() * 30), 2),
+                "quantity": int(rng.integers(100, 10_000)),
+                "broker_id": int(rng.integers(1, 200)),
+                "fk_order_id": f"ORD{i}",
+            }
+            for i in range(count)
+        ]
+    )
@@ -0,0 +1,170 @@
+"""
+In-process stand-ins for the market-data servers.
+
+`FakeMarketdataServer` answers the four `NatsSubjects` request subjects with
+generated binary replies after a configurable latency, and `FakeRedis` serves
+synthetic order books. `attach` wires them into an `Aquant` instance through
+the container's provider overrides, so the SDK code under test is unchanged.
+"""
+
+import asyncio
+import random
+from types import SimpleNamespace
+
+import payloads
+from dependency_injector import providers
+
+from aquant.core.logger import Logger
+from aquant.domains.trade.codecs import TradeBinaryRequestCodec
+from aquant.infra.nats import NatsClient, NatsSubjects
+
+logger = Logger("load_test")
+
+
+class FakeMarketdataServer:
+    """
+    Replies to the request subjects with pre-generated payloads.
+
+    Each reply waits `latency_ms` plus an exponentially distributed jitter
+    with mean `jitter_ms`, which gives the long right tail of a real server.
+    """
+
+    def __init__(
+        self,
+        trades_per_reply: int = 1_000,
+        bars_per_reply: int = 390,
+        securities_per_reply: int = 20,
+        book_entries: int = 50,
+        latency_ms: float = 1.0,
+        jitter_ms: float = 1.0,
+        seed: int = 0,
+    ) -> None:
+        self.latency = latency_ms / 1000
+        self.jitter = jitter_ms / 1000
+        self._random = random.Random(seed)
+        self._request_codec = TradeBinaryRequestCodec(logger)
+        self._trades = payloads.trade_payload(trades_per_reply, seed)
+        self._bars = payloads.ohlcv_payload(bars_per_reply, seed)
+        self._brokers = payloads.broker_payloads(256)
+        self.replies = {
+            NatsSubjects.MARKETDATA_TRADE_REQUEST.value: self._trade_reply,
+            NatsSubjects.MARKETDATA_SECURITY_REQUEST.value: lambda _: (
+                payloads.security_payload(securities_per_reply, seed)
+            ),
+            NatsSubjects.MARKETDATA_BROKER_REQUEST.value: lambda message: (
+                self._brokers[int.from_bytes(message[:4], "big") % len(self._brokers)]
+            ),
+            NatsSubjects.MARKETDATA_BOOK_REQUEST.value: lambda _: (
+                payloads.book_payload(book_entries, seed)
+            ),
+        }
+        self.requests = 0
+
+    def _trade_reply(self, message: bytes) -> bytes:
+        action = self._request_codec.decode(message).action
+        return self._bars if "VOLUME" in action.name else self._trades
+
+    async def respond(self, subject: str, message: bytes, timeout: float) -> bytes:
+        self.requests += 1
+        delay = self.latency + self._random.expovariate(1 / self.jitter)
+        if delay > timeout:
+            await asyncio.sleep(timeout)
+            raise TimeoutError
+        await asyncio.sleep(delay)
+        return self.replies[subject](message)
+
+    def connection(self) -> "FakeNatsConnection":
+        return FakeNatsConnection(self)
+
+
+class FakeNatsConnection:
+    """The subset of the nats-py client used by `NatsClient`."""
+
+    def __init__(self, server: FakeMarketdataServer) -> None:
+        self.server = server
+        self.is_connected = True
+        self.is_closed = False
+
+    async def request(self, subject, message, timeout):
+        return SimpleNamespace(
+            data=await self.server.respond(subject, message, timeout)
+        )
+
+    async def publish(self, subject, message):
+        pass
+
+    async def subscribe(self, subject, cb=None):
+        return SimpleNamespace(unsubscribe=self._noop)
+
+    async def close(self):
+        self.is_connected = False
+        self.is_closed = True
+
+    async def _noop(self):
+        pass
+
+
+class FakeRedis:
+    """Dictionary-backed stand-in for the synchronous redis client."""
+
+    def __init__(self, data: dict[str, bytes] | None = None) -> None:
+        self.data = data or {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value):
+        self.data[key] = value
+
+    def pipeline(self) -> "FakePipeline":
+        return FakePipeline(self)
+
+    def ping(self):
+        return True
+
+
+class FakePipeline:
+    def __init__(self, redis: FakeRedis) -> None:
+        self.redis = redis
+        self.keys: list[str] = []
+
+    def get(self, key):
+        self.keys.append(key)
+        return self
+
+    def execute(self):
+        keys, self.keys = self.keys, []
+        return [self.redis.get(key) for key in keys]
+
+
+class FakeRedisClient:
+    def __init__(self, redis: FakeRedis) -> None:
+        self.redis = redis
+
+    def get_client(self) -> FakeRedis:
+        return self.redis
+
+    def close(self):
+        pass
+
+
+def seeded_redis(tickers: list[str], entries: int = 50) -> FakeRedis:
+    """A FakeRedis holding a bid and an ask book for every ticker."""
+    redis = FakeRedis()
+    for i, ticker in enumerate(tickers):
+        for side in ("ask", "bid"):
+            redis.set(
+                f"aquant.security.{ticker}.book.{side}",
+                payloads.book_payload(entries, seed=i),
+            )
+    return redis
+
+
+def attach(aquant, server: FakeMarketdataServer, redis: FakeRedis) -> None:
+    """Points a not-yet-initialized Aquant at the stand-ins."""
+    nats_client = NatsClient(logger, ["nats://stand-in:4222"], lazy_connect=True)
+    nats_client.nc = server.connection()
+    aquant.container.nats_client.override(providers.Object(nats_client))
+    aquant.container.marketdata.redis_client.override(
+        providers.Object(FakeRedisClient(redis))
+    )
@@ -21,7 +21,7 @@ from aquant.settings import settings
 #         df = await aquant.get_broker(21)
 #         return df
 #     finally:
-#         aquant.shutdown()
+#         await aquant.aclose()
 
 
 # async def get_trades_example():
@@ -57,22 +57,11 @@ from aquant.settings import settings
 
 #         return df
 #     finally:
-#         aquant.shutdown()
+#         await aquant.aclose()
 
 
-async def get_current_order_book_example():
-    aquant = await Aquant.create(
-        redis_url=settings.REDIS_URL,
-        nats_servers=[settings.NATS_URL],
-        nats_user=settings.AQUANT_NATS_USER,
-        nats_password=settings.AQUANT_NATS_PASSWORD,
-    )
-
-    try:
-        df = aquant.get_current_order_book(["DOLK25_ASK"])
-        return df
-    finally:
-        aquant.shutdown()
+async def get_current_order_book_example(aquant: Aquant):
+    return aquant.get_current_order_book(["DOLK25_ASK"])
 
 
 # async def get_security_example():
@@ -101,7 +90,7 @@ async def get_current_order_book_example():
 #         )
 #         return df
 #     finally:
-#         aquant.shutdown()
+#         await aquant.aclose()
 
 
 async def benchmark_books():
@@ -112,17 +101,22 @@ async def benchmark_books():
     """
     execution_times = []
 
-    for _ in range(5):
-
-        start_time = time.perf_counter()
+    async with Aquant(
+        redis_url=settings.REDIS_URL,
+        nats_servers=[settings.NATS_URL],
+        nats_user=settings.AQUANT_NATS_USER,
+        nats_password=settings.AQUANT_NATS_PASSWORD,
+    ) as aquant:
+        for _ in range(5):
+            start_time = time.perf_counter()
 
-        data = await get_current_order_book_example()
+            data = await get_current_order_book_example(aquant)
 
-        print(data)
-        execution_time = (time.perf_counter() - start_time) * 1000
-        execution_times.append(execution_time)
+            print(data)
+            execution_time = (time.perf_counter() - start_time) * 1000
+            execution_times.append(execution_time)
 
-        await asyncio.sleep(0.1)
+            await asyncio.sleep(0.1)
 
     min_time = min(execution_times)
     median_time = median(execution_times)
@@ -186,7 +180,7 @@ async def benchmark_trades():
         print("____")
 
     finally:
-        aquant.shutdown()
+        await aquant.aclose()
 
 
 # async def benchmark_trades():